@@ -2,13 +2,57 @@
 Health check endpoints.
 """
 
-from fastapi import APIRouter
+import time
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
+
+import orjson
+from fastapi import APIRouter, Response
 from app.models.base import HealthCheck
 
 router = APIRouter()
 
+# Static dependency status reported by the detailed check
+_SERVICES_SNAPSHOT: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "database": MappingProxyType({
+        "status": "up",
+        "response_time": 0.001,
+        "last_check": "2023-11-05T10:00:00Z"
+    }),
+    "ai_services": MappingProxyType({
+        "status": "up",
+        "response_time": 0.050,
+        "last_check": "2023-11-05T10:00:00Z"
+    }),
+    "storage": MappingProxyType({
+        "status": "up",
+        "response_time": 0.010,
+        "last_check": "2023-11-05T10:00:00Z"
+    })
+})
+
+# Encoded health payloads keyed by variant, rebuilt at most once per second
+_health_cache: Dict[str, Tuple[int, bytes]] = {}
 
-@router.get("/health", response_model=HealthCheck)
+
+def _health_payload(detailed: bool = False) -> bytes:
+    """Return the encoded healthy status, reusing it within the same second."""
+    key = "detailed" if detailed else "basic"
+    now = int(time.time())
+    
+    cached = _health_cache.get(key)
+    if cached is None or cached[0] != now:
+        health = HealthCheck.healthy(version="1.0.0").model_dump()
+        if detailed:
+            health["services"] = {
+                name: dict(info) for name, info in _SERVICES_SNAPSHOT.items()
+            }
+        cached = (now, orjson.dumps(health))
+        _health_cache[key] = cached
+    return cached[1]
+
+
+@router.get("/health", responses={200: {"model": HealthCheck}})
 async def health_check():
     """
     Health check endpoint for load balancers and monitoring.
@@ -16,10 +60,10 @@ async def health_check():
     Returns:
         HealthCheck: Service health status
     """
-    return HealthCheck.healthy(version="1.0.0")
+    return Response(content=_health_payload(), media_type="application/json")
 
 
-@router.get("/health/detailed")
+@router.get("/health/detailed", responses={200: {"model": HealthCheck}})
 async def detailed_health_check():
     """
     Detailed health check with service dependencies.
@@ -32,24 +76,7 @@ async def detailed_health_check():
     # - Google Cloud services
     # - Database connectivity
     
-    services = {
-        "database": {
-            "status": "up",
-            "response_time": 0.001,
-            "last_check": "2023-11-05T10:00:00Z"
-        },
-        "ai_services": {
-            "status": "up", 
-            "response_time": 0.050,
-            "last_check": "2023-11-05T10:00:00Z"
-        },
-        "storage": {
-            "status": "up",
-            "response_time": 0.010,
-            "last_check": "2023-11-05T10:00:00Z"
-        }
-    }
-    
-    return HealthCheck.healthy(version="1.0.0").model_copy(
-        update={"services": services}
-    )
\ No newline at end of file
+    return Response(
+        content=_health_payload(detailed=True),
+        media_type="application/json"
+    )
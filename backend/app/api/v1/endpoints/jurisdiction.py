@@ -9,18 +9,23 @@ Provides endpoints for jurisdiction-aware legal analysis including:
 """
 
 import logging
-from typing import Dict, List, Optional, Any
-from uuid import UUID
-
-from fastapi import APIRouter, Depends, HTTPException, status
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, List, Optional, Any
+from uuid import UUID, uuid4
+
+import orjson
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from ....core.security import get_current_user
 from ....services.jurisdiction_analysis import JurisdictionAnalysisService
-from ....services.firestore import FirestoreService
+from ....services.firestore import FirestoreService, PROCESSED_DOCUMENT_ANALYSIS_FIELDS
 from ....models.document import Clause, ProcessedDocument
 from ....models.base import UserRole
 from ....core.exceptions import AnalysisError
+from ....core.responses import OrjsonResponse
 
 logger = logging.getLogger(__name__)
 
@@ -71,7 +76,7 @@ class ComplianceAnalysisResponse(BaseModel):
 class MultiJurisdictionRequest(BaseModel):
     """Request model for multi-jurisdiction analysis."""
     document_id: UUID = Field(..., description="Document ID to analyze")
-    jurisdictions: List[str] = Field(..., min_items=2, description="List of jurisdictions to compare")
+    jurisdictions: List[str] = Field(..., min_length=2, description="List of jurisdictions to compare")
     user_role: UserRole = Field(..., description="User's role for analysis")
 
 
@@ -102,9 +107,78 @@ class SaferAlternativesResponse(BaseModel):
     analysis_timestamp: str
 
 
-# Initialize services
-jurisdiction_service = JurisdictionAnalysisService()
-firestore_service = FirestoreService()
+def _build_supported_jurisdictions_body(jurisdiction_service: JurisdictionAnalysisService) -> bytes:
+    """Serialize the supported jurisdictions list from the agent mappings."""
+    jurisdiction_mappings = jurisdiction_service.jurisdiction_agent.jurisdiction_mappings
+    
+    supported_jurisdictions = []
+    for code, alternatives in jurisdiction_mappings.items():
+        supported_jurisdictions.append({
+            "code": code,
+            "full_name": alternatives[0] if alternatives else code,
+            "alternatives": alternatives[1:] if len(alternatives) > 1 else []
+        })
+    
+    return orjson.dumps({
+        "supported_jurisdictions": supported_jurisdictions,
+        "total_count": len(supported_jurisdictions)
+    })
+
+
+# Processed document fields read and updated by /enhance-document
+_ENHANCE_DOCUMENT_FIELDS = PROCESSED_DOCUMENT_ANALYSIS_FIELDS + ("risk_assessment", "metadata")
+
+# Prototype for the ad-hoc clauses analyzed by /safer-alternatives. Only the
+# text varies per request, so copies skip re-validating the default fields.
+# The analysis only reads the clause, so the empty containers can be shared.
+_TEMP_CLAUSE_PROTOTYPE = Clause(
+    document_id=uuid4(),
+    text="placeholder",
+    classification="caution",  # Default classification
+    risk_score=0.5,
+    impact_score=50,
+    likelihood_score=50,
+    role_analysis={},
+    safer_alternatives=[],
+    legal_citations=[],
+    keywords=[],
+    category=None
+)
+
+@asynccontextmanager
+async def jurisdiction_services(app: FastAPI):
+    """
+    Create the jurisdiction services for the lifetime of the application.
+    
+    The jurisdiction mappings are static, so the supported jurisdictions
+    response body is built once here as well.
+    """
+    jurisdiction_service = JurisdictionAnalysisService()
+    firestore_service = FirestoreService()
+    
+    app.state.jurisdiction_service = jurisdiction_service
+    app.state.firestore_service = firestore_service
+    app.state.supported_jurisdictions_body = _build_supported_jurisdictions_body(
+        jurisdiction_service
+    )
+    
+    try:
+        yield
+    finally:
+        firestore_service.client.close()
+
+
+def get_jurisdiction_service(request: Request) -> JurisdictionAnalysisService:
+    """Get the application's jurisdiction analysis service."""
+    return request.app.state.jurisdiction_service
+
+
+def get_firestore_service(request: Request) -> FirestoreService:
+    """Get the application's Firestore service."""
+    return request.app.state.firestore_service
+
+
+_SUPPORTED_JURISDICTIONS_HEADERS = {"Cache-Control": "public, max-age=86400"}
 
 
 @router.get("/context", response_model=JurisdictionContextResponse)
@@ -112,7 +186,8 @@ async def get_jurisdiction_context(
     jurisdiction: str,
     legal_area: Optional[str] = None,
     sample_text: Optional[str] = None,
-    current_user: Dict = Depends(get_current_user)
+    current_user: Dict = Depends(get_current_user),
+    jurisdiction_service: JurisdictionAnalysisService = Depends(get_jurisdiction_service)
 ):
     """
     Get jurisdiction-specific legal context.
@@ -124,7 +199,7 @@ async def get_jurisdiction_context(
         logger.info(f"Getting jurisdiction context for {jurisdiction}")
         
         # Get jurisdiction context
-        context = await jurisdiction_service.jurisdiction_agent.get_jurisdiction_context(
+        context = await jurisdiction_service.get_cached_context(
             jurisdiction, legal_area, sample_text
         )
         
@@ -157,7 +232,9 @@ async def get_jurisdiction_context(
 @router.post("/compliance", response_model=ComplianceAnalysisResponse)
 async def analyze_compliance(
     request: ComplianceAnalysisRequest,
-    current_user: Dict = Depends(get_current_user)
+    current_user: Dict = Depends(get_current_user),
+    jurisdiction_service: JurisdictionAnalysisService = Depends(get_jurisdiction_service),
+    firestore_service: FirestoreService = Depends(get_firestore_service)
 ):
     """
     Analyze document compliance with jurisdiction-specific laws.
@@ -169,7 +246,7 @@ async def analyze_compliance(
         logger.info(f"Analyzing compliance for document {request.document_id} in {request.jurisdiction}")
         
         # Get the processed document
-        processed_doc = await firestore_service.get_processed_document(
+        processed_doc = await firestore_service.get_processed_document_slim(
             request.document_id, current_user["uid"]
         )
         
@@ -212,10 +289,16 @@ async def analyze_compliance(
         )
 
 
-@router.post("/multi-jurisdiction", response_model=MultiJurisdictionResponse)
+@router.post(
+    "/multi-jurisdiction",
+    response_class=OrjsonResponse,
+    responses={200: {"model": MultiJurisdictionResponse}}
+)
 async def analyze_multi_jurisdiction(
     request: MultiJurisdictionRequest,
-    current_user: Dict = Depends(get_current_user)
+    current_user: Dict = Depends(get_current_user),
+    jurisdiction_service: JurisdictionAnalysisService = Depends(get_jurisdiction_service),
+    firestore_service: FirestoreService = Depends(get_firestore_service)
 ):
     """
     Analyze conflicts between multiple jurisdictions for a document.
@@ -227,7 +310,7 @@ async def analyze_multi_jurisdiction(
         logger.info(f"Analyzing multi-jurisdiction conflicts for document {request.document_id}")
         
         # Get the processed document
-        processed_doc = await firestore_service.get_processed_document(
+        processed_doc = await firestore_service.get_processed_document_slim(
             request.document_id, current_user["uid"]
         )
         
@@ -242,16 +325,18 @@ async def analyze_multi_jurisdiction(
             processed_doc, request.jurisdictions, request.user_role
         )
         
-        return MultiJurisdictionResponse(
-            primary_jurisdiction=conflict_result["primary_jurisdiction"],
-            secondary_jurisdictions=conflict_result["secondary_jurisdictions"],
-            legal_area=conflict_result.get("legal_area"),
-            general_conflicts=conflict_result["general_conflicts"],
-            clause_specific_conflicts=conflict_result["clause_specific_conflicts"],
-            recommendations=conflict_result["recommendations"],
-            risk_level=conflict_result["risk_level"],
-            analysis_timestamp=conflict_result["analysis_timestamp"]
-        )
+        # The service result is already validated; serialize it directly
+        # instead of rebuilding it as a response model
+        return OrjsonResponse({
+            "primary_jurisdiction": conflict_result["primary_jurisdiction"],
+            "secondary_jurisdictions": conflict_result["secondary_jurisdictions"],
+            "legal_area": conflict_result.get("legal_area"),
+            "general_conflicts": conflict_result["general_conflicts"],
+            "clause_specific_conflicts": conflict_result["clause_specific_conflicts"],
+            "recommendations": conflict_result["recommendations"],
+            "risk_level": conflict_result["risk_level"],
+            "analysis_timestamp": conflict_result["analysis_timestamp"]
+        })
         
     except HTTPException:
         raise
@@ -269,10 +354,61 @@ async def analyze_multi_jurisdiction(
         )
 
 
+@router.post("/multi-jurisdiction/stream")
+async def stream_multi_jurisdiction(
+    request: MultiJurisdictionRequest,
+    current_user: Dict = Depends(get_current_user),
+    jurisdiction_service: JurisdictionAnalysisService = Depends(get_jurisdiction_service),
+    firestore_service: FirestoreService = Depends(get_firestore_service)
+) -> StreamingResponse:
+    """
+    Stream multi-jurisdiction conflict analysis as newline-delimited JSON.
+    
+    Emits a header record with the general conflicts, one record per
+    conflicting clause as soon as it is analyzed, and a closing summary
+    record with recommendations and risk level. Failures after the stream
+    has started are reported as a final "error" record.
+    """
+    logger.info(f"Streaming multi-jurisdiction conflicts for document {request.document_id}")
+    
+    try:
+        processed_doc = await firestore_service.get_processed_document_slim(
+            request.document_id, current_user["uid"]
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error loading document for conflict stream: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error"
+        )
+    
+    if not processed_doc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Document not found"
+        )
+    
+    async def generate_records() -> AsyncIterator[bytes]:
+        try:
+            async for record in jurisdiction_service.aiter_multi_jurisdiction_conflicts(
+                processed_doc, request.jurisdictions, request.user_role
+            ):
+                yield orjson.dumps(record) + b"\n"
+        except AnalysisError as e:
+            logger.error(f"Multi-jurisdiction conflict stream failed: {str(e)}")
+            yield orjson.dumps({
+                "type": "error",
+                "detail": f"Multi-jurisdiction analysis failed: {str(e)}"
+            }) + b"\n"
+    
+    return StreamingResponse(generate_records(), media_type="application/x-ndjson")
+
+
 @router.post("/safer-alternatives", response_model=SaferAlternativesResponse)
 async def get_safer_alternatives(
     request: SaferAlternativesRequest,
-    current_user: Dict = Depends(get_current_user)
+    current_user: Dict = Depends(get_current_user),
+    jurisdiction_service: JurisdictionAnalysisService = Depends(get_jurisdiction_service)
 ):
     """
     Get jurisdiction-specific safer alternatives for a clause.
@@ -284,18 +420,13 @@ async def get_safer_alternatives(
         logger.info(f"Getting safer alternatives for clause in {request.jurisdiction}")
         
         # Create a temporary clause object for analysis
-        temp_clause = Clause(
-            text=request.clause_text,
-            classification="caution",  # Default classification
-            risk_score=0.5,
-            impact_score=50,
-            likelihood_score=50,
-            role_analysis={},
-            safer_alternatives=[],
-            legal_citations=[],
-            keywords=[],
-            category=None
-        )
+        clause_text = request.clause_text.strip()
+        if not clause_text:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Clause text cannot be empty"
+            )
+        temp_clause = _TEMP_CLAUSE_PROTOTYPE.model_copy(update={"text": clause_text})
         
         # Get safer alternatives
         safer_alternatives = await jurisdiction_service.get_jurisdiction_safe_alternatives(
@@ -317,9 +448,11 @@ async def get_safer_alternatives(
             original_clause=request.clause_text,
             jurisdiction=request.jurisdiction,
             safer_alternatives=alternatives_data,
-            analysis_timestamp=datetime.utcnow().isoformat()
+            analysis_timestamp=datetime.now(timezone.utc).isoformat()
         )
         
+    except HTTPException:
+        raise
     except AnalysisError as e:
         logger.error(f"Safer alternatives analysis failed: {str(e)}")
         raise HTTPException(
@@ -339,7 +472,9 @@ async def enhance_document_with_jurisdiction(
     document_id: UUID,
     jurisdiction: str,
     user_role: UserRole,
-    current_user: Dict = Depends(get_current_user)
+    current_user: Dict = Depends(get_current_user),
+    jurisdiction_service: JurisdictionAnalysisService = Depends(get_jurisdiction_service),
+    firestore_service: FirestoreService = Depends(get_firestore_service)
 ):
     """
     Enhance an existing processed document with jurisdiction-specific analysis.
@@ -351,8 +486,8 @@ async def enhance_document_with_jurisdiction(
         logger.info(f"Enhancing document {document_id} with jurisdiction analysis: {jurisdiction}")
         
         # Get the processed document
-        processed_doc = await firestore_service.get_processed_document(
-            document_id, current_user["uid"]
+        processed_doc = await firestore_service.get_processed_document_slim(
+            document_id, current_user["uid"], fields=_ENHANCE_DOCUMENT_FIELDS
         )
         
         if not processed_doc:
@@ -366,8 +501,15 @@ async def enhance_document_with_jurisdiction(
             processed_doc, jurisdiction, user_role
         )
         
-        # Save the enhanced document
-        await firestore_service.save_processed_document(enhanced_doc)
+        # Write back only the fields the enhancement changed
+        await firestore_service.update_document_fields(str(document_id), {
+            "clauses": [clause.model_dump(mode="json") for clause in enhanced_doc.clauses],
+            "risk_assessment": (
+                enhanced_doc.risk_assessment.model_dump(mode="json")
+                if enhanced_doc.risk_assessment else None
+            ),
+            "metadata": enhanced_doc.metadata
+        })
         
         return {
             "message": "Document enhanced with jurisdiction analysis",
@@ -395,6 +537,7 @@ async def enhance_document_with_jurisdiction(
 
 @router.get("/supported-jurisdictions")
 async def get_supported_jurisdictions(
+    request: Request,
     current_user: Dict = Depends(get_current_user)
 ):
     """
@@ -403,30 +546,8 @@ async def get_supported_jurisdictions(
     Returns a list of all jurisdictions supported by the system
     with their full names and codes.
     """
-    try:
-        # Get jurisdiction mappings from the agent
-        jurisdiction_mappings = jurisdiction_service.jurisdiction_agent.jurisdiction_mappings
-        
-        supported_jurisdictions = []
-        for code, alternatives in jurisdiction_mappings.items():
-            supported_jurisdictions.append({
-                "code": code,
-                "full_name": alternatives[0] if alternatives else code,
-                "alternatives": alternatives[1:] if len(alternatives) > 1 else []
-            })
-        
-        return {
-            "supported_jurisdictions": supported_jurisdictions,
-            "total_count": len(supported_jurisdictions)
-        }
-        
-    except Exception as e:
-        logger.error(f"Error getting supported jurisdictions: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve supported jurisdictions"
-        )
-
-
-# Add missing import
-from datetime import datetime
\ No newline at end of file
+    return Response(
+        content=request.app.state.supported_jurisdictions_body,
+        media_type="application/json",
+        headers=_SUPPORTED_JURISDICTIONS_HEADERS
+    )
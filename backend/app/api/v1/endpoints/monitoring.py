@@ -8,12 +8,18 @@ Provides endpoints for:
 - Monitoring dashboard data
 """
 
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
-from fastapi import APIRouter, HTTPException, Depends, Query
+import asyncio
+import hashlib
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
 from pydantic import BaseModel
 
 from ....core.auth import get_current_user
+from ....core.responses import OrjsonResponse
 from ....services.monitoring import monitoring_service
 from ....monitoring.performance import performance_monitor
 from ....monitoring.error_reporting import error_reporter
@@ -21,6 +27,64 @@ from ....monitoring.health_checks import health_checker
 
 router = APIRouter()
 
+# Seconds a serialized dashboard snapshot is reused
+DASHBOARD_CACHE_TTL = 10.0
+
+# Dashboard snapshots keyed by hours: (expires_at, body, etag)
+_dashboard_cache: Dict[int, Tuple[float, bytes, str]] = {}
+_dashboard_lock = asyncio.Lock()
+
+# Seconds a completed backend probe result is shared with later callers
+PROBE_RESULT_TTL = 1.0
+
+# In-flight probes and recent probe results, keyed by probe name
+_inflight_probes: Dict[str, asyncio.Future] = {}
+_probe_results: Dict[str, Tuple[float, Any]] = {}
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as an ISO 8601 string."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+async def _single_flight(key: str, probe: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run a backend probe once for all concurrent callers.
+    
+    Callers arriving while the probe is running await the same task, and
+    a successful result is reused for PROBE_RESULT_TTL seconds. Failures
+    are not cached.
+    """
+    cached = _probe_results.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    
+    task = _inflight_probes.get(key)
+    if task is None:
+        task = asyncio.ensure_future(probe())
+        _inflight_probes[key] = task
+        
+        def _on_done(done: asyncio.Future):
+            _inflight_probes.pop(key, None)
+            if not done.cancelled() and done.exception() is None:
+                _probe_results[key] = (time.monotonic() + PROBE_RESULT_TTL, done.result())
+        
+        task.add_done_callback(_on_done)
+    
+    # Shield the shared task so one caller disconnecting does not cancel it
+    # for everyone else
+    return await asyncio.shield(task)
+
+
+def _get_overall_health() -> Awaitable[Tuple[str, Dict[str, Any]]]:
+    """Get overall health, coalescing concurrent checks."""
+    return _single_flight("health", health_checker.get_overall_health)
+
+
+def _get_system_metrics() -> Awaitable[Any]:
+    """Get current system metrics, coalescing concurrent reads."""
+    return _single_flight("system_metrics", performance_monitor.get_system_metrics)
+
 
 class HealthCheckResponse(BaseModel):
     """Health check response model."""
@@ -58,7 +122,7 @@ class ErrorSummaryResponse(BaseModel):
 async def get_system_health():
     """Get comprehensive system health status."""
     try:
-        overall_status, health_details = await health_checker.get_overall_health()
+        overall_status, health_details = await _get_overall_health()
         
         return HealthCheckResponse(
             overall_status=health_details["overall_status"],
@@ -69,7 +133,7 @@ async def get_system_health():
         )
         
     except Exception as e:
-        await error_reporter.report_error(
+        error_reporter.enqueue(
             error=e,
             context={"endpoint": "/monitoring/health"}
         )
@@ -86,14 +150,18 @@ async def get_health_trends(
         return trends
         
     except Exception as e:
-        await error_reporter.report_error(
+        error_reporter.enqueue(
             error=e,
             context={"endpoint": "/monitoring/health/trends", "hours": hours}
         )
         raise HTTPException(status_code=500, detail="Failed to get health trends")
 
 
-@router.get("/performance", response_model=PerformanceSummaryResponse)
+@router.get(
+    "/performance",
+    response_class=OrjsonResponse,
+    responses={200: {"model": PerformanceSummaryResponse}}
+)
 async def get_performance_summary(
     hours: int = Query(24, ge=1, le=168, description="Hours of history to include")
 ):
@@ -101,20 +169,20 @@ async def get_performance_summary(
     try:
         summary = await performance_monitor.get_performance_summary(hours=hours)
         
-        return PerformanceSummaryResponse(
-            period_hours=summary["period_hours"],
-            total_requests=summary["total_requests"],
-            error_rate=summary["error_rate"],
-            avg_response_time=summary["avg_response_time"],
-            avg_cpu_usage=summary["avg_cpu_usage"],
-            avg_memory_usage=summary["avg_memory_usage"],
-            system_health=summary["system_health"],
-            top_endpoints=summary["top_endpoints"],
-            slowest_endpoints=summary["slowest_endpoints"]
-        )
+        return OrjsonResponse({
+            "period_hours": summary["period_hours"],
+            "total_requests": summary["total_requests"],
+            "error_rate": summary["error_rate"],
+            "avg_response_time": summary["avg_response_time"],
+            "avg_cpu_usage": summary["avg_cpu_usage"],
+            "avg_memory_usage": summary["avg_memory_usage"],
+            "system_health": summary["system_health"],
+            "top_endpoints": summary["top_endpoints"],
+            "slowest_endpoints": summary["slowest_endpoints"]
+        })
         
     except Exception as e:
-        await error_reporter.report_error(
+        error_reporter.enqueue(
             error=e,
             context={"endpoint": "/monitoring/performance", "hours": hours}
         )
@@ -139,7 +207,7 @@ async def get_error_summary(
         )
         
     except Exception as e:
-        await error_reporter.report_error(
+        error_reporter.enqueue(
             error=e,
             context={"endpoint": "/monitoring/errors", "hours": hours}
         )
@@ -150,7 +218,7 @@ async def get_error_summary(
 async def get_system_metrics():
     """Get current system metrics."""
     try:
-        metrics = await performance_monitor.get_system_metrics()
+        metrics = await _get_system_metrics()
         
         return {
             "timestamp": metrics.timestamp.isoformat(),
@@ -163,58 +231,134 @@ async def get_system_metrics():
         }
         
     except Exception as e:
-        await error_reporter.report_error(
+        error_reporter.enqueue(
             error=e,
             context={"endpoint": "/monitoring/metrics/system"}
         )
         raise HTTPException(status_code=500, detail="Failed to get system metrics")
 
 
-@router.get("/dashboard")
+async def _build_dashboard(hours: int) -> Dict[str, Any]:
+    """Aggregate every monitoring source into the dashboard payload."""
+    # Fetch all monitoring data concurrently; a failing source only
+    # blanks its own section of the dashboard
+    health_result, performance_summary, error_summary, system_metrics = await asyncio.gather(
+        _get_overall_health(),
+        performance_monitor.get_performance_summary(hours=hours),
+        error_reporter.get_error_summary(hours=hours),
+        _get_system_metrics(),
+        return_exceptions=True
+    )
+    
+    for section, result in (
+        ("health", health_result),
+        ("performance", performance_summary),
+        ("errors", error_summary),
+        ("system", system_metrics),
+    ):
+        if isinstance(result, Exception):
+            error_reporter.enqueue(
+                error=result,
+                context={
+                    "endpoint": "/monitoring/dashboard",
+                    "hours": hours,
+                    "section": section
+                }
+            )
+    
+    health_section = None
+    if not isinstance(health_result, Exception):
+        health_status, health_details = health_result
+        health_section = {
+            "overall_status": health_details["overall_status"],
+            "health_score": health_details["health_score"],
+            "components": health_details["components"],
+            "summary": health_details["summary"]
+        }
+    
+    performance_section = None
+    if not isinstance(performance_summary, Exception):
+        performance_section = {
+            "total_requests": performance_summary["total_requests"],
+            "error_rate": performance_summary["error_rate"],
+            "avg_response_time": performance_summary["avg_response_time"],
+            "system_health": performance_summary["system_health"],
+            "top_endpoints": performance_summary["top_endpoints"][:5],
+            "slowest_endpoints": performance_summary["slowest_endpoints"][:5]
+        }
+    
+    errors_section = None
+    if not isinstance(error_summary, Exception):
+        errors_section = {
+            "total_errors": error_summary["total_errors"],
+            "critical_errors": error_summary["critical_errors"],
+            "category_breakdown": error_summary["category_breakdown"],
+            "severity_breakdown": error_summary["severity_breakdown"]
+        }
+    
+    system_section = None
+    if not isinstance(system_metrics, Exception):
+        system_section = {
+            "cpu_usage": system_metrics.cpu_usage,
+            "memory_usage": system_metrics.memory_usage,
+            "disk_usage": system_metrics.disk_usage,
+            "active_connections": system_metrics.active_connections
+        }
+    
+    return {
+        "timestamp": _utc_now_iso(),
+        "period_hours": hours,
+        "health": health_section,
+        "performance": performance_section,
+        "errors": errors_section,
+        "system": system_section
+    }
+
+
+async def _get_dashboard_snapshot(hours: int) -> Tuple[bytes, str]:
+    """
+    Get the serialized dashboard and its ETag.
+    
+    Snapshots are reused for DASHBOARD_CACHE_TTL seconds. Concurrent pollers
+    wait on the lock instead of each fetching every monitoring source.
+    """
+    cached = _dashboard_cache.get(hours)
+    if cached and cached[0] > time.monotonic():
+        return cached[1], cached[2]
+    
+    async with _dashboard_lock:
+        cached = _dashboard_cache.get(hours)
+        if cached and cached[0] > time.monotonic():
+            return cached[1], cached[2]
+        
+        body = orjson.dumps(await _build_dashboard(hours))
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        _dashboard_cache[hours] = (time.monotonic() + DASHBOARD_CACHE_TTL, body, etag)
+        return body, etag
+
+
+@router.get("/dashboard", response_class=OrjsonResponse)
 async def get_dashboard_data(
+    request: Request,
     hours: int = Query(24, ge=1, le=168, description="Hours of data to include")
 ):
-    """Get comprehensive dashboard data."""
+    """
+    Get comprehensive dashboard data.
+    
+    Responses carry an ETag; pollers sending it back in If-None-Match get
+    a 304 until the next snapshot is built.
+    """
     try:
-        # Get all monitoring data
-        health_status, health_details = await health_checker.get_overall_health()
-        performance_summary = await performance_monitor.get_performance_summary(hours=hours)
-        error_summary = await error_reporter.get_error_summary(hours=hours)
-        system_metrics = await performance_monitor.get_system_metrics()
+        body, etag = await _get_dashboard_snapshot(hours)
         
-        return {
-            "timestamp": datetime.utcnow().isoformat(),
-            "period_hours": hours,
-            "health": {
-                "overall_status": health_details["overall_status"],
-                "health_score": health_details["health_score"],
-                "components": health_details["components"],
-                "summary": health_details["summary"]
-            },
-            "performance": {
-                "total_requests": performance_summary["total_requests"],
-                "error_rate": performance_summary["error_rate"],
-                "avg_response_time": performance_summary["avg_response_time"],
-                "system_health": performance_summary["system_health"],
-                "top_endpoints": performance_summary["top_endpoints"][:5],
-                "slowest_endpoints": performance_summary["slowest_endpoints"][:5]
-            },
-            "errors": {
-                "total_errors": error_summary["total_errors"],
-                "critical_errors": error_summary["critical_errors"],
-                "category_breakdown": error_summary["category_breakdown"],
-                "severity_breakdown": error_summary["severity_breakdown"]
-            },
-            "system": {
-                "cpu_usage": system_metrics.cpu_usage,
-                "memory_usage": system_metrics.memory_usage,
-                "disk_usage": system_metrics.disk_usage,
-                "active_connections": system_metrics.active_connections
-            }
-        }
+        headers = {"ETag": etag}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        
+        return Response(content=body, media_type="application/json", headers=headers)
         
     except Exception as e:
-        await error_reporter.report_error(
+        error_reporter.enqueue(
             error=e,
             context={"endpoint": "/monitoring/dashboard", "hours": hours}
         )
@@ -242,7 +386,7 @@ async def test_error_reporting(
         
         return {
             "message": "Test error reported successfully",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _utc_now_iso()
         }
         
     except Exception as e:
@@ -258,11 +402,11 @@ async def get_active_alerts():
         return {
             "active_alerts": [],
             "alert_count": 0,
-            "last_updated": datetime.utcnow().isoformat()
+            "last_updated": _utc_now_iso()
         }
         
     except Exception as e:
-        await error_reporter.report_error(
+        error_reporter.enqueue(
             error=e,
             context={"endpoint": "/monitoring/alerts"}
         )
@@ -281,11 +425,11 @@ async def get_uptime_stats(
             "period_hours": hours,
             "overall_uptime": trends["overall_uptime"],
             "components": trends["components"],
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _utc_now_iso()
         }
         
     except Exception as e:
-        await error_reporter.report_error(
+        error_reporter.enqueue(
             error=e,
             context={"endpoint": "/monitoring/uptime", "hours": hours}
         )
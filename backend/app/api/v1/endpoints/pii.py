@@ -3,22 +3,29 @@ PII Detection and Masking API endpoints.
 
 Provides endpoints for:
 - PII detection in content
+- Streaming PII detection for large documents
 - PII masking and redaction
 - Redaction preview generation
 - Compliance reporting
 - Masking validation
 """
 
-from typing import List, Optional, Dict, Any
+import codecs
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional, Dict, Any
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Query
+import orjson
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query, Request, Response
 from pydantic import BaseModel, Field
 
+from ....core.responses import OrjsonResponse
 from ....core.security import get_current_user
 from ....services.pii_detection import pii_detection_service, PIIFinding, MaskingType
 from ....core.exceptions import PIIDetectionError
 
-router = APIRouter()
+# Responses carry lists of findings, so render them with orjson
+router = APIRouter(default_response_class=OrjsonResponse)
 
 
 class PIIDetectionRequest(BaseModel):
@@ -59,6 +66,45 @@ class PIIPreviewRequest(BaseModel):
     findings: List[Dict[str, Any]] = Field(..., description="PII findings")
 
 
+@asynccontextmanager
+async def pii_audit_logging(app: FastAPI):
+    """Write any queued PII audit entries when the application shuts down."""
+    try:
+        yield
+    finally:
+        await pii_detection_service.stop_audit_logging()
+
+
+def _findings_from_dicts(finding_dicts: List[Dict[str, Any]]) -> List[PIIFinding]:
+    """Convert findings sent by the client into PIIFinding objects."""
+    return [
+        PIIFinding(
+            finding_dict["type"],
+            finding_dict["likelihood"],
+            finding_dict["start"],
+            finding_dict["end"],
+            finding_dict["text"],
+            finding_dict.get("confidence", 0.5)
+        )
+        for finding_dict in finding_dicts
+    ]
+
+
+def _summarize_findings(findings: List[PIIFinding]) -> Dict[str, Any]:
+    """Count findings per info type and rate them by the riskiest type found."""
+    by_type = Counter(finding.info_type for finding in findings)
+    risk_level = max(
+        (_INFO_TYPE_RISK.get(info_type, "low") for info_type in by_type),
+        key=_RISK_RANK.__getitem__,
+        default="low"
+    )
+    return {
+        "total_findings": len(findings),
+        "by_type": dict(by_type),
+        "risk_level": risk_level
+    }
+
+
 @router.post("/detect")
 async def detect_pii(
     request: PIIDetectionRequest,
@@ -78,8 +124,8 @@ async def detect_pii(
             min_likelihood=request.min_likelihood
         )
         
-        # Log audit trail
-        await pii_detection_service.log_pii_audit(
+        # Queue audit trail for a batched background write
+        pii_detection_service.enqueue_pii_audit(
             user_id=current_user["uid"],
             document_id="direct_input",  # For direct content input
             action="detect",
@@ -97,17 +143,57 @@ async def detect_pii(
                 content=request.content,
                 findings=findings
             )
-            return preview
+            return OrjsonResponse(preview)
         
         # Return findings only
-        return {
-            "findings": [finding.to_dict() for finding in findings],
-            "summary": {
-                "total_findings": len(findings),
-                "by_type": {},
-                "risk_level": "low"
+        return OrjsonResponse({
+            "findings": findings,
+            "summary": _summarize_findings(findings)
+        })
+        
+    except PIIDetectionError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"PII detection failed: {str(e)}")
+
+
+@router.post("/detect-stream")
+async def detect_pii_stream(
+    request: Request,
+    info_types: Optional[List[str]] = Query(None, description="Specific PII types to detect"),
+    min_likelihood: str = Query(default="POSSIBLE", description="Minimum likelihood threshold"),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Detect PII in a large plain-text request body.
+    
+    The UTF-8 body is scanned while it is being received instead of being
+    parsed into a JSON model first, so memory stays bounded for large
+    documents. Offsets are character offsets into the whole body.
+    """
+    try:
+        findings = await pii_detection_service.detect_pii_stream(
+            _iter_body_text(request),
+            info_types=info_types,
+            min_likelihood=min_likelihood
+        )
+        
+        # Queue audit trail for a batched background write
+        pii_detection_service.enqueue_pii_audit(
+            user_id=current_user["uid"],
+            document_id="direct_input",
+            action="detect_stream",
+            findings=findings,
+            metadata={
+                "min_likelihood": min_likelihood,
+                "info_types": info_types
             }
-        }
+        )
+        
+        return OrjsonResponse({
+            "findings": findings,
+            "summary": _summarize_findings(findings)
+        })
         
     except PIIDetectionError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -115,6 +201,18 @@ async def detect_pii(
         raise HTTPException(status_code=500, detail=f"PII detection failed: {str(e)}")
 
 
+async def _iter_body_text(request: Request) -> AsyncIterator[str]:
+    """Decode a streamed UTF-8 request body chunk by chunk."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    async for chunk in request.stream():
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
 @router.post("/mask")
 async def mask_pii(
     request: PIIMaskingRequest,
@@ -126,18 +224,7 @@ async def mask_pii(
     Returns masked content and validation results.
     """
     try:
-        # Convert findings from dict to PIIFinding objects
-        findings = []
-        for finding_dict in request.findings:
-            finding = PIIFinding(
-                info_type=finding_dict["type"],
-                likelihood=finding_dict["likelihood"],
-                start_offset=finding_dict["start"],
-                end_offset=finding_dict["end"],
-                original_text=finding_dict["text"],
-                confidence=finding_dict.get("confidence", 0.5)
-            )
-            findings.append(finding)
+        findings = _findings_from_dicts(request.findings)
         
         # Apply masking
         masked_content, updated_findings = await pii_detection_service.mask_pii(
@@ -153,8 +240,8 @@ async def mask_pii(
             findings=updated_findings
         )
         
-        # Log audit trail
-        await pii_detection_service.log_pii_audit(
+        # Queue audit trail for a batched background write
+        pii_detection_service.enqueue_pii_audit(
             user_id=current_user["uid"],
             document_id="direct_input",
             action="mask",
@@ -165,11 +252,11 @@ async def mask_pii(
             }
         )
         
-        return {
+        return OrjsonResponse({
             "masked_content": masked_content,
-            "findings": [finding.to_dict() for finding in updated_findings],
+            "findings": updated_findings,
             "validation": validation
-        }
+        })
         
     except PIIDetectionError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -188,8 +275,8 @@ async def detect_and_mask_pii(
     Combines detection and masking for convenience.
     """
     try:
-        # Detect and mask PII
-        masked_content, findings = await pii_detection_service.detect_and_mask_pii(
+        # Detect, mask and validate PII
+        masked_content, findings, validation = await pii_detection_service.detect_and_mask_pii(
             content=request.content,
             content_type=request.content_type,
             info_types=request.info_types,
@@ -197,15 +284,8 @@ async def detect_and_mask_pii(
             min_likelihood=request.min_likelihood
         )
         
-        # Validate masking quality
-        validation = await pii_detection_service.validate_masking_quality(
-            original_content=request.content,
-            masked_content=masked_content,
-            findings=findings
-        )
-        
-        # Log audit trail
-        await pii_detection_service.log_pii_audit(
+        # Queue audit trail for a batched background write
+        pii_detection_service.enqueue_pii_audit(
             user_id=current_user["uid"],
             document_id="direct_input",
             action="detect_and_mask",
@@ -218,11 +298,11 @@ async def detect_and_mask_pii(
             }
         )
         
-        return {
+        return OrjsonResponse({
             "masked_content": masked_content,
-            "findings": [finding.to_dict() for finding in findings],
+            "findings": findings,
             "validation": validation
-        }
+        })
         
     except PIIDetectionError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -241,18 +321,7 @@ async def create_redaction_preview(
     Returns preview data with highlighted PII locations.
     """
     try:
-        # Convert findings from dict to PIIFinding objects
-        findings = []
-        for finding_dict in request.findings:
-            finding = PIIFinding(
-                info_type=finding_dict["type"],
-                likelihood=finding_dict["likelihood"],
-                start_offset=finding_dict["start"],
-                end_offset=finding_dict["end"],
-                original_text=finding_dict["text"],
-                confidence=finding_dict.get("confidence", 0.5)
-            )
-            findings.append(finding)
+        findings = _findings_from_dicts(request.findings)
         
         # Create preview
         preview = await pii_detection_service.create_redaction_preview(
@@ -260,7 +329,7 @@ async def create_redaction_preview(
             findings=findings
         )
         
-        return preview
+        return OrjsonResponse(preview)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Preview generation failed: {str(e)}")
@@ -277,18 +346,7 @@ async def validate_masking(
     Checks for PII leakage and masking coverage.
     """
     try:
-        # Convert findings from dict to PIIFinding objects
-        findings = []
-        for finding_dict in request.findings:
-            finding = PIIFinding(
-                info_type=finding_dict["type"],
-                likelihood=finding_dict["likelihood"],
-                start_offset=finding_dict["start"],
-                end_offset=finding_dict["end"],
-                original_text=finding_dict["text"],
-                confidence=finding_dict.get("confidence", 0.5)
-            )
-            findings.append(finding)
+        findings = _findings_from_dicts(request.findings)
         
         # Validate masking
         validation = await pii_detection_service.validate_masking_quality(
@@ -297,8 +355,8 @@ async def validate_masking(
             findings=findings
         )
         
-        # Log audit trail
-        await pii_detection_service.log_pii_audit(
+        # Queue audit trail for a batched background write
+        pii_detection_service.enqueue_pii_audit(
             user_id=current_user["uid"],
             document_id="direct_input",
             action="validate",
@@ -310,7 +368,7 @@ async def validate_masking(
             }
         )
         
-        return validation
+        return OrjsonResponse(validation)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Validation failed: {str(e)}")
@@ -334,9 +392,9 @@ async def get_compliance_report(
         end_dt = None
         
         if start_date:
-            start_dt = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
+            start_dt = datetime.fromisoformat(start_date)
         if end_date:
-            end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
+            end_dt = datetime.fromisoformat(end_date)
         
         # Generate report
         report = await pii_detection_service.get_compliance_report(
@@ -345,7 +403,7 @@ async def get_compliance_report(
             end_date=end_dt
         )
         
-        return report
+        return OrjsonResponse(report)
         
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"Invalid date format: {str(e)}")
@@ -353,14 +411,10 @@ async def get_compliance_report(
         raise HTTPException(status_code=500, detail=f"Report generation failed: {str(e)}")
 
 
-@router.get("/info-types")
-async def get_supported_info_types():
-    """
-    Get list of supported PII types for detection.
-    
-    Returns information about available PII detection categories.
-    """
-    info_types = [
+# Supported PII and masking types. The catalog is static, so the response
+# body is serialized once at import.
+_INFO_TYPES_RESPONSE: Dict[str, Any] = {
+    "info_types": [
         {
             "type": "EMAIL_ADDRESS",
             "name": "Email Address",
@@ -439,40 +493,55 @@ async def get_supported_info_types():
             "description": "US Individual Taxpayer ID",
             "risk_level": "high"
         }
+    ],
+    "masking_types": [
+        {
+            "type": "redact",
+            "name": "Redact",
+            "description": "Completely remove the PII",
+            "example": "[REDACTED]"
+        },
+        {
+            "type": "mask",
+            "name": "Mask",
+            "description": "Replace with asterisks",
+            "example": "***********"
+        },
+        {
+            "type": "hash",
+            "name": "Hash",
+            "description": "Replace with cryptographic hash",
+            "example": "[HASH:a1b2c3d4]"
+        },
+        {
+            "type": "replace",
+            "name": "Replace",
+            "description": "Replace with generic label",
+            "example": "[EMAIL], [NAME], [PHONE]"
+        },
+        {
+            "type": "partial",
+            "name": "Partial",
+            "description": "Show first and last characters",
+            "example": "jo***@ex*****.com"
+        }
     ]
+}
+_INFO_TYPES_BODY = orjson.dumps(_INFO_TYPES_RESPONSE)
+
+# Risk level per info type, and the ranking used to pick the highest
+_INFO_TYPE_RISK: Dict[str, str] = {
+    info_type["type"]: info_type["risk_level"]
+    for info_type in _INFO_TYPES_RESPONSE["info_types"]
+}
+_RISK_RANK: Dict[str, int] = {"low": 1, "medium": 2, "high": 3}
+
+
+@router.get("/info-types")
+async def get_supported_info_types():
+    """
+    Get list of supported PII types for detection.
     
-    return {
-        "info_types": info_types,
-        "masking_types": [
-            {
-                "type": "redact",
-                "name": "Redact",
-                "description": "Completely remove the PII",
-                "example": "[REDACTED]"
-            },
-            {
-                "type": "mask",
-                "name": "Mask",
-                "description": "Replace with asterisks",
-                "example": "***********"
-            },
-            {
-                "type": "hash",
-                "name": "Hash",
-                "description": "Replace with cryptographic hash",
-                "example": "[HASH:a1b2c3d4]"
-            },
-            {
-                "type": "replace",
-                "name": "Replace",
-                "description": "Replace with generic label",
-                "example": "[EMAIL], [NAME], [PHONE]"
-            },
-            {
-                "type": "partial",
-                "name": "Partial",
-                "description": "Show first and last characters",
-                "example": "jo***@ex*****.com"
-            }
-        ]
-    }
\ No newline at end of file
+    Returns information about available PII detection categories.
+    """
+    return Response(content=_INFO_TYPES_BODY, media_type="application/json")
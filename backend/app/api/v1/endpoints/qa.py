@@ -2,24 +2,225 @@
 Q&A API endpoints for document question answering.
 """
 
-import uuid
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+import hashlib
+import logging
+import random
+import re
+import secrets
+import time
+from collections import deque
+from functools import wraps
+from itertools import islice
+from typing import AsyncIterator, Callable, Coroutine, Deque, List, Optional, Dict, Any, Sequence, Tuple, TypedDict
 
-from fastapi import APIRouter, HTTPException, Query, Depends, UploadFile, File
-from pydantic import BaseModel, Field
+from fastapi import (
+    APIRouter, HTTPException, Query, Depends, Request, Response, UploadFile, File,
+    WebSocket, WebSocketDisconnect, status
+)
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRoute
+import orjson
+from pydantic import BaseModel, ConfigDict, Field
 
-from ....core.security import optional_auth
+from ....core.responses import OrjsonResponse
+from ....core.security import check_audio_content_type, check_audio_upload_length, optional_auth
 from ....services.translation_service import TranslationService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 # Initialize services
 translation_service = TranslationService()
 
-# In-memory storage for QA sessions (replace with database in production)
-qa_sessions: Dict[str, Dict[str, Any]] = {}
-qa_history: Dict[str, List[Dict[str, Any]]] = {}
+# Idle Q&A sessions expire after this many seconds
+QA_HISTORY_TTL = 86400
+# Maximum number of sessions kept; the least recently written is evicted first
+MAX_QA_SESSIONS = 10_000
+# Maximum number of items kept per session; older items are dropped first
+MAX_QA_HISTORY_ITEMS = 200
+
+# Maximum number of cached answers; the least recently used is evicted first
+ANSWER_CACHE_SIZE = 4096
+# Answers below this confidence are regenerated instead of cached
+ANSWER_CACHE_MIN_CONFIDENCE = 0.8
+
+# Largest accepted voice question upload, and the size it is read in
+MAX_AUDIO_BYTES = 50 * 1024 * 1024
+AUDIO_CHUNK_SIZE = 64 * 1024
+
+
+class QAItem(TypedDict):
+    """Stored Q&A history item."""
+    id: str
+    question: str
+    answer: str
+    timestamp: str
+    confidence: float
+
+
+# In-memory storage for QA history (replace with database in production).
+# Entries are ordered by last write so the oldest session is always first.
+qa_history: Dict[str, Dict[str, Any]] = {}
+
+# Questions returned by the mock speech recognition
+_MOCK_SPOKEN_QUESTIONS = (
+    "What are the key terms in this contract?",
+    "Are there any liability clauses?",
+    "What is the termination policy?",
+    "What are my rights under this agreement?",
+    "Are there any hidden fees or costs?",
+    "What happens if I breach this contract?"
+)
+_MOCK_RNG = random.Random()
+
+# Cached answers keyed by (document_id, normalized question), least recently used first
+_answer_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+# Demo history returned for sessions that have not asked anything yet
+_MOCK_HISTORY: List[QAItem] = [
+    {
+        "id": "qa_1",
+        "question": "What is the main purpose of this document?",
+        "answer": "This document appears to be a legal contract that outlines terms and conditions for a specific agreement. It contains clauses related to obligations, rights, and responsibilities of the parties involved.",
+        "timestamp": "2024-01-15T10:30:00Z",
+        "confidence": 0.85
+    },
+    {
+        "id": "qa_2", 
+        "question": "Are there any risk factors I should be aware of?",
+        "answer": "Based on the document analysis, there are several moderate risk factors including liability clauses, termination conditions, and payment terms that should be carefully reviewed.",
+        "timestamp": "2024-01-15T10:32:00Z",
+        "confidence": 0.78
+    }
+]
+
+
+_KEY_TERMS_ANSWER: Dict[str, Any] = {
+    "text": "The key terms of this document include: payment obligations, performance requirements, confidentiality clauses, termination conditions, and dispute resolution procedures. Each party has specific rights and responsibilities outlined in sections 2-7.",
+    "confidence": 0.87,
+    "sources": ["Section 2: Obligations", "Section 3: Payment Terms", "Section 7: Termination"]
+}
+_FEES_ANSWER: Dict[str, Any] = {
+    "text": "The document outlines all fees and costs including: base fees, additional charges, late payment penalties, and reimbursable expenses. No hidden fees are identified, but review section 3 for complete fee structure.",
+    "confidence": 0.81,
+    "sources": ["Section 3: Payment Terms", "Schedule A: Fee Structure"]
+}
+
+# Mock answers by question keyword, in match priority order
+_KEYWORD_ANSWERS: Dict[str, Dict[str, Any]] = {
+    "key terms": _KEY_TERMS_ANSWER,
+    "main terms": _KEY_TERMS_ANSWER,
+    "liability": {
+        "text": "The document contains liability clauses that limit each party's exposure to damages. There are caps on liability amounts and exclusions for certain types of damages. Review sections 8-9 for complete liability terms.",
+        "confidence": 0.82,
+        "sources": ["Section 8: Liability Limitations", "Section 9: Indemnification"]
+    },
+    "termination": {
+        "text": "Termination can occur under several conditions: breach of contract (30-day cure period), mutual agreement, or completion of obligations. Notice requirements and post-termination obligations are specified in section 10.",
+        "confidence": 0.79,
+        "sources": ["Section 10: Termination", "Section 11: Post-Termination"]
+    },
+    "rights": {
+        "text": "Your rights under this agreement include: right to performance, right to payment (if applicable), right to terminate for cause, right to dispute resolution, and right to confidentiality protection. See sections 4-6 for details.",
+        "confidence": 0.84,
+        "sources": ["Section 4: Rights and Obligations", "Section 5: Performance Standards", "Section 6: Dispute Resolution"]
+    },
+    "fees": _FEES_ANSWER,
+    "costs": _FEES_ANSWER,
+    "breach": {
+        "text": "Breach consequences include: notice and cure period (typically 30 days), potential termination, liability for damages, and possible legal action. Specific breach remedies are outlined in section 12.",
+        "confidence": 0.78,
+        "sources": ["Section 12: Breach and Remedies", "Section 8: Damages"]
+    }
+}
+_KEYWORD_PRIORITY: Dict[str, int] = {keyword: rank for rank, keyword in enumerate(_KEYWORD_ANSWERS)}
+_KEYWORD_RE = re.compile("|".join(map(re.escape, _KEYWORD_ANSWERS)), re.IGNORECASE)
+
+def _utc_timestamp() -> str:
+    """Current UTC time in the ISO 8601 form used by stored history items."""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+def _make_qa_item(question: str, answer: Dict[str, Any]) -> QAItem:
+    """Build the history item recorded for an answered question."""
+    return {
+        "id": secrets.token_hex(16),
+        "question": question,
+        "answer": answer["text"],
+        "timestamp": _utc_timestamp(),
+        "confidence": answer["confidence"]
+    }
+
+
+def _get_history(session_key: str) -> Deque[QAItem]:
+    """Return the stored history for a session, dropping it once expired."""
+    entry = qa_history.get(session_key)
+    if entry is None:
+        return deque(maxlen=MAX_QA_HISTORY_ITEMS)
+    if time.monotonic() - entry["timestamp"] >= QA_HISTORY_TTL:
+        del qa_history[session_key]
+        return deque(maxlen=MAX_QA_HISTORY_ITEMS)
+    return entry["items"]
+
+
+def _history_page(
+    history: Sequence[QAItem],
+    limit: int,
+    before: Optional[str]
+) -> Tuple[List[QAItem], bool]:
+    """
+    Return up to `limit` items preceding the `before` item, oldest first.
+    
+    Without a cursor the latest items are returned. An unknown cursor
+    yields an empty page. The flag tells whether older items remain.
+    """
+    end = len(history)
+    if before is not None:
+        end = next((index for index, item in enumerate(history) if item["id"] == before), 0)
+    start = max(0, end - limit)
+    return list(islice(history, start, end)), start > 0
+
+
+def _append_history(session_key: str, qa_item: QAItem) -> None:
+    """Append an item to a session history and enforce the store bounds."""
+    items = _get_history(session_key)
+    now = time.monotonic()
+    
+    # Re-insert so the session moves to the end of the write order
+    qa_history.pop(session_key, None)
+    qa_history[session_key] = {"items": items, "timestamp": now}
+    items.append(qa_item)
+    
+    while len(qa_history) > MAX_QA_SESSIONS:
+        qa_history.pop(next(iter(qa_history)))
+    while qa_history:
+        oldest_key = next(iter(qa_history))
+        if now - qa_history[oldest_key]["timestamp"] < QA_HISTORY_TTL:
+            break
+        del qa_history[oldest_key]
+
+
+class AudioUploadRoute(APIRoute):
+    """
+    Route that checks Content-Length before the request body is read.
+    
+    FastAPI parses form data before the endpoint runs, so this is the
+    earliest point where an oversized upload can be turned away.
+    """
+    
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        route_handler = super().get_route_handler()
+        
+        async def limited_route_handler(request: Request) -> Response:
+            check_audio_upload_length(request)
+            return await route_handler(request)
+        
+        return limited_route_handler
+
+
+# Routes receiving audio uploads; included into the main router below
+audio_router = APIRouter(route_class=AudioUploadRoute)
 
 
 class QAQuestion(BaseModel):
@@ -28,6 +229,8 @@ class QAQuestion(BaseModel):
     document_id: str = Field(..., description="Document ID to ask about")
     session_id: str = Field(default="default", description="Session ID")
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
 
 class QAResponse(BaseModel):
     """Q&A response model."""
@@ -52,70 +255,92 @@ class QAHistoryResponse(BaseModel):
     success: bool = Field(..., description="Success status")
     history: List[QAHistoryItem] = Field(..., description="Q&A history")
     session_id: str = Field(..., description="Session ID")
+    has_more: bool = Field(default=False, description="Whether older items remain")
+
+
+def handle_qa_errors(failure_message: str):
+    """
+    Turn unexpected endpoint errors into a 500 prefixed with `failure_message`.
+    
+    HTTPExceptions raised by the endpoint pass through unchanged.
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except HTTPException:
+                raise
+            except Exception as e:
+                logger.exception("Q&A endpoint %s failed", func.__name__)
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"{failure_message}: {str(e)}"
+                )
+        return wrapper
+    return decorator
+
+
+def _build_qa_response(answer: Dict[str, Any], session_id: str) -> QAResponse:
+    """
+    Build the response for an answered question.
+    
+    Answers come from generate_answer and are already well typed, so the
+    model is constructed without validation.
+    """
+    return QAResponse.model_construct(
+        success=True,
+        answer=answer["text"],
+        confidence=answer["confidence"],
+        sources=answer["sources"],
+        session_id=session_id
+    )
 
 
 @router.get("/qa/sessions/{document_id}/history", response_model=QAHistoryResponse)
+@handle_qa_errors("Failed to retrieve Q&A history")
 async def get_qa_history(
+    request: Request,
+    response: Response,
     document_id: str,
     session_id: str = Query(default="default", description="Session ID"),
+    limit: int = Query(default=50, ge=1, le=MAX_QA_HISTORY_ITEMS, description="Maximum number of items"),
+    before: Optional[str] = Query(default=None, description="Return items older than this item ID"),
     user: Optional[dict] = Depends(optional_auth)
 ):
     """
     Get Q&A history for a document session.
+    
+    Returns the latest `limit` items, or the items preceding `before`
+    when paging back. Responses carry an ETag; pollers sending it back
+    in If-None-Match get a 304 while the page is unchanged.
     """
-    try:
-        session_key = f"{document_id}_{session_id}"
-        
-        # Get history or create empty if doesn't exist
-        history = qa_history.get(session_key, [])
-        
-        # Add some mock history if empty
-        if not history:
-            mock_history = [
-                {
-                    "id": "qa_1",
-                    "question": "What is the main purpose of this document?",
-                    "answer": "This document appears to be a legal contract that outlines terms and conditions for a specific agreement. It contains clauses related to obligations, rights, and responsibilities of the parties involved.",
-                    "timestamp": "2024-01-15T10:30:00Z",
-                    "confidence": 0.85
-                },
-                {
-                    "id": "qa_2", 
-                    "question": "Are there any risk factors I should be aware of?",
-                    "answer": "Based on the document analysis, there are several moderate risk factors including liability clauses, termination conditions, and payment terms that should be carefully reviewed.",
-                    "timestamp": "2024-01-15T10:32:00Z",
-                    "confidence": 0.78
-                }
-            ]
-            history = mock_history
-            qa_history[session_key] = history
-        
-        # Convert to QAHistoryItem objects
-        history_items = [
-            QAHistoryItem(
-                id=item["id"],
-                question=item["question"],
-                answer=item["answer"],
-                timestamp=item["timestamp"],
-                confidence=item["confidence"]
-            )
-            for item in history
-        ]
-        
-        return QAHistoryResponse(
-            success=True,
-            history=history_items,
-            session_id=session_id
-        )
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to retrieve Q&A history: {str(e)}"
-        )
+    session_key = f"{document_id}_{session_id}"
+    
+    # Fall back to the demo history for sessions without questions yet
+    history, has_more = _history_page(
+        _get_history(session_key) or _MOCK_HISTORY, limit, before
+    )
+    
+    page_key = "|".join([item["id"] for item in history] + [str(has_more)])
+    etag = f'"{hashlib.blake2b(page_key.encode(), digest_size=16).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    
+    # Stored items are built internally and already match QAHistoryItem
+    history_items = [QAHistoryItem.model_construct(**item) for item in history]
+    
+    return QAHistoryResponse.model_construct(
+        success=True,
+        history=history_items,
+        session_id=session_id,
+        has_more=has_more
+    )
 
 
 @router.post("/qa/ask", response_model=QAResponse)
+@handle_qa_errors("Failed to process question")
 async def ask_question(
     qa_request: QAQuestion,
     user: Optional[dict] = Depends(optional_auth)
@@ -123,41 +348,53 @@ async def ask_question(
     """
     Ask a question about a document.
     """
-    try:
-        # Generate answer based on question (mock implementation)
-        answer = await generate_answer(qa_request.question, qa_request.document_id)
-        
-        # Store in history
-        session_key = f"{qa_request.document_id}_{qa_request.session_id}"
-        if session_key not in qa_history:
-            qa_history[session_key] = []
-        
-        qa_item = {
-            "id": str(uuid.uuid4()),
-            "question": qa_request.question,
+    # Generate answer based on question (mock implementation)
+    answer = await generate_answer(qa_request.question, qa_request.document_id)
+    
+    # Store in history
+    session_key = f"{qa_request.document_id}_{qa_request.session_id}"
+    _append_history(session_key, _make_qa_item(qa_request.question, answer))
+    
+    return _build_qa_response(answer, qa_request.session_id)
+
+
+@router.post("/qa/ask-stream")
+@handle_qa_errors("Failed to process question")
+async def ask_question_stream(
+    qa_request: QAQuestion,
+    user: Optional[dict] = Depends(optional_auth)
+):
+    """
+    Ask a question about a document, streaming the result as NDJSON.
+    
+    The answer line is sent first so clients can render it immediately,
+    followed by one line per source and a final "done" line.
+    """
+    started = time.perf_counter()
+    answer = await generate_answer(qa_request.question, qa_request.document_id)
+    
+    session_key = f"{qa_request.document_id}_{qa_request.session_id}"
+    _append_history(session_key, _make_qa_item(qa_request.question, answer))
+    
+    def _lines():
+        yield orjson.dumps({
+            "type": "answer",
             "answer": answer["text"],
-            "timestamp": datetime.utcnow().isoformat(),
-            "confidence": answer["confidence"]
-        }
-        
-        qa_history[session_key].append(qa_item)
-        
-        return QAResponse(
-            success=True,
-            answer=answer["text"],
-            confidence=answer["confidence"],
-            sources=answer["sources"],
-            session_id=qa_request.session_id
-        )
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to process question: {str(e)}"
-        )
+            "confidence": answer["confidence"],
+            "session_id": qa_request.session_id
+        }) + b"\n"
+        for source in answer["sources"]:
+            yield orjson.dumps({"type": "source", "source": source}) + b"\n"
+        yield orjson.dumps({
+            "type": "done",
+            "processing_time": time.perf_counter() - started
+        }) + b"\n"
+    
+    return StreamingResponse(_lines(), media_type="application/x-ndjson")
 
 
-@router.post("/qa/ask-voice", response_model=QAResponse)
+@audio_router.post("/qa/ask-voice", response_model=QAResponse)
+@handle_qa_errors("Failed to process voice question")
 async def ask_voice_question(
     audio_file: UploadFile = File(...),
     document_id: str = Query(..., description="Document ID"),
@@ -167,125 +404,153 @@ async def ask_voice_question(
     """
     Ask a question using voice input.
     """
+    check_audio_content_type(audio_file.content_type)
+    
+    # Reject uploads whose declared size is already over the limit
+    if audio_file.size is not None and audio_file.size > MAX_AUDIO_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Audio file exceeds the {MAX_AUDIO_BYTES} byte limit"
+        )
+    
+    # Convert speech to text, streaming the upload in chunks (mock implementation)
+    question_text = await speech_to_text(_iter_upload(audio_file))
+    
+    # Process the question
+    answer = await generate_answer(question_text, document_id)
+    
+    # Store in history
+    session_key = f"{document_id}_{session_id}"
+    _append_history(session_key, _make_qa_item(question_text, answer))
+    
+    return _build_qa_response(answer, session_id)
+
+
+@router.websocket("/qa/ask-voice-stream/ws")
+async def ask_voice_question_stream(
+    websocket: WebSocket,
+    document_id: str = Query(..., description="Document ID"),
+    session_id: str = Query(default="default", description="Session ID")
+):
+    """
+    Ask voice questions over a WebSocket.
+    
+    Each question is sent as binary audio frames followed by a text "end"
+    frame. Frames are passed to speech recognition as they arrive, and
+    the transcript and answer are sent back as JSON messages. The
+    connection stays open for further questions in the same session.
+    """
+    await websocket.accept()
+    session_key = f"{document_id}_{session_id}"
+    
     try:
-        # Read audio file
-        audio_content = await audio_file.read()
-        
-        # Convert speech to text (mock implementation)
-        question_text = await speech_to_text(audio_content)
-        
-        # Process the question
-        answer = await generate_answer(question_text, document_id)
-        
-        # Store in history
-        session_key = f"{document_id}_{session_id}"
-        if session_key not in qa_history:
-            qa_history[session_key] = []
-        
-        qa_item = {
-            "id": str(uuid.uuid4()),
-            "question": question_text,
-            "answer": answer["text"],
-            "timestamp": datetime.utcnow().isoformat(),
-            "confidence": answer["confidence"]
-        }
-        
-        qa_history[session_key].append(qa_item)
+        while True:
+            question_text = await speech_to_text(_iter_websocket_audio(websocket))
+            await websocket.send_json({"type": "transcript", "text": question_text})
+            
+            answer = await generate_answer(question_text, document_id)
+            _append_history(session_key, _make_qa_item(question_text, answer))
+            
+            await websocket.send_json({
+                "type": "answer",
+                "answer": answer["text"],
+                "confidence": answer["confidence"],
+                "sources": answer["sources"],
+                "session_id": session_id
+            })
+    except WebSocketDisconnect:
+        pass
+
+
+async def _iter_websocket_audio(websocket: WebSocket) -> AsyncIterator[bytes]:
+    """Yield one question's audio frames until the client sends "end"."""
+    received = 0
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message.get("code", status.WS_1000_NORMAL_CLOSURE))
         
-        return QAResponse(
-            success=True,
-            answer=answer["text"],
-            confidence=answer["confidence"],
-            sources=answer["sources"],
-            session_id=session_id
-        )
+        chunk = message.get("bytes")
+        if chunk is None:
+            if message.get("text") == "end":
+                return
+            continue
         
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to process voice question: {str(e)}"
-        )
+        received += len(chunk)
+        if received > MAX_AUDIO_BYTES:
+            await websocket.close(code=status.WS_1009_MESSAGE_TOO_BIG)
+            raise WebSocketDisconnect(status.WS_1009_MESSAGE_TOO_BIG)
+        yield chunk
+
+
+async def _iter_upload(upload: UploadFile) -> AsyncIterator[bytes]:
+    """Yield an uploaded audio file in chunks, enforcing MAX_AUDIO_BYTES."""
+    received = 0
+    while chunk := await upload.read(AUDIO_CHUNK_SIZE):
+        received += len(chunk)
+        if received > MAX_AUDIO_BYTES:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Audio file exceeds the {MAX_AUDIO_BYTES} byte limit"
+            )
+        yield chunk
 
 
-async def speech_to_text(audio_content: bytes) -> str:
+async def speech_to_text(audio_chunks: AsyncIterator[bytes]) -> str:
     """
     Convert speech to text (mock implementation).
-    In production, this would use Google Cloud Speech-to-Text API.
+    In production, this would feed the chunks to a Google Cloud
+    Speech-to-Text streaming recognize request.
     """
-    # Mock speech recognition
-    mock_questions = [
-        "What are the key terms in this contract?",
-        "Are there any liability clauses?", 
-        "What is the termination policy?",
-        "What are my rights under this agreement?",
-        "Are there any hidden fees or costs?",
-        "What happens if I breach this contract?"
-    ]
+    # Consume the audio without buffering it
+    async for _ in audio_chunks:
+        pass
     
-    import random
-    return random.choice(mock_questions)
+    # Mock speech recognition
+    return _MOCK_RNG.choice(_MOCK_SPOKEN_QUESTIONS)
 
 
 async def generate_answer(question: str, document_id: str) -> Dict[str, Any]:
     """
     Generate an answer to a question about a document.
     In production, this would use AI/ML models to analyze the document.
-    """
-    # Mock answer generation based on question keywords
-    question_lower = question.lower()
     
-    if "key terms" in question_lower or "main terms" in question_lower:
-        return {
-            "text": "The key terms of this document include: payment obligations, performance requirements, confidentiality clauses, termination conditions, and dispute resolution procedures. Each party has specific rights and responsibilities outlined in sections 2-7.",
-            "confidence": 0.87,
-            "sources": ["Section 2: Obligations", "Section 3: Payment Terms", "Section 7: Termination"]
-        }
-    
-    elif "liability" in question_lower:
-        return {
-            "text": "The document contains liability clauses that limit each party's exposure to damages. There are caps on liability amounts and exclusions for certain types of damages. Review sections 8-9 for complete liability terms.",
-            "confidence": 0.82,
-            "sources": ["Section 8: Liability Limitations", "Section 9: Indemnification"]
-        }
-    
-    elif "termination" in question_lower:
-        return {
-            "text": "Termination can occur under several conditions: breach of contract (30-day cure period), mutual agreement, or completion of obligations. Notice requirements and post-termination obligations are specified in section 10.",
-            "confidence": 0.79,
-            "sources": ["Section 10: Termination", "Section 11: Post-Termination"]
-        }
-    
-    elif "rights" in question_lower:
-        return {
-            "text": "Your rights under this agreement include: right to performance, right to payment (if applicable), right to terminate for cause, right to dispute resolution, and right to confidentiality protection. See sections 4-6 for details.",
-            "confidence": 0.84,
-            "sources": ["Section 4: Rights and Obligations", "Section 5: Performance Standards", "Section 6: Dispute Resolution"]
-        }
-    
-    elif "fees" in question_lower or "costs" in question_lower:
-        return {
-            "text": "The document outlines all fees and costs including: base fees, additional charges, late payment penalties, and reimbursable expenses. No hidden fees are identified, but review section 3 for complete fee structure.",
-            "confidence": 0.81,
-            "sources": ["Section 3: Payment Terms", "Schedule A: Fee Structure"]
-        }
+    Confident answers are cached per document and normalized question, so
+    callers must not mutate the returned dict.
+    """
+    cache_key = (document_id, " ".join(question.lower().split()))
+    answer = _answer_cache.pop(cache_key, None)
+    if answer is None:
+        answer = _answer_from_keywords(question)
+        if answer["confidence"] < ANSWER_CACHE_MIN_CONFIDENCE:
+            return answer
+        if len(_answer_cache) >= ANSWER_CACHE_SIZE:
+            _answer_cache.pop(next(iter(_answer_cache)))
     
-    elif "breach" in question_lower:
-        return {
-            "text": "Breach consequences include: notice and cure period (typically 30 days), potential termination, liability for damages, and possible legal action. Specific breach remedies are outlined in section 12.",
-            "confidence": 0.78,
-            "sources": ["Section 12: Breach and Remedies", "Section 8: Damages"]
-        }
+    # Re-insert so the entry moves to the most recently used end
+    _answer_cache[cache_key] = answer
+    return answer
+
+
+def _answer_from_keywords(question: str) -> Dict[str, Any]:
+    """Pick the mock answer for a question from its keywords."""
+    # Mock answer generation based on question keywords; when several
+    # keywords occur the one listed first in _KEYWORD_ANSWERS wins
+    matches = _KEYWORD_RE.findall(question)
+    if matches:
+        keyword = min((match.lower() for match in matches), key=_KEYWORD_PRIORITY.__getitem__)
+        return _KEYWORD_ANSWERS[keyword]
     
-    else:
-        # Generic answer for other questions
-        return {
-            "text": f"Based on the document analysis, I can provide information about your question regarding '{question}'. The document contains relevant clauses and terms that address this topic. For specific details, please refer to the relevant sections or ask a more specific question.",
-            "confidence": 0.65,
-            "sources": ["General Document Analysis", "Multiple Sections"]
-        }
+    # Generic answer for other questions
+    return {
+        "text": f"Based on the document analysis, I can provide information about your question regarding '{question}'. The document contains relevant clauses and terms that address this topic. For specific details, please refer to the relevant sections or ask a more specific question.",
+        "confidence": 0.65,
+        "sources": ["General Document Analysis", "Multiple Sections"]
+    }
 
 
-@router.delete("/qa/sessions/{document_id}/history")
+@router.delete("/qa/sessions/{document_id}/history", response_class=OrjsonResponse)
+@handle_qa_errors("Failed to clear Q&A history")
 async def clear_qa_history(
     document_id: str,
     session_id: str = Query(default="default", description="Session ID"),
@@ -294,19 +559,14 @@ async def clear_qa_history(
     """
     Clear Q&A history for a document session.
     """
-    try:
-        session_key = f"{document_id}_{session_id}"
-        
-        if session_key in qa_history:
-            del qa_history[session_key]
-        
-        return {
-            "success": True,
-            "message": "Q&A history cleared successfully"
-        }
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to clear Q&A history: {str(e)}"
-        )
\ No newline at end of file
+    session_key = f"{document_id}_{session_id}"
+    
+    qa_history.pop(session_key, None)
+    
+    return {
+        "success": True,
+        "message": "Q&A history cleared successfully"
+    }
+
+
+router.include_router(audio_router)
@@ -8,25 +8,89 @@ This module provides endpoints for:
 - Audio format conversion
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import List, Optional, Dict, Any
+import time
+from typing import Awaitable, Callable, List, Optional, Dict, Any, Tuple
 from uuid import UUID
 import tempfile
 import os
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query, Request
 from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
+from ....core.config import settings
+from ....core.responses import envelope_response
 from ....core.security import require_auth
 from ....models.base import ApiResponse
-from ....services.speech_to_text import speech_to_text_service, TranscriptionResult
-from ....services.text_to_speech import text_to_speech_service, SynthesisResult
+from ....services.speech_to_text import (
+    AUDIO_MAGIC_SIZE,
+    MAX_CANDIDATE_LANGUAGES,
+    AudioFormat,
+    TranscriptionResult,
+    detect_audio_format,
+    speech_to_text_service,
+)
+from ....services.text_to_speech import text_to_speech_service, SynthesisFormat, SynthesisResult
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/speech", tags=["speech"])
 
+# Uploaded audio is copied to disk in chunks of this size
+AUDIO_CHUNK_SIZE = 64 * 1024
+
+# Upload media types, without parameters, mapped to the format they carry
+_CONTENT_TYPE_FORMATS: Dict[str, AudioFormat] = {
+    "audio/wav": AudioFormat.WAV,
+    "audio/wave": AudioFormat.WAV,
+    "audio/x-wav": AudioFormat.WAV,
+    "audio/mpeg": AudioFormat.MP3,
+    "audio/mp3": AudioFormat.MP3,
+    "audio/ogg": AudioFormat.OGG,
+    "audio/flac": AudioFormat.FLAC,
+    "audio/x-flac": AudioFormat.FLAC,
+    "audio/webm": AudioFormat.WEBM,
+    "audio/mp4": AudioFormat.MP4,
+    "audio/x-m4a": AudioFormat.MP4,
+}
+
+# Response media type and file extension for each synthesis format
+_SYNTHESIS_OUTPUTS: Dict[SynthesisFormat, Tuple[str, str]] = {
+    SynthesisFormat.MP3: ("audio/mpeg", "mp3"),
+    SynthesisFormat.WAV: ("audio/wav", "wav"),
+    SynthesisFormat.OGG: ("audio/ogg", "ogg"),
+}
+
+# Maximum total audio bytes kept in the synthesis cache
+SYNTHESIS_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Synthesis results keyed by request parameters, least recently used first
+_synthesis_cache: Dict[Tuple[Any, ...], SynthesisResult] = {}
+_synthesis_cache_bytes = 0
+
+# Syntheses in progress, shared by identical concurrent requests
+_inflight_synthesis: Dict[Tuple[Any, ...], asyncio.Future] = {}
+
+# Seconds a serialized voice or language catalog is reused
+CATALOG_CACHE_TTL = 3600.0
+
+# Maximum cached catalogs, one per catalog and language filter
+MAX_CATALOG_ENTRIES = 64
+
+# Serialized catalogs keyed by (catalog, language filter): (expires_at, body, etag)
+_catalog_cache: Dict[Tuple[str, Optional[str]], Tuple[float, bytes, str]] = {}
+_catalog_lock = asyncio.Lock()
+
+# Seconds a speech backend health result is shared with later callers
+HEALTH_CHECK_TTL = 5.0
+
+# In-flight backend health checks and recent results, keyed by service name
+_inflight_health: Dict[str, asyncio.Future] = {}
+_health_results: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
 
 # Request/Response Models
 class TranscriptionRequest(BaseModel):
@@ -56,7 +120,7 @@ class SynthesisRequest(BaseModel):
     language_code: str = Field(default="en-US", description="Language code for synthesis")
     voice_name: Optional[str] = Field(default=None, description="Specific voice name")
     voice_gender: str = Field(default="NEUTRAL", description="Voice gender (MALE, FEMALE, NEUTRAL)")
-    audio_format: str = Field(default="MP3", description="Output audio format (MP3, WAV, OGG)")
+    audio_format: SynthesisFormat = Field(default=SynthesisFormat.MP3, description="Output audio format (MP3, WAV, OGG)")
     sample_rate: Optional[int] = Field(default=None, description="Audio sample rate")
     speaking_rate: float = Field(default=1.0, ge=0.25, le=4.0, description="Speech rate")
     pitch: float = Field(default=0.0, ge=-20.0, le=20.0, description="Voice pitch in semitones")
@@ -82,9 +146,186 @@ class VoiceInfo(BaseModel):
     natural_sample_rate_hertz: int
 
 
+async def _spool_upload(audio_file: UploadFile, suffix: str) -> Tuple[str, int]:
+    """
+    Copy an upload to a temporary file in chunks.
+    
+    Returns the file path and its size; the caller must delete the file.
+    
+    Raises:
+        HTTPException: 413 if the upload exceeds settings.MAX_AUDIO_BYTES
+    """
+    too_large = HTTPException(
+        status_code=413,
+        detail=f"Audio file exceeds the {settings.MAX_AUDIO_BYTES} byte limit"
+    )
+    # Known up front when the multipart part declared its size
+    if audio_file.size is not None and audio_file.size > settings.MAX_AUDIO_BYTES:
+        raise too_large
+    
+    size = 0
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as temp_file:
+        try:
+            while chunk := await audio_file.read(AUDIO_CHUNK_SIZE):
+                size += len(chunk)
+                if size > settings.MAX_AUDIO_BYTES:
+                    raise too_large
+                temp_file.write(chunk)
+        except BaseException:
+            temp_file.close()
+            os.unlink(temp_file.name)
+            raise
+    return temp_file.name, size
+
+
+async def _detect_upload_format(audio_file: UploadFile) -> str:
+    """
+    Determine an upload's audio format from its leading bytes.
+    
+    Falls back to the declared audio/* content type for formats without a
+    recognized signature. The upload is rewound afterwards.
+    
+    Raises:
+        HTTPException: 400 if the upload is not recognizable as audio
+    """
+    head = await audio_file.read(AUDIO_MAGIC_SIZE)
+    await audio_file.seek(0)
+    
+    detected = detect_audio_format(head)
+    if detected is not None:
+        return detected.value
+    
+    media_type = (audio_file.content_type or "").partition(';')[0].strip().lower()
+    declared = _CONTENT_TYPE_FORMATS.get(media_type)
+    if declared is not None:
+        return declared.value
+    
+    if not media_type.startswith('audio/'):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File must be an audio file"
+        )
+    
+    # Other audio types pass their subtype through as before
+    return media_type[len('audio/'):]
+
+
+async def _synthesize(request: SynthesisRequest) -> SynthesisResult:
+    """
+    Synthesize a request, reusing the result of identical requests.
+    
+    Concurrent identical requests share one backend call, and results are
+    kept in an LRU cache bounded by SYNTHESIS_CACHE_MAX_BYTES. Callers
+    must not mutate the returned result.
+    """
+    params = request.model_dump()
+    key = tuple(params.values())
+    
+    result = _synthesis_cache.pop(key, None)
+    if result is not None:
+        # Re-insert so the entry moves to the most recently used end
+        _synthesis_cache[key] = result
+        return result
+    
+    task = _inflight_synthesis.get(key)
+    if task is None:
+        task = asyncio.ensure_future(text_to_speech_service.synthesize_text(**params))
+        _inflight_synthesis[key] = task
+        
+        def _on_done(done: asyncio.Future):
+            _inflight_synthesis.pop(key, None)
+            if not done.cancelled() and done.exception() is None:
+                _cache_synthesis(key, done.result())
+        
+        task.add_done_callback(_on_done)
+    
+    # Shield the shared task so one caller disconnecting does not cancel it
+    # for everyone else
+    return await asyncio.shield(task)
+
+
+def _cache_synthesis(key: Tuple[Any, ...], result: SynthesisResult) -> None:
+    """Cache a synthesis result, evicting least recently used entries to fit."""
+    global _synthesis_cache_bytes
+    
+    size = len(result.audio_content)
+    if size > SYNTHESIS_CACHE_MAX_BYTES:
+        return
+    
+    _synthesis_cache[key] = result
+    _synthesis_cache_bytes += size
+    while _synthesis_cache_bytes > SYNTHESIS_CACHE_MAX_BYTES:
+        evicted = _synthesis_cache.pop(next(iter(_synthesis_cache)))
+        _synthesis_cache_bytes -= len(evicted.audio_content)
+
+
+async def _catalog_response(
+    request: Request,
+    key: Tuple[str, Optional[str]],
+    build: Callable[[], Awaitable[ApiResponse]]
+) -> Response:
+    """
+    Serve a catalog envelope from the cache, building it when stale.
+    
+    Responses carry an ETag; clients sending it back in If-None-Match get
+    a 304 until the catalog is rebuilt.
+    """
+    cached = _catalog_cache.get(key)
+    if not cached or cached[0] <= time.monotonic():
+        async with _catalog_lock:
+            cached = _catalog_cache.get(key)
+            if not cached or cached[0] <= time.monotonic():
+                body = (await build()).model_dump_json().encode()
+                etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+                cached = (time.monotonic() + CATALOG_CACHE_TTL, body, etag)
+                
+                _catalog_cache.pop(key, None)
+                _catalog_cache[key] = cached
+                while len(_catalog_cache) > MAX_CATALOG_ENTRIES:
+                    _catalog_cache.pop(next(iter(_catalog_cache)))
+    
+    _, body, etag = cached
+    headers = {"ETag": etag, "Cache-Control": f"private, max-age={int(CATALOG_CACHE_TTL)}"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def _cached_health(name: str, check: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Run a backend health check once for all concurrent callers.
+    
+    Callers arriving while the check is running await the same task, and
+    its result is reused for HEALTH_CHECK_TTL seconds.
+    """
+    cached = _health_results.get(name)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    
+    task = _inflight_health.get(name)
+    if task is None:
+        task = asyncio.ensure_future(check())
+        _inflight_health[name] = task
+        
+        def _on_done(done: asyncio.Future):
+            _inflight_health.pop(name, None)
+            if not done.cancelled() and done.exception() is None:
+                _health_results[name] = (time.monotonic() + HEALTH_CHECK_TTL, done.result())
+        
+        task.add_done_callback(_on_done)
+    
+    # Shield the shared task so one caller disconnecting does not cancel it
+    # for everyone else
+    return await asyncio.shield(task)
+
+
 # Speech-to-Text Endpoints
 
-@router.post("/transcribe", response_model=ApiResponse[TranscriptionResponse])
+@router.post(
+    "/transcribe",
+    responses={200: {"model": ApiResponse[TranscriptionResponse]}}
+)
 async def transcribe_audio(
     audio_file: UploadFile = File(..., description="Audio file to transcribe"),
     language_code: str = Form(default="en-US"),
@@ -103,43 +344,36 @@ async def transcribe_audio(
     features like word timestamps, speaker diarization, and confidence scores.
     """
     try:
-        # Validate file type
-        if not audio_file.content_type or not audio_file.content_type.startswith('audio/'):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="File must be an audio file"
-            )
-        
-        # Read audio data
-        audio_data = await audio_file.read()
-        
-        if len(audio_data) == 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Audio file is empty"
+        # Determine audio format from the file's contents
+        audio_format = await _detect_upload_format(audio_file)
+        
+        # Spool the upload to disk instead of reading it into memory
+        audio_path, audio_size = await _spool_upload(audio_file, f".{audio_format}")
+        try:
+            if audio_size == 0:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Audio file is empty"
+                )
+            
+            logger.info("Transcribing audio file: %s (%d bytes)", audio_file.filename, audio_size)
+            
+            # Perform transcription
+            result = await speech_to_text_service.transcribe_audio_file(
+                audio_data=audio_path,
+                language_code=language_code,
+                audio_format=audio_format,
+                enable_word_timestamps=enable_word_timestamps,
+                enable_speaker_diarization=enable_speaker_diarization,
+                max_speaker_count=max_speaker_count,
+                enable_automatic_punctuation=enable_automatic_punctuation,
+                enable_profanity_filter=enable_profanity_filter,
+                model=model
             )
+        finally:
+            os.unlink(audio_path)
         
-        # Determine audio format from content type
-        audio_format = audio_file.content_type.split('/')[-1]
-        if audio_format == 'mpeg':
-            audio_format = 'mp3'
-        
-        logger.info(f"Transcribing audio file: {audio_file.filename} ({len(audio_data)} bytes)")
-        
-        # Perform transcription
-        result = await speech_to_text_service.transcribe_audio_file(
-            audio_data=audio_data,
-            language_code=language_code,
-            audio_format=audio_format,
-            enable_word_timestamps=enable_word_timestamps,
-            enable_speaker_diarization=enable_speaker_diarization,
-            max_speaker_count=max_speaker_count,
-            enable_automatic_punctuation=enable_automatic_punctuation,
-            enable_profanity_filter=enable_profanity_filter,
-            model=model
-        )
-        
-        response_data = TranscriptionResponse(
+        response_data = TranscriptionResponse.model_construct(
             transcript=result.transcript,
             confidence=result.confidence,
             language_code=result.language_code,
@@ -150,26 +384,32 @@ async def transcribe_audio(
             processing_time=result.processing_time
         )
         
-        return ApiResponse(
+        return envelope_response(ApiResponse(
             success=True,
             data=response_data,
             message="Audio transcribed successfully"
-        )
+        ))
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Transcription error: {str(e)}")
+        logger.error("Transcription error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Transcription failed: {str(e)}"
         )
 
 
-@router.post("/transcribe-with-language-detection", response_model=ApiResponse[TranscriptionResponse])
+@router.post(
+    "/transcribe-with-language-detection",
+    responses={200: {"model": ApiResponse[TranscriptionResponse]}}
+)
 async def transcribe_with_language_detection(
     audio_file: UploadFile = File(..., description="Audio file to transcribe"),
-    candidate_languages: List[str] = Query(default=["en-US", "es-ES", "fr-FR"], description="Candidate languages"),
+    candidate_languages: List[str] = Query(
+        default=["en-US", "es-ES", "fr-FR"],
+        description=f"Candidate languages, at most {MAX_CANDIDATE_LANGUAGES}"
+    ),
     current_user: dict = Depends(require_auth)
 ):
     """
@@ -179,30 +419,32 @@ async def transcribe_with_language_detection(
     before performing transcription.
     """
     try:
-        # Validate file type
-        if not audio_file.content_type or not audio_file.content_type.startswith('audio/'):
+        # The recognizer scores a primary language plus three alternatives;
+        # reject longer lists rather than silently ignoring the excess
+        candidate_languages = list(dict.fromkeys(candidate_languages))
+        if len(candidate_languages) > MAX_CANDIDATE_LANGUAGES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="File must be an audio file"
+                detail=f"At most {MAX_CANDIDATE_LANGUAGES} candidate languages are supported"
             )
         
-        # Read audio data
-        audio_data = await audio_file.read()
-        
-        # Determine audio format
-        audio_format = audio_file.content_type.split('/')[-1]
-        if audio_format == 'mpeg':
-            audio_format = 'mp3'
+        # Determine audio format from the file's contents
+        audio_format = await _detect_upload_format(audio_file)
         
-        logger.info(f"Transcribing with language detection: {audio_file.filename}")
+        logger.info("Transcribing with language detection: %s", audio_file.filename)
         
-        # Perform transcription with language detection
-        result = await speech_to_text_service.transcribe_with_language_detection(
-            audio_data=audio_data,
-            candidate_languages=candidate_languages
-        )
+        # Spool the upload to disk instead of reading it into memory
+        audio_path, _ = await _spool_upload(audio_file, f".{audio_format}")
+        try:
+            # Perform transcription with language detection
+            result = await speech_to_text_service.transcribe_with_language_detection(
+                audio_data=audio_path,
+                candidate_languages=candidate_languages
+            )
+        finally:
+            os.unlink(audio_path)
         
-        response_data = TranscriptionResponse(
+        response_data = TranscriptionResponse.model_construct(
             transcript=result.transcript,
             confidence=result.confidence,
             language_code=result.language_code,
@@ -213,16 +455,16 @@ async def transcribe_with_language_detection(
             processing_time=result.processing_time
         )
         
-        return ApiResponse(
+        return envelope_response(ApiResponse(
             success=True,
             data=response_data,
             message=f"Audio transcribed successfully (detected language: {result.language_code})"
-        )
+        ))
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Language detection transcription error: {str(e)}")
+        logger.error("Language detection transcription error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Transcription with language detection failed: {str(e)}"
@@ -231,7 +473,10 @@ async def transcribe_with_language_detection(
 
 # Text-to-Speech Endpoints
 
-@router.post("/synthesize", response_model=ApiResponse[SynthesisResponse])
+@router.post(
+    "/synthesize",
+    responses={200: {"model": ApiResponse[SynthesisResponse]}}
+)
 async def synthesize_text(
     request: SynthesisRequest,
     current_user: dict = Depends(require_auth)
@@ -243,23 +488,12 @@ async def synthesize_text(
     language, and audio parameters.
     """
     try:
-        logger.info(f"Synthesizing text: {request.text[:100]}...")
+        logger.info("Synthesizing text: %.100s...", request.text)
         
         # Perform synthesis
-        result = await text_to_speech_service.synthesize_text(
-            text=request.text,
-            language_code=request.language_code,
-            voice_name=request.voice_name,
-            voice_gender=request.voice_gender,
-            audio_format=request.audio_format,
-            sample_rate=request.sample_rate,
-            speaking_rate=request.speaking_rate,
-            pitch=request.pitch,
-            volume_gain_db=request.volume_gain_db,
-            use_ssml=request.use_ssml
-        )
+        result = await _synthesize(request)
         
-        response_data = SynthesisResponse(
+        response_data = SynthesisResponse.model_construct(
             audio_content_base64=result.to_dict()["audio_content_base64"],
             text=result.text,
             voice_name=result.voice_name,
@@ -270,14 +504,14 @@ async def synthesize_text(
             processing_time=result.processing_time
         )
         
-        return ApiResponse(
+        return envelope_response(ApiResponse(
             success=True,
             data=response_data,
             message="Text synthesized successfully"
-        )
+        ))
         
     except Exception as e:
-        logger.error(f"Text synthesis error: {str(e)}")
+        logger.error("Text synthesis error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Text synthesis failed: {str(e)}"
@@ -297,29 +531,13 @@ async def synthesize_text_to_audio(
     """
     try:
         # Perform synthesis
-        result = await text_to_speech_service.synthesize_text(
-            text=request.text,
-            language_code=request.language_code,
-            voice_name=request.voice_name,
-            voice_gender=request.voice_gender,
-            audio_format=request.audio_format,
-            sample_rate=request.sample_rate,
-            speaking_rate=request.speaking_rate,
-            pitch=request.pitch,
-            volume_gain_db=request.volume_gain_db,
-            use_ssml=request.use_ssml
-        )
+        result = await _synthesize(request)
         
         # Determine content type
-        content_type_map = {
-            "mp3": "audio/mpeg",
-            "wav": "audio/wav",
-            "ogg": "audio/ogg",
-        }
-        content_type = content_type_map.get(result.audio_format.lower(), "audio/mpeg")
+        content_type, extension = _SYNTHESIS_OUTPUTS[request.audio_format]
         
         # Generate filename
-        filename = f"synthesis_{result.created_at.strftime('%Y%m%d_%H%M%S')}.{result.audio_format.lower()}"
+        filename = f"synthesis_{result.created_at.strftime('%Y%m%d_%H%M%S')}.{extension}"
         
         return Response(
             content=result.audio_content,
@@ -331,19 +549,22 @@ async def synthesize_text_to_audio(
         )
         
     except Exception as e:
-        logger.error(f"Audio synthesis error: {str(e)}")
+        logger.error("Audio synthesis error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Audio synthesis failed: {str(e)}"
         )
 
 
-@router.post("/synthesize-ssml", response_model=ApiResponse[SynthesisResponse])
+@router.post(
+    "/synthesize-ssml",
+    responses={200: {"model": ApiResponse[SynthesisResponse]}}
+)
 async def synthesize_ssml(
     text: str = Form(..., description="SSML-formatted text"),
     language_code: str = Form(default="en-US"),
     voice_name: Optional[str] = Form(default=None),
-    audio_format: str = Form(default="MP3"),
+    audio_format: SynthesisFormat = Form(default=SynthesisFormat.MP3),
     current_user: dict = Depends(require_auth)
 ):
     """
@@ -353,17 +574,18 @@ async def synthesize_ssml(
     for advanced control over pronunciation, timing, and emphasis.
     """
     try:
-        logger.info(f"Synthesizing SSML text: {text[:100]}...")
+        logger.info("Synthesizing SSML text: %.100s...", text)
         
         # Perform SSML synthesis
-        result = await text_to_speech_service.synthesize_with_ssml(
-            ssml_text=text,
+        result = await _synthesize(SynthesisRequest(
+            text=text,
             language_code=language_code,
             voice_name=voice_name,
-            audio_format=audio_format
-        )
+            audio_format=audio_format,
+            use_ssml=True
+        ))
         
-        response_data = SynthesisResponse(
+        response_data = SynthesisResponse.model_construct(
             audio_content_base64=result.to_dict()["audio_content_base64"],
             text=result.text,
             voice_name=result.voice_name,
@@ -374,14 +596,14 @@ async def synthesize_ssml(
             processing_time=result.processing_time
         )
         
-        return ApiResponse(
+        return envelope_response(ApiResponse(
             success=True,
             data=response_data,
             message="SSML text synthesized successfully"
-        )
+        ))
         
     except Exception as e:
-        logger.error(f"SSML synthesis error: {str(e)}")
+        logger.error("SSML synthesis error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"SSML synthesis failed: {str(e)}"
@@ -390,8 +612,12 @@ async def synthesize_ssml(
 
 # Voice and Language Management
 
-@router.get("/voices", response_model=ApiResponse[List[VoiceInfo]])
+@router.get(
+    "/voices",
+    responses={200: {"model": ApiResponse[List[VoiceInfo]]}}
+)
 async def get_available_voices(
+    request: Request,
     language_code: Optional[str] = Query(default=None, description="Filter by language code"),
     current_user: dict = Depends(require_auth)
 ):
@@ -399,44 +625,47 @@ async def get_available_voices(
     Get list of available voices for text-to-speech.
     
     Retrieve all available voices, optionally filtered by language code.
+    The catalog is cached for CATALOG_CACHE_TTL seconds and served with
+    an ETag.
     """
-    try:
+    async def build() -> ApiResponse:
+        # The service already returns VoiceInfo-shaped dicts; serialize them
+        # as-is rather than building a model per voice
         voices = await text_to_speech_service.get_available_voices(language_code)
         
-        voice_list = [
-            VoiceInfo(
-                name=voice["name"],
-                language_codes=voice["language_codes"],
-                ssml_gender=voice["ssml_gender"],
-                natural_sample_rate_hertz=voice["natural_sample_rate_hertz"]
-            )
-            for voice in voices
-        ]
-        
         return ApiResponse(
             success=True,
-            data=voice_list,
-            message=f"Retrieved {len(voice_list)} available voices"
+            data=voices,
+            message=f"Retrieved {len(voices)} available voices"
         )
+    
+    try:
+        return await _catalog_response(request, ("voices", language_code), build)
         
     except Exception as e:
-        logger.error(f"Error getting voices: {str(e)}")
+        logger.error("Error getting voices: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get available voices: {str(e)}"
         )
 
 
-@router.get("/languages", response_model=ApiResponse[List[Dict[str, str]]])
+@router.get(
+    "/languages",
+    responses={200: {"model": ApiResponse[List[Dict[str, str]]]}}
+)
 async def get_supported_languages(
+    request: Request,
     current_user: dict = Depends(require_auth)
 ):
     """
     Get list of supported languages for speech services.
     
     Retrieve all supported languages for both speech-to-text and text-to-speech.
+    The catalog is cached for CATALOG_CACHE_TTL seconds and served with
+    an ETag.
     """
-    try:
+    async def build() -> ApiResponse:
         languages = await speech_to_text_service.get_supported_languages()
         
         return ApiResponse(
@@ -444,9 +673,12 @@ async def get_supported_languages(
             data=languages,
             message=f"Retrieved {len(languages)} supported languages"
         )
+    
+    try:
+        return await _catalog_response(request, ("languages", None), build)
         
     except Exception as e:
-        logger.error(f"Error getting languages: {str(e)}")
+        logger.error("Error getting languages: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get supported languages: {str(e)}"
@@ -480,7 +712,7 @@ async def create_pronunciation_guide(
         )
         
     except Exception as e:
-        logger.error(f"Error creating pronunciation guide: {str(e)}")
+        logger.error("Error creating pronunciation guide: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create pronunciation guide: {str(e)}"
@@ -490,15 +722,20 @@ async def create_pronunciation_guide(
 # Health Check
 
 @router.get("/health", response_model=ApiResponse[Dict[str, Any]])
-async def speech_health_check():
+async def speech_health_check(response: Response):
     """
     Check the health of speech services.
     
     Perform health checks on both Speech-to-Text and Text-to-Speech services.
+    Both run concurrently, and their results are reused for HEALTH_CHECK_TTL
+    seconds so frequent probes do not re-run them.
     """
     try:
-        stt_health = await speech_to_text_service.health_check()
-        tts_health = await text_to_speech_service.health_check()
+        stt_health, tts_health = await asyncio.gather(
+            _cached_health("speech_to_text", speech_to_text_service.health_check),
+            _cached_health("text_to_speech", text_to_speech_service.health_check)
+        )
+        response.headers["Cache-Control"] = f"max-age={int(HEALTH_CHECK_TTL)}"
         
         overall_status = "healthy" if (
             stt_health["status"] == "healthy" and 
@@ -518,7 +755,7 @@ async def speech_health_check():
         )
         
     except Exception as e:
-        logger.error(f"Health check error: {str(e)}")
+        logger.error("Health check error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Health check failed: {str(e)}"
@@ -14,7 +14,8 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, WebSocket, WebSocketDisconnect, Query
 from fastapi.responses import StreamingResponse
 
-from ....core.security import require_auth, optional_auth
+from ....core.exceptions import RateLimitError
+from ....core.security import AuthenticationError, require_auth, optional_auth, verify_token_cached
 from ....models.base import ApiResponse
 from ....services.realtime_streaming import streaming_service
 
@@ -43,7 +44,7 @@ async def stream_job_progress(
         StreamingResponse with SSE stream
     """
     try:
-        logger.info(f"Creating SSE stream for job {job_id}, user {current_user['uid']}")
+        logger.info("Creating SSE stream for job %s, user %s", job_id, current_user['uid'])
         
         # Create SSE stream
         return await streaming_service.create_sse_stream(
@@ -51,8 +52,13 @@ async def stream_job_progress(
             job_id=str(job_id)
         )
         
+    except RateLimitError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e)
+        )
     except Exception as e:
-        logger.error(f"Failed to create job stream: {str(e)}")
+        logger.error("Failed to create job stream: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to create job progress stream"
@@ -76,7 +82,7 @@ async def stream_user_updates(
         StreamingResponse with SSE stream
     """
     try:
-        logger.info(f"Creating user SSE stream for user {current_user['uid']}")
+        logger.info("Creating user SSE stream for user %s", current_user['uid'])
         
         # Create SSE stream for all user jobs
         return await streaming_service.create_sse_stream(
@@ -84,8 +90,13 @@ async def stream_user_updates(
             job_id=None  # Monitor all user jobs
         )
         
+    except RateLimitError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e)
+        )
     except Exception as e:
-        logger.error(f"Failed to create user stream: {str(e)}")
+        logger.error("Failed to create user stream: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to create user updates stream"
@@ -110,16 +121,19 @@ async def websocket_job_progress(
         token: Authentication token (query parameter)
     """
     try:
-        # Authenticate user (simplified for WebSocket)
+        # Authenticate user from the token query parameter
         if not token:
             await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
             return
         
-        # TODO: Implement proper token validation
-        # For now, extract user_id from token (this should be properly validated)
-        user_id = "anonymous"  # Placeholder
+        try:
+            user_id = (await verify_token_cached(token))["uid"]
+        except AuthenticationError as e:
+            logger.info("Rejected WebSocket token: %s", e)
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+            return
         
-        logger.info(f"WebSocket connection for job {job_id}, user {user_id}")
+        logger.info("WebSocket connection for job %s, user %s", job_id, user_id)
         
         # Handle WebSocket connection
         await streaming_service.handle_websocket_connection(
@@ -129,9 +143,9 @@ async def websocket_job_progress(
         )
         
     except WebSocketDisconnect:
-        logger.info(f"WebSocket disconnected for job {job_id}")
+        logger.info("WebSocket disconnected for job %s", job_id)
     except Exception as e:
-        logger.error(f"WebSocket error for job {job_id}: {str(e)}")
+        logger.error("WebSocket error for job %s: %s", job_id, e)
         try:
             await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
         except:
@@ -151,15 +165,19 @@ async def websocket_user_updates(
         token: Authentication token (query parameter)
     """
     try:
-        # Authenticate user (simplified for WebSocket)
+        # Authenticate user from the token query parameter
         if not token:
             await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
             return
         
-        # TODO: Implement proper token validation
-        user_id = "anonymous"  # Placeholder
+        try:
+            user_id = (await verify_token_cached(token))["uid"]
+        except AuthenticationError as e:
+            logger.info("Rejected WebSocket token: %s", e)
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+            return
         
-        logger.info(f"WebSocket connection for user {user_id}")
+        logger.info("WebSocket connection for user %s", user_id)
         
         # Handle WebSocket connection
         await streaming_service.handle_websocket_connection(
@@ -169,9 +187,9 @@ async def websocket_user_updates(
         )
         
     except WebSocketDisconnect:
-        logger.info(f"WebSocket disconnected for user")
+        logger.info("WebSocket disconnected for user")
     except Exception as e:
-        logger.error(f"WebSocket error: {str(e)}")
+        logger.error("WebSocket error: %s", e)
         try:
             await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
         except:
@@ -214,7 +232,7 @@ async def get_streaming_status(
         )
         
     except Exception as e:
-        logger.error(f"Error getting streaming status: {str(e)}")
+        logger.error("Error getting streaming status: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to get streaming service status"
@@ -247,7 +265,7 @@ async def broadcast_system_message(
         
         await streaming_service.broadcast_system_message(message, message_type)
         
-        logger.info(f"System message broadcasted by user {current_user['uid']}: {message}")
+        logger.info("System message broadcasted by user %s: %s", current_user['uid'], message)
         
         return ApiResponse(
             success=True,
@@ -260,7 +278,7 @@ async def broadcast_system_message(
         )
         
     except Exception as e:
-        logger.error(f"Error broadcasting system message: {str(e)}")
+        logger.error("Error broadcasting system message: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to broadcast system message"
@@ -293,7 +311,7 @@ async def disconnect_user(
         
         await streaming_service.disconnect_user(user_id)
         
-        logger.info(f"User {user_id} disconnected by {current_user['uid']}")
+        logger.info("User %s disconnected by %s", user_id, current_user['uid'])
         
         return ApiResponse(
             success=True,
@@ -302,7 +320,7 @@ async def disconnect_user(
         )
         
     except Exception as e:
-        logger.error(f"Error disconnecting user {user_id}: {str(e)}")
+        logger.error("Error disconnecting user %s: %s", user_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to disconnect user"
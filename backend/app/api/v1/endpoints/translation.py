@@ -12,8 +12,9 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
+from ....core.responses import envelope_response
 from ....core.security import require_auth
 from ....models.base import ApiResponse
 
@@ -49,6 +50,8 @@ class SupportedLanguage(BaseModel):
     name: str = Field(..., description="Language name")
     native_name: Optional[str] = Field(default=None, description="Native language name")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class LanguageDetectionResponse(BaseModel):
     """Language detection response."""
@@ -56,6 +59,26 @@ class LanguageDetectionResponse(BaseModel):
     confidence: float = Field(..., description="Detection confidence")
 
 
+# Supported languages served by /languages. Validated once at import;
+# SupportedLanguage is frozen, so the same instances are shared by every
+# response.
+_SUPPORTED_LANGUAGES: List[SupportedLanguage] = TypeAdapter(List[SupportedLanguage]).validate_python([
+    {"code": "auto", "name": "Auto-detect"},
+    {"code": "en", "name": "English"},
+    {"code": "es", "name": "Spanish"},
+    {"code": "fr", "name": "French"},
+    {"code": "de", "name": "German"},
+    {"code": "it", "name": "Italian"},
+    {"code": "pt", "name": "Portuguese"},
+    {"code": "ru", "name": "Russian"},
+    {"code": "ja", "name": "Japanese"},
+    {"code": "ko", "name": "Korean"},
+    {"code": "zh", "name": "Chinese"},
+    {"code": "ar", "name": "Arabic"},
+    {"code": "hi", "name": "Hindi"}
+])
+
+
 class TranslationHistoryItem(BaseModel):
     """Translation history item."""
     id: str = Field(..., description="Translation ID")
@@ -68,7 +91,10 @@ class TranslationHistoryItem(BaseModel):
 
 
 # Translation Endpoints
-@router.post("/translate", response_model=ApiResponse[TranslationResponse])
+@router.post(
+    "/translate",
+    responses={200: {"model": ApiResponse[TranslationResponse]}}
+)
 async def translate_text(
     request: TranslationRequest,
     current_user: dict = Depends(require_auth)
@@ -81,8 +107,8 @@ async def translate_text(
     try:
         logger.info(f"Translating text to {request.target_language}: {request.text[:100]}...")
         
-        # Mock translation for now
-        response_data = TranslationResponse(
+        # Mock translation for now; every field is built here, so skip validation
+        response_data = TranslationResponse.model_construct(
             original_text=request.text,
             translated_text=f"[Translated to {request.target_language}] {request.text}",
             source_language=request.source_language or "auto",
@@ -95,11 +121,11 @@ async def translate_text(
             created_at=datetime.utcnow().isoformat()
         )
         
-        return ApiResponse(
+        return envelope_response(ApiResponse(
             success=True,
             data=response_data,
             message="Translation completed successfully"
-        )
+        ))
         
     except Exception as e:
         logger.error(f"Translation error: {str(e)}")
@@ -110,7 +136,10 @@ async def translate_text(
 
 
 # Language Detection
-@router.post("/detect", response_model=ApiResponse[LanguageDetectionResponse])
+@router.post(
+    "/detect",
+    responses={200: {"model": ApiResponse[LanguageDetectionResponse]}}
+)
 async def detect_language_simple(
     request: dict,
     current_user: dict = Depends(require_auth)
@@ -141,11 +170,11 @@ async def detect_language_simple(
             confidence=mock_result["confidence"],
         )
         
-        return ApiResponse(
+        return envelope_response(ApiResponse(
             success=True,
             data=response_data,
             message=f"Language detected: {mock_result['language']} (confidence: {mock_result['confidence']:.2f})"
-        )
+        ))
         
     except Exception as e:
         logger.error(f"Language detection error: {str(e)}")
@@ -156,7 +185,10 @@ async def detect_language_simple(
 
 
 # Language Management
-@router.get("/languages", response_model=ApiResponse[List[SupportedLanguage]])
+@router.get(
+    "/languages",
+    responses={200: {"model": ApiResponse[List[SupportedLanguage]]}}
+)
 async def get_languages(
     target_language: str = Query(default="en", description="Language for language names"),
     current_user: dict = Depends(require_auth)
@@ -169,32 +201,11 @@ async def get_languages(
     """
     try:
         # Return mock data for now since translation service might not be available
-        mock_languages = [
-            {"code": "auto", "name": "Auto-detect"},
-            {"code": "en", "name": "English"},
-            {"code": "es", "name": "Spanish"},
-            {"code": "fr", "name": "French"},
-            {"code": "de", "name": "German"},
-            {"code": "it", "name": "Italian"},
-            {"code": "pt", "name": "Portuguese"},
-            {"code": "ru", "name": "Russian"},
-            {"code": "ja", "name": "Japanese"},
-            {"code": "ko", "name": "Korean"},
-            {"code": "zh", "name": "Chinese"},
-            {"code": "ar", "name": "Arabic"},
-            {"code": "hi", "name": "Hindi"}
-        ]
-        
-        response_data = [
-            SupportedLanguage(code=lang["code"], name=lang["name"])
-            for lang in mock_languages
-        ]
-        
-        return ApiResponse(
+        return envelope_response(ApiResponse(
             success=True,
-            data=response_data,
-            message=f"Retrieved {len(response_data)} supported languages"
-        )
+            data=_SUPPORTED_LANGUAGES,
+            message=f"Retrieved {len(_SUPPORTED_LANGUAGES)} supported languages"
+        ))
         
     except Exception as e:
         logger.error(f"Error getting supported languages: {str(e)}")
@@ -205,7 +216,10 @@ async def get_languages(
 
 
 # Translation History
-@router.get("/history", response_model=ApiResponse[List[TranslationHistoryItem]])
+@router.get(
+    "/history",
+    responses={200: {"model": ApiResponse[List[TranslationHistoryItem]]}}
+)
 async def get_translation_history(
     limit: int = Query(default=50, ge=1, le=100, description="Maximum number of items"),
     current_user: dict = Depends(require_auth)
@@ -246,11 +260,11 @@ async def get_translation_history(
             for item in limited_history
         ]
         
-        return ApiResponse(
+        return envelope_response(ApiResponse(
             success=True,
             data=response_data,
             message=f"Retrieved {len(response_data)} translation history items"
-        )
+        ))
         
     except Exception as e:
         logger.error(f"Error getting translation history: {str(e)}")
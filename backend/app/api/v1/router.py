@@ -9,6 +9,16 @@ from .endpoints import health
 # Create main API router
 api_router = APIRouter()
 
+# Lifespan contexts of the included endpoint modules, entered by the app
+service_lifespans = []
+
+# Publish queued error reports in the background while the app runs
+try:
+    from ...monitoring.error_reporting import error_report_publishing
+    service_lifespans.append(error_report_publishing)
+except ImportError:
+    pass  # Error reporting not available in minimal mode
+
 # Include endpoint routers
 api_router.include_router(
     health.router,
@@ -95,6 +105,7 @@ try:
         prefix="/jurisdiction",
         tags=["jurisdiction"]
     )
+    service_lifespans.append(jurisdiction.jurisdiction_services)
 except ImportError:
     pass  # Jurisdiction endpoints not available in minimal mode
 
@@ -106,6 +117,7 @@ try:
         prefix="/pii",
         tags=["pii"]
     )
+    service_lifespans.append(pii.pii_audit_logging)
 except ImportError:
     pass  # PII endpoints not available in minimal mode
 
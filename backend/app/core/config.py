@@ -107,6 +107,7 @@ class Settings(BaseSettings):
     
     # File Upload Limits
     MAX_FILE_SIZE_BYTES: int = Field(default=50 * 1024 * 1024)  # 50MB
+    MAX_AUDIO_BYTES: int = Field(default=50 * 1024 * 1024)  # 50MB
     ALLOWED_FILE_TYPES: List[str] = Field(
         default=[
             "application/pdf",
@@ -0,0 +1,31 @@
+"""
+Response classes shared by API endpoints.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+
+class OrjsonResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Intended for routes without a response model; routes that declare one
+    are already serialized by Pydantic and should keep the default class.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def envelope_response(envelope: BaseModel) -> Response:
+    """
+    Serialize a response envelope in a single Pydantic pass.
+    
+    Returning a Response skips FastAPI's re-validation of the already
+    typed envelope against a response model.
+    """
+    return Response(content=envelope.model_dump_json(), media_type="application/json")
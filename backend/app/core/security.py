@@ -2,11 +2,13 @@
 Security utilities and authentication middleware.
 """
 
+import asyncio
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from functools import wraps
 
 from fastapi import HTTPException, Request, Depends
+from fastapi.responses import JSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import structlog
 
@@ -73,6 +75,34 @@ class RateLimiter:
 # Global rate limiter instance
 rate_limiter = RateLimiter()
 
+# User returned in development mode when Firebase is not available
+_DEV_USER: Dict[str, Any] = {
+    "uid": "dev-user",
+    "email": "dev@example.com",
+    "name": "Development User",
+    "email_verified": True
+}
+
+# Seconds a verified token's user is reused, never past the token's expiry
+TOKEN_CACHE_TTL = 300.0
+
+# Maximum number of verified tokens remembered
+MAX_CACHED_TOKENS = 10_000
+
+# Verified tokens, oldest first: token -> (expires_at, user)
+_verified_tokens: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+def _user_from_claims(decoded_token: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the user information dict from decoded Firebase token claims."""
+    return {
+        "uid": decoded_token.get("uid"),
+        "email": decoded_token.get("email"),
+        "name": decoded_token.get("name"),
+        "email_verified": decoded_token.get("email_verified", False),
+        "firebase_claims": decoded_token
+    }
+
 
 async def verify_firebase_token(credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)) -> Optional[Dict[str, Any]]:
     """
@@ -90,28 +120,14 @@ async def verify_firebase_token(credentials: Optional[HTTPAuthorizationCredentia
     if not FIREBASE_AVAILABLE:
         # In development mode without Firebase, return mock user
         if settings.DEBUG:
-            return {
-                "uid": "dev-user",
-                "email": "dev@example.com",
-                "name": "Development User",
-                "email_verified": True
-            }
+            return dict(_DEV_USER)
         return None
     
     if not credentials:
         return None
     
     try:
-        # Verify the ID token
-        decoded_token = auth.verify_id_token(credentials.credentials)
-        
-        return {
-            "uid": decoded_token.get("uid"),
-            "email": decoded_token.get("email"),
-            "name": decoded_token.get("name"),
-            "email_verified": decoded_token.get("email_verified", False),
-            "firebase_claims": decoded_token
-        }
+        return await _verify_cached(credentials.credentials)
     
     except auth.InvalidIdTokenError:
         raise HTTPException(
@@ -167,6 +183,64 @@ async def optional_auth(user: Optional[Dict[str, Any]] = Depends(verify_firebase
     return user
 
 
+async def _verify_cached(token: str) -> Dict[str, Any]:
+    """
+    Verify a Firebase ID token, reusing recent verifications of it.
+    
+    Verified users are cached for up to TOKEN_CACHE_TTL seconds and never
+    past the token's own expiry, so clients reusing a token skip the
+    signature check. Verification errors from Firebase propagate unchanged.
+    Callers must not mutate the returned user.
+    """
+    now = time.time()
+    cached = _verified_tokens.get(token)
+    if cached and cached[0] > now:
+        return cached[1]
+    
+    try:
+        # Verification may fetch Google's signing keys; keep it off the loop
+        decoded_token = await asyncio.to_thread(auth.verify_id_token, token)
+    except Exception:
+        _verified_tokens.pop(token, None)
+        raise
+    
+    user = _user_from_claims(decoded_token)
+    _verified_tokens.pop(token, None)
+    _verified_tokens[token] = (min(now + TOKEN_CACHE_TTL, decoded_token.get("exp", now)), user)
+    while len(_verified_tokens) > MAX_CACHED_TOKENS:
+        _verified_tokens.pop(next(iter(_verified_tokens)))
+    
+    return user
+
+
+async def verify_token_cached(token: str) -> Dict[str, Any]:
+    """
+    Verify a Firebase ID token, reusing recent verifications of it.
+    
+    Used where a token arrives outside an Authorization header, such as
+    WebSocket query parameters. Shares the verification cache used by
+    verify_firebase_token.
+    
+    Args:
+        token: Firebase ID token
+        
+    Returns:
+        User information dict
+        
+    Raises:
+        AuthenticationError: If the token cannot be verified
+    """
+    if not FIREBASE_AVAILABLE:
+        if settings.DEBUG:
+            return dict(_DEV_USER)
+        raise AuthenticationError("Authentication is not available")
+    
+    try:
+        return await _verify_cached(token)
+    except Exception as e:
+        raise AuthenticationError(f"Token verification failed: {str(e)}") from e
+
+
 def require_roles(*required_roles: str):
     """
     Decorator to require specific roles for endpoint access.
@@ -271,6 +345,97 @@ def get_user_context(user: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+# Allowance for multipart boundaries and form fields around an uploaded file
+UPLOAD_OVERHEAD_BYTES = 64 * 1024
+
+
+async def max_upload_size_middleware(request: Request, call_next):
+    """
+    Reject requests whose declared body exceeds the upload size limit.
+    
+    Runs before the body is read, so oversized uploads are refused without
+    being buffered. Bodies sent without Content-Length are left to the
+    endpoints' own size checks.
+    
+    Args:
+        request: FastAPI request object
+        call_next: Next middleware/endpoint
+        
+    Returns:
+        413 response if the body is too large, otherwise the next response
+    """
+    content_length = request.headers.get("content-length")
+    if (
+        content_length
+        and content_length.isdigit()
+        and int(content_length) > settings.MAX_FILE_SIZE_BYTES + UPLOAD_OVERHEAD_BYTES
+    ):
+        return JSONResponse(
+            status_code=413,
+            content={"detail": f"Request body exceeds the {settings.MAX_FILE_SIZE_BYTES} byte upload limit"}
+        )
+    
+    return await call_next(request)
+
+
+# Audio MIME types accepted for voice question uploads, without parameters
+ALLOWED_AUDIO_TYPES = frozenset((
+    "audio/aac",
+    "audio/flac",
+    "audio/m4a",
+    "audio/mp3",
+    "audio/mp4",
+    "audio/mpeg",
+    "audio/ogg",
+    "audio/wav",
+    "audio/wave",
+    "audio/webm",
+    "audio/x-m4a",
+    "audio/x-wav",
+))
+
+
+def check_audio_upload_length(request: Request) -> None:
+    """
+    Refuse an audio upload from its declared size before the body is read.
+    
+    Args:
+        request: FastAPI request object
+        
+    Raises:
+        HTTPException: 411 without a Content-Length, 413 if it exceeds
+            settings.MAX_AUDIO_BYTES plus the multipart overhead
+    """
+    content_length = request.headers.get("content-length")
+    if content_length is None or not content_length.isdigit():
+        raise HTTPException(status_code=411, detail="Content-Length header required")
+    if int(content_length) > settings.MAX_AUDIO_BYTES + UPLOAD_OVERHEAD_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Audio file exceeds the {settings.MAX_AUDIO_BYTES} byte limit"
+        )
+
+
+def check_audio_content_type(content_type: Optional[str]) -> None:
+    """
+    Refuse audio uploads outside ALLOWED_AUDIO_TYPES.
+    
+    MIME parameters such as the codec are ignored.
+    
+    Args:
+        content_type: Declared content type of the uploaded file
+        
+    Raises:
+        HTTPException: 415 if the type is not an accepted audio type
+    """
+    base_type = (content_type or "").split(";", 1)[0].strip().lower()
+    if base_type not in ALLOWED_AUDIO_TYPES:
+        raise HTTPException(
+            status_code=415,
+            detail=f"Unsupported audio type: {content_type}"
+        )
+
+
 async def security_headers_middleware(request: Request, call_next):
     """
     Add security headers to responses.
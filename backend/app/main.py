@@ -6,24 +6,32 @@ Main application entry point with middleware, routes, and configuration.
 
 import time
 import uuid
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 from typing import Optional
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 try:
     from app.core.config import settings
     from app.core.logging import setup_logging
-    from app.api.v1.router import api_router
+    from app.api.v1.router import api_router, service_lifespans
     from app.core.exceptions import LegalCompanionException
-    from app.core.security import rate_limit_middleware, security_headers_middleware
+    from app.core.security import (
+        check_audio_content_type,
+        check_audio_upload_length,
+        max_upload_size_middleware,
+        rate_limit_middleware,
+        security_headers_middleware,
+    )
+    from app.core.responses import OrjsonResponse
     import structlog
     FULL_FEATURES = True
 except ImportError:
     # Fallback for minimal setup
     FULL_FEATURES = False
+    OrjsonResponse = JSONResponse
     
     class Settings:
         DEBUG = True
@@ -50,7 +58,12 @@ async def lifespan(app: FastAPI):
     else:
         print("Legal Companion API starting up (minimal mode)")
     
-    yield
+    async with AsyncExitStack() as stack:
+        if FULL_FEATURES:
+            for service_lifespan in service_lifespans:
+                await stack.enter_async_context(service_lifespan(app))
+        
+        yield
     
     # Shutdown
     if FULL_FEATURES:
@@ -83,6 +96,7 @@ app.add_middleware(
 if FULL_FEATURES:
     app.middleware("http")(rate_limit_middleware)
     app.middleware("http")(security_headers_middleware)
+    app.middleware("http")(max_upload_size_middleware)
 
 
 @app.middleware("http")
@@ -365,9 +379,23 @@ async def upload_file_direct(job_id: str, request: Request):
             "error": f"Upload failed: {str(e)}"
         }
 
-@app.get("/v1/qa/sessions/{document_id}/history")
-async def get_qa_history_direct(document_id: str, session_id: str = "default"):
-    """Get real QA history for a document."""
+@app.get("/v1/qa/sessions/{document_id}/history", response_class=OrjsonResponse)
+async def get_qa_history_direct(
+    request: Request,
+    response: Response,
+    document_id: str,
+    session_id: str = "default",
+    limit: int = Query(default=50, ge=1, le=200, description="Maximum number of items"),
+    before: Optional[str] = Query(default=None, description="Return items older than this item ID")
+):
+    """
+    Get real QA history for a document.
+    
+    Returns the latest `limit` items, or the items preceding `before`
+    when paging back. Responses carry an ETag; pollers sending it back
+    in If-None-Match get a 304 while the page is unchanged.
+    """
+    import hashlib
     import json
     from pathlib import Path
     
@@ -385,23 +413,40 @@ async def get_qa_history_direct(document_id: str, session_id: str = "default"):
         except:
             history = []
     
+    # Page back from the `before` item, or from the latest item without one;
+    # an unknown cursor yields an empty page
+    end = len(history)
+    if before is not None:
+        end = next((index for index, item in enumerate(history) if item.get("id") == before), 0)
+    start = max(0, end - limit)
+    page = history[start:end]
+    has_more = start > 0
+    
+    page_key = "|".join([str(item.get("id")) for item in page] + [str(has_more)])
+    etag = f'"{hashlib.blake2b(page_key.encode(), digest_size=16).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    
     return {
         "success": True,
-        "history": history,
-        "session_id": session_id
+        "history": page,
+        "session_id": session_id,
+        "has_more": has_more
     }
 
-@app.post("/v1/qa/ask-voice")
+@app.post("/v1/qa/ask-voice", response_class=OrjsonResponse)
 async def ask_voice_question_direct(request: Request):
     """Process voice questions about documents with real analysis."""
-    import uuid
-    import json
-    from datetime import datetime
-    from pathlib import Path
+    # Refuse unsized or oversized uploads before the form is parsed
+    if FULL_FEATURES:
+        check_audio_upload_length(request)
     
     try:
         form = await request.form()
         audio_file = form.get("audio_file")
+        if FULL_FEATURES:
+            check_audio_content_type(getattr(audio_file, "content_type", None))
         document_id = form.get("document_id", "doc_1")
         session_id = form.get("session_id", "default")
         
@@ -414,57 +459,19 @@ async def ask_voice_question_direct(request: Request):
         # Generate answer based on document content
         answer_data = await generate_document_answer(question, document_content)
         
-        # Save to QA history
-        qa_item = {
-            "id": str(uuid.uuid4()),
-            "question": question,
-            "answer": answer_data["answer"],
-            "confidence": answer_data["confidence"],
-            "sources": answer_data["sources"],
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        
-        # Save to local storage
-        qa_dir = Path("uploads/qa")
-        qa_dir.mkdir(exist_ok=True)
-        
-        history_file = qa_dir / f"{document_id}_{session_id}.json"
-        history = []
-        
-        if history_file.exists():
-            try:
-                with open(history_file, 'r') as f:
-                    history = json.load(f)
-            except:
-                history = []
-        
-        history.append(qa_item)
-        
-        with open(history_file, 'w') as f:
-            json.dump(history, f, indent=2)
-        
-        return {
-            "success": True,
-            "answer": answer_data["answer"],
-            "confidence": answer_data["confidence"],
-            "sources": answer_data["sources"],
-            "session_id": session_id
-        }
+        return await save_qa_answer(document_id, session_id, question, answer_data)
         
+    except HTTPException:
+        raise
     except Exception as e:
         return {
             "success": False,
             "error": f"Voice processing failed: {str(e)}"
         }
 
-@app.post("/v1/qa/ask")
+@app.post("/v1/qa/ask", response_class=OrjsonResponse)
 async def ask_text_question(request: Request):
     """Ask a text question about a document."""
-    import uuid
-    import json
-    from datetime import datetime
-    from pathlib import Path
-    
     try:
         data = await request.json()
         question = data.get("question", "")
@@ -483,42 +490,7 @@ async def ask_text_question(request: Request):
         # Generate answer based on document content
         answer_data = await generate_document_answer(question, document_content)
         
-        # Save to QA history
-        qa_item = {
-            "id": str(uuid.uuid4()),
-            "question": question,
-            "answer": answer_data["answer"],
-            "confidence": answer_data["confidence"],
-            "sources": answer_data["sources"],
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        
-        # Save to local storage
-        qa_dir = Path("uploads/qa")
-        qa_dir.mkdir(exist_ok=True)
-        
-        history_file = qa_dir / f"{document_id}_{session_id}.json"
-        history = []
-        
-        if history_file.exists():
-            try:
-                with open(history_file, 'r') as f:
-                    history = json.load(f)
-            except:
-                history = []
-        
-        history.append(qa_item)
-        
-        with open(history_file, 'w') as f:
-            json.dump(history, f, indent=2)
-        
-        return {
-            "success": True,
-            "answer": answer_data["answer"],
-            "confidence": answer_data["confidence"],
-            "sources": answer_data["sources"],
-            "session_id": session_id
-        }
+        return await save_qa_answer(document_id, session_id, question, answer_data)
         
     except Exception as e:
         return {
@@ -746,6 +718,49 @@ async def update_document_metadata(document_id: str, updates: dict):
         except Exception as e:
             print(f"Error updating document metadata: {e}")
 
+async def save_qa_answer(document_id: str, session_id: str, question: str, answer_data: dict) -> dict:
+    """Append an answered question to the session history and build the response."""
+    import uuid
+    import json
+    from datetime import datetime
+    from pathlib import Path
+    
+    qa_item = {
+        "id": str(uuid.uuid4()),
+        "question": question,
+        "answer": answer_data["answer"],
+        "confidence": answer_data["confidence"],
+        "sources": answer_data["sources"],
+        "timestamp": datetime.utcnow().isoformat()
+    }
+    
+    # Save to local storage
+    qa_dir = Path("uploads/qa")
+    qa_dir.mkdir(exist_ok=True)
+    
+    history_file = qa_dir / f"{document_id}_{session_id}.json"
+    history = []
+    
+    if history_file.exists():
+        try:
+            with open(history_file, 'r') as f:
+                history = json.load(f)
+        except:
+            history = []
+    
+    history.append(qa_item)
+    
+    with open(history_file, 'w') as f:
+        json.dump(history, f, indent=2)
+    
+    return {
+        "success": True,
+        "answer": answer_data["answer"],
+        "confidence": answer_data["confidence"],
+        "sources": answer_data["sources"],
+        "session_id": session_id
+    }
+
 async def process_audio_to_text(audio_file) -> str:
     """Convert audio to text (simplified implementation)."""
     # For now, return a sample question
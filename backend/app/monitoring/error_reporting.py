@@ -8,13 +8,17 @@ Provides comprehensive error reporting including:
 - Error trend analysis and alerting
 """
 
+import asyncio
 import traceback
 import sys
+from contextlib import asynccontextmanager
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
 
+from fastapi import FastAPI
+
 try:
     from google.cloud import error_reporting
     from google.cloud import logging
@@ -28,6 +32,12 @@ from ..core.config import get_settings
 
 settings = get_settings()
 
+# Pending reports kept before the oldest are dropped
+MAX_QUEUED_ERRORS = 10_000
+
+# Reports published per drain iteration
+ERROR_BATCH_SIZE = 500
+
 
 class ErrorSeverity(Enum):
     """Error severity levels."""
@@ -82,6 +92,10 @@ class ErrorReporter:
         # Error tracking
         self._error_history: List[ErrorReport] = []
         self._error_patterns: Dict[str, int] = {}
+        
+        # Reports waiting to be published by the drain loop
+        self._queue: Optional[asyncio.Queue] = None
+        self._drain_task: Optional[asyncio.Task] = None
     
     async def report_error(
         self,
@@ -92,6 +106,30 @@ class ErrorReporter:
         severity: Optional[ErrorSeverity] = None
     ) -> str:
         """Report an error with context."""
+        return self.enqueue(
+            error=error,
+            context=context,
+            user_id=user_id,
+            request_id=request_id,
+            severity=severity
+        )
+    
+    def enqueue(
+        self,
+        error: Exception,
+        context: Optional[Dict[str, Any]] = None,
+        user_id: Optional[str] = None,
+        request_id: Optional[str] = None,
+        severity: Optional[ErrorSeverity] = None
+    ) -> str:
+        """
+        Record an error and queue it for publishing without blocking.
+        
+        The report is added to the in-memory history immediately; delivery
+        to Cloud Error Reporting, Cloud Logging and metrics happens in
+        batches on a background task. When the queue is full the oldest
+        pending report is dropped.
+        """
         # Generate error ID
         error_id = f"error_{datetime.utcnow().timestamp()}"
         
@@ -125,16 +163,62 @@ class ErrorReporter:
         error_pattern = f"{type(error).__name__}:{category.value}"
         self._error_patterns[error_pattern] = self._error_patterns.get(error_pattern, 0) + 1
         
-        # Report to Cloud Error Reporting
-        await self._report_to_cloud(error_report)
+        # Queue for publishing
+        self.start_reporting()
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(error_report)
         
-        # Log structured error
-        await self._log_structured_error(error_report)
+        return error_id
+    
+    def start_reporting(self):
+        """Start the background task that publishes queued reports."""
+        if self._drain_task is not None and not self._drain_task.done():
+            return
+        
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=MAX_QUEUED_ERRORS)
+        self._drain_task = asyncio.get_running_loop().create_task(self._drain_loop())
+    
+    async def stop_reporting(self):
+        """Publish pending reports and stop the background task."""
+        if self._drain_task is None:
+            return
         
-        # Record metrics
-        await self._record_error_metrics(error_report)
+        self._drain_task.cancel()
+        try:
+            await self._drain_task
+        except asyncio.CancelledError:
+            pass
+        self._drain_task = None
+        
+        batch = []
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        if batch:
+            await self._publish_batch(batch)
+    
+    async def _drain_loop(self):
+        """Publish queued reports in batches."""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < ERROR_BATCH_SIZE and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            
+            try:
+                await self._publish_batch(batch)
+            except Exception as e:
+                print(f"Failed to publish error batch: {e}")
+    
+    async def _publish_batch(self, batch: List[ErrorReport]):
+        """Publish a batch of error reports."""
+        for error_report in batch:
+            await self._report_to_cloud(error_report)
         
-        return error_id
+        await self._log_structured_errors(batch)
+        
+        for error_report in batch:
+            await self._record_error_metrics(error_report)
     
     async def get_error_summary(
         self,
@@ -286,25 +370,26 @@ class ErrorReporter:
         except Exception as e:
             print(f"Failed to report error to Cloud Error Reporting: {e}")
     
-    async def _log_structured_error(self, error_report: ErrorReport):
-        """Log structured error data."""
-        log_entry = {
-            "error_id": error_report.error_id,
-            "timestamp": error_report.timestamp.isoformat(),
-            "message": error_report.message,
-            "category": error_report.category.value,
-            "severity": error_report.severity.value,
-            "stack_trace": error_report.stack_trace,
-            "context": error_report.context,
-            "user_id": error_report.user_id,
-            "request_id": error_report.request_id,
-            "type": "error"
-        }
-        
+    async def _log_structured_errors(self, batch: List[ErrorReport]):
+        """Log structured error data in a single Cloud Logging request."""
         try:
-            self.logger.log_struct(log_entry, severity=error_report.severity.value.upper())
+            with self.logger.batch() as log_batch:
+                for error_report in batch:
+                    log_entry = {
+                        "error_id": error_report.error_id,
+                        "timestamp": error_report.timestamp.isoformat(),
+                        "message": error_report.message,
+                        "category": error_report.category.value,
+                        "severity": error_report.severity.value,
+                        "stack_trace": error_report.stack_trace,
+                        "context": error_report.context,
+                        "user_id": error_report.user_id,
+                        "request_id": error_report.request_id,
+                        "type": "error"
+                    }
+                    log_batch.log_struct(log_entry, severity=error_report.severity.value.upper())
         except Exception as e:
-            print(f"Failed to log structured error: {e}")
+            print(f"Failed to log structured errors: {e}")
     
     async def _record_error_metrics(self, error_report: ErrorReport):
         """Record error metrics to monitoring."""
@@ -323,4 +408,18 @@ class ErrorReporter:
 
 
 # Singleton instance
-error_reporter = ErrorReporter() if ERROR_REPORTING_AVAILABLE else None
\ No newline at end of file
+error_reporter = ErrorReporter() if ERROR_REPORTING_AVAILABLE else None
+
+
+@asynccontextmanager
+async def error_report_publishing(app: FastAPI):
+    """Publish queued error reports for the lifetime of the application."""
+    if error_reporter is None:
+        yield
+        return
+    
+    error_reporter.start_reporting()
+    try:
+        yield
+    finally:
+        await error_reporter.stop_reporting()
\ No newline at end of file
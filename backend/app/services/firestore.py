@@ -4,7 +4,7 @@ Firestore database service for document and job management.
 
 import uuid
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence
 from uuid import UUID
 
 from google.cloud import firestore
@@ -12,13 +12,16 @@ from google.cloud.exceptions import GoogleCloudError, NotFound
 from google.api_core import exceptions as gcp_exceptions
 
 from app.core.config import settings
-from app.models.document import Document, ProcessedDocument, Clause
+from app.models.document import Document, ProcessedDocument, Clause, RiskAssessment
 from app.models.job import Job, JobProgress, JobResults
 from app.models.user import User
 import structlog
 
 logger = structlog.get_logger()
 
+# Processed document fields read by clause-level analysis
+PROCESSED_DOCUMENT_ANALYSIS_FIELDS = ("structured_text", "clauses", "updated_at")
+
 
 class FirestoreService:
     """Service for Firestore database operations."""
@@ -182,6 +185,48 @@ class FirestoreService:
             )
             raise
     
+    async def get_processed_document_slim(
+        self,
+        document_id: UUID,
+        user_id: str,
+        fields: Sequence[str] = PROCESSED_DOCUMENT_ANALYSIS_FIELDS
+    ) -> Optional[ProcessedDocument]:
+        """
+        Get a processed document reading only the requested fields.
+        
+        Uses a Firestore field projection so large fields such as
+        translations and exports are not transferred. The result is built
+        without full model validation; callers may only rely on the
+        requested fields.
+        """
+        try:
+            field_paths = list(dict.fromkeys(("user_id", *fields)))
+            doc = await self.documents_collection.document(str(document_id)).get(
+                field_paths=field_paths
+            )
+            
+            if not doc.exists:
+                return None
+            
+            doc_data = doc.to_dict()
+            if doc_data.get("user_id") != user_id:
+                return None
+            
+            if "clauses" in doc_data:
+                doc_data["clauses"] = [Clause(**clause) for clause in doc_data["clauses"] or []]
+            if doc_data.get("risk_assessment"):
+                doc_data["risk_assessment"] = RiskAssessment(**doc_data["risk_assessment"])
+            
+            return ProcessedDocument.model_construct(id=document_id, **doc_data)
+            
+        except GoogleCloudError as e:
+            logger.error(
+                "Failed to get processed document",
+                document_id=str(document_id),
+                error=str(e)
+            )
+            raise
+    
     async def get_user_documents(
         self,
         user_id: str,
@@ -456,6 +501,32 @@ class FirestoreService:
             )
             raise
     
+    # Audit operations
+    async def create_pii_audit_logs(self, entries: Sequence[Dict[str, Any]]) -> List[str]:
+        """Create multiple PII audit log records in batch."""
+        try:
+            batch = self.client.batch()
+            audit_collection = self.client.collection("pii_audit_logs")
+            audit_ids = []
+            
+            for entry in entries:
+                doc_ref = audit_collection.document()
+                batch.set(doc_ref, entry)
+                audit_ids.append(doc_ref.id)
+            
+            await batch.commit()
+            
+            logger.info("PII audit logs created successfully", count=len(entries))
+            return audit_ids
+            
+        except GoogleCloudError as e:
+            logger.error(
+                "Failed to create PII audit logs",
+                count=len(entries),
+                error=str(e)
+            )
+            raise
+    
     # Real-time listeners
     def listen_to_job_updates(
         self,
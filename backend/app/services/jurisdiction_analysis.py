@@ -11,7 +11,7 @@ This service handles:
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, AsyncIterator
 from datetime import datetime
 from uuid import UUID
 
@@ -39,7 +39,9 @@ class JurisdictionAnalysisService:
         
         # Cache for jurisdiction contexts to avoid repeated queries
         self._context_cache = {}
-        self._cache_ttl = 3600  # 1 hour cache TTL
+        self._cache_ttl = 3600  # 1 hour cache TTL for text-specific contexts
+        self._general_cache_ttl = 86400  # 24 hour cache TTL for general contexts
+        self._max_cache_entries = 256
     
     async def enhance_document_analysis(
         self,
@@ -142,14 +144,14 @@ class JurisdictionAnalysisService:
             # Determine legal area from document
             legal_area = self._determine_document_legal_area(processed_doc)
             
-            # Analyze conflicts
-            conflict_analysis = await self.jurisdiction_agent.get_jurisdiction_conflicts(
-                primary_jurisdiction, secondary_jurisdictions, legal_area
-            )
-            
-            # Analyze clause-specific conflicts
-            clause_conflicts = await self._analyze_clause_jurisdiction_conflicts(
-                processed_doc.clauses, jurisdictions, user_role
+            # Analyze general and clause-specific conflicts concurrently
+            conflict_analysis, clause_conflicts = await asyncio.gather(
+                self.jurisdiction_agent.get_jurisdiction_conflicts(
+                    primary_jurisdiction, secondary_jurisdictions, legal_area
+                ),
+                self._analyze_clause_jurisdiction_conflicts(
+                    processed_doc.clauses, jurisdictions, user_role
+                )
             )
             
             # Generate comprehensive recommendations
@@ -172,6 +174,66 @@ class JurisdictionAnalysisService:
             logger.error(f"Multi-jurisdiction conflict analysis failed: {str(e)}")
             raise AnalysisError(f"Conflict analysis failed: {str(e)}") from e
     
+    async def aiter_multi_jurisdiction_conflicts(
+        self,
+        processed_doc: ProcessedDocument,
+        jurisdictions: List[str],
+        user_role: UserRole
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream multi-jurisdiction conflict analysis record by record.
+        
+        Yields a "header" record with the general conflicts, one
+        "clause_conflict" record per conflicting clause as it is analyzed,
+        and a closing "summary" record with recommendations and risk level.
+        
+        Args:
+            processed_doc: Processed document to analyze
+            jurisdictions: List of jurisdictions to compare (at least two)
+            user_role: User's role for analysis perspective
+            
+        Yields:
+            Conflict analysis records
+        """
+        try:
+            logger.info(f"Streaming multi-jurisdiction conflicts: {jurisdictions}")
+            
+            primary_jurisdiction = jurisdictions[0]
+            secondary_jurisdictions = jurisdictions[1:]
+            legal_area = self._determine_document_legal_area(processed_doc)
+            
+            conflict_analysis = await self.jurisdiction_agent.get_jurisdiction_conflicts(
+                primary_jurisdiction, secondary_jurisdictions, legal_area
+            )
+            
+            yield {
+                "type": "header",
+                "primary_jurisdiction": primary_jurisdiction,
+                "secondary_jurisdictions": secondary_jurisdictions,
+                "legal_area": legal_area,
+                "general_conflicts": conflict_analysis.get("conflicts", [])
+            }
+            
+            clause_conflicts = []
+            async for clause_conflict in self._iter_clause_jurisdiction_conflicts(
+                processed_doc.clauses, jurisdictions, user_role
+            ):
+                clause_conflicts.append(clause_conflict)
+                yield {"type": "clause_conflict", **clause_conflict}
+            
+            yield {
+                "type": "summary",
+                "recommendations": self._generate_multi_jurisdiction_recommendations(
+                    conflict_analysis, clause_conflicts, jurisdictions
+                ),
+                "risk_level": self._assess_conflict_risk_level(conflict_analysis, clause_conflicts),
+                "analysis_timestamp": datetime.utcnow().isoformat()
+            }
+            
+        except Exception as e:
+            logger.error(f"Multi-jurisdiction conflict streaming failed: {str(e)}")
+            raise AnalysisError(f"Conflict analysis failed: {str(e)}") from e
+    
     async def get_jurisdiction_safe_alternatives(
         self,
         clause: Clause,
@@ -313,24 +375,49 @@ class JurisdictionAnalysisService:
         sample_text: Optional[str] = None
     ) -> Dict[str, Any]:
         """Get jurisdiction context with caching."""
-        cache_key = f"{jurisdiction}:{hash(sample_text) if sample_text else 'general'}"
-        
-        # Check cache
-        if cache_key in self._context_cache:
-            cached_data = self._context_cache[cache_key]
-            if (datetime.utcnow() - cached_data["timestamp"]).seconds < self._cache_ttl:
-                return cached_data["context"]
-        
-        # Get fresh context
         legal_area = None
         if sample_text:
             legal_area = self.jurisdiction_agent._determine_legal_area(sample_text)
         
+        return await self.get_cached_context(jurisdiction, legal_area, sample_text)
+    
+    async def get_cached_context(
+        self,
+        jurisdiction: str,
+        legal_area: Optional[str] = None,
+        sample_text: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get jurisdiction context, reusing results cached in this process.
+        
+        General contexts are cached for 24 hours; contexts built for a
+        specific sample text expire after 1 hour.
+        
+        Args:
+            jurisdiction: Target jurisdiction
+            legal_area: Optional legal area
+            sample_text: Optional sample text for context
+            
+        Returns:
+            Jurisdiction context
+        """
+        cache_key = (jurisdiction, legal_area, hash(sample_text) if sample_text else None)
+        ttl = self._cache_ttl if sample_text else self._general_cache_ttl
+        
+        # Check cache
+        cached_data = self._context_cache.get(cache_key)
+        if cached_data and (datetime.utcnow() - cached_data["timestamp"]).total_seconds() < ttl:
+            return cached_data["context"]
+        
+        # Get fresh context
         context = await self.jurisdiction_agent.get_jurisdiction_context(
             jurisdiction, legal_area, sample_text
         )
         
-        # Cache the result
+        # Cache the result, evicting the oldest entry when full
+        self._context_cache.pop(cache_key, None)
+        if len(self._context_cache) >= self._max_cache_entries:
+            self._context_cache.pop(next(iter(self._context_cache)))
         self._context_cache[cache_key] = {
             "context": context,
             "timestamp": datetime.utcnow()
@@ -459,36 +546,47 @@ class JurisdictionAnalysisService:
         user_role: UserRole
     ) -> List[Dict[str, Any]]:
         """Analyze jurisdiction conflicts for specific clauses."""
-        clause_conflicts = []
-        
+        return [
+            clause_conflict
+            async for clause_conflict in self._iter_clause_jurisdiction_conflicts(
+                clauses, jurisdictions, user_role
+            )
+        ]
+    
+    async def _iter_clause_jurisdiction_conflicts(
+        self,
+        clauses: List[Clause],
+        jurisdictions: List[str],
+        user_role: UserRole
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield jurisdiction conflicts for specific clauses as they are found."""
         # Analyze a sample of clauses to avoid performance issues
         sample_clauses = clauses[:5] if len(clauses) > 5 else clauses
         
         for clause in sample_clauses:
             try:
-                # Get compliance analysis for each jurisdiction
-                jurisdiction_analyses = {}
-                for jurisdiction in jurisdictions:
-                    compliance = await self.jurisdiction_agent.analyze_clause_jurisdiction_compliance(
+                # Get compliance analysis for all jurisdictions concurrently
+                compliances = await asyncio.gather(*(
+                    self.jurisdiction_agent.analyze_clause_jurisdiction_compliance(
                         clause, jurisdiction, user_role
                     )
-                    jurisdiction_analyses[jurisdiction] = compliance
+                    for jurisdiction in jurisdictions
+                ))
+                jurisdiction_analyses = dict(zip(jurisdictions, compliances))
                 
                 # Identify conflicts
                 conflicts = self._identify_clause_conflicts(clause, jurisdiction_analyses)
                 
-                if conflicts:
-                    clause_conflicts.append({
-                        "clause_text": clause.text[:200] + "..." if len(clause.text) > 200 else clause.text,
-                        "conflicts": conflicts,
-                        "jurisdictions": jurisdictions
-                    })
-                    
             except Exception as e:
                 logger.warning(f"Failed to analyze clause jurisdiction conflicts: {str(e)}")
                 continue
-        
-        return clause_conflicts
+            
+            if conflicts:
+                yield {
+                    "clause_text": clause.text[:200] + "..." if len(clause.text) > 200 else clause.text,
+                    "conflicts": conflicts,
+                    "jurisdictions": jurisdictions
+                }
     
     def _identify_clause_conflicts(
         self,
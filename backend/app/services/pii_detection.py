@@ -10,11 +10,13 @@ This service handles:
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Tuple, Union
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime
 import json
 import re
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 
 # Optional Google Cloud imports
 try:
@@ -33,6 +35,23 @@ from ..services.firestore import FirestoreService
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Maximum number of audit entries waiting to be written
+MAX_QUEUED_AUDIT_ENTRIES = 10_000
+
+# Maximum number of audit entries written in one Firestore batch
+AUDIT_BATCH_SIZE = 100
+
+# Longest a queued audit entry waits for its batch to fill, in seconds
+AUDIT_FLUSH_INTERVAL = 0.05
+
+# Size of the text windows sent to DLP when scanning streamed content,
+# well under the DLP inspect request limit
+STREAM_WINDOW_CHARS = 100_000
+
+# Characters shared by consecutive windows so PII spanning a window
+# boundary is still seen whole
+STREAM_WINDOW_OVERLAP = 512
+
 
 class PIIType(str, Enum):
     """Types of PII that can be detected."""
@@ -60,26 +79,77 @@ class MaskingType(str, Enum):
     PARTIAL = "partial"  # Show only partial (e.g., first 2 and last 2 chars)
 
 
+# Info types that cannot match content without a digit or an "@"
+_DIGIT_INFO_TYPES = frozenset(info_type.value for info_type in (
+    PIIType.PHONE_NUMBER,
+    PIIType.SSN,
+    PIIType.CREDIT_CARD,
+    PIIType.DATE_OF_BIRTH,
+    PIIType.PASSPORT,
+    PIIType.DRIVER_LICENSE,
+    PIIType.BANK_ACCOUNT,
+    PIIType.IP_ADDRESS,
+    PIIType.TAX_ID,
+))
+_AT_INFO_TYPES = frozenset({PIIType.EMAIL_ADDRESS.value})
+_DIGIT_RE = re.compile(r"\d")
+
+
+def _prefilter_info_types(content: str, info_types: List[str]) -> List[str]:
+    """
+    Drop info types whose trigger characters do not occur in the content.
+    
+    Both checks run in C, so this is far cheaper than sending info types
+    to DLP that cannot produce a finding.
+    """
+    excluded = set()
+    if _DIGIT_RE.search(content) is None:
+        excluded |= _DIGIT_INFO_TYPES
+    if "@" not in content:
+        excluded |= _AT_INFO_TYPES
+    if not excluded:
+        return list(info_types)
+    return [
+        info_type for info_type in info_types
+        if getattr(info_type, "value", info_type) not in excluded
+    ]
+
+
+@lru_cache(maxsize=64)
+def _build_inspect_config(info_types: Tuple[str, ...], min_likelihood: str) -> Dict[str, Any]:
+    """
+    Build the DLP inspect configuration for a set of info types.
+    
+    Configurations are cached per (info_types, min_likelihood) and shared
+    between requests, so callers must not mutate the returned dict.
+    """
+    return {
+        "info_types": [{"name": info_type} for info_type in info_types],
+        "min_likelihood": min_likelihood,
+        "include_quote": True,
+        "limits": {
+            "max_findings_per_info_type": 100,
+            "max_findings_per_request": 1000
+        }
+    }
+
+
+@dataclass(slots=True)
 class PIIFinding:
-    """Represents a PII finding from DLP analysis."""
+    """
+    Represents a PII finding from DLP analysis.
     
-    def __init__(
-        self,
-        info_type: str,
-        likelihood: str,
-        start_offset: int,
-        end_offset: int,
-        original_text: str,
-        confidence: float = 0.0
-    ):
-        self.info_type = info_type
-        self.likelihood = likelihood
-        self.start_offset = start_offset
-        self.end_offset = end_offset
-        self.original_text = original_text
-        self.confidence = confidence
-        self.masked_text = ""
-        self.masking_type = MaskingType.MASK
+    Findings are dataclasses so API responses can hand them to orjson
+    directly instead of building a dict per finding.
+    """
+    info_type: str
+    likelihood: str
+    start_offset: int
+    end_offset: int
+    original_text: str
+    confidence: float = 0.0
+    masked_text: str = field(default="", init=False)
+    masking_type: MaskingType = field(default=MaskingType.MASK, init=False)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert finding to dictionary."""
@@ -105,6 +175,11 @@ class PIIDetectionService:
     
     def __init__(self):
         """Initialize the PII detection service."""
+        # Audit entries waiting for a batched background write
+        self._audit_queue: Optional[asyncio.Queue] = None
+        self._audit_task: Optional[asyncio.Task] = None
+        self.dropped_audit_entries = 0
+        
         if not GOOGLE_CLOUD_AVAILABLE:
             logger.warning("Google Cloud libraries not available - PII detection functionality disabled")
             self.dlp_client = None
@@ -128,6 +203,7 @@ class PIIDetectionService:
         # Project configuration
         self.project_id = settings.DLP_PROJECT_ID or settings.GOOGLE_CLOUD_PROJECT
         self.location = settings.DLP_LOCATION
+        self.parent = f"projects/{self.project_id}/locations/{self.location}"
         
         # Default info types to detect
         self.default_info_types = [
@@ -179,27 +255,23 @@ class PIIDetectionService:
             if info_types is None:
                 info_types = self.default_info_types
             
+            # Skip the DLP call entirely when nothing left could match
+            info_types = _prefilter_info_types(content, info_types)
+            if not info_types or content.isspace():
+                return []
+            
             # Build DLP request
-            inspect_config = {
-                "info_types": [{"name": info_type} for info_type in info_types],
-                "min_likelihood": min_likelihood,
-                "include_quote": True,
-                "limits": {
-                    "max_findings_per_info_type": 100,
-                    "max_findings_per_request": 1000
-                }
-            }
+            inspect_config = _build_inspect_config(tuple(info_types), min_likelihood)
             
             # Create content item
             item = {"value": content}
             
-            # Build parent path
-            parent = f"projects/{self.project_id}/locations/{self.location}"
-            
-            # Call DLP API
-            response = self.dlp_client.inspect_content(
+            # Call DLP API; the client is synchronous, so run it in a worker
+            # thread to keep the event loop free while the request is in flight
+            response = await asyncio.to_thread(
+                self.dlp_client.inspect_content,
                 request={
-                    "parent": parent,
+                    "parent": self.parent,
                     "inspect_config": inspect_config,
                     "item": item
                 }
@@ -228,6 +300,61 @@ class PIIDetectionService:
             logger.error(f"Unexpected error in PII detection: {e}")
             raise PIIDetectionError(f"PII detection failed: {e}")
     
+    async def detect_pii_stream(
+        self,
+        chunks: AsyncIterator[str],
+        info_types: Optional[List[str]] = None,
+        min_likelihood: str = "POSSIBLE"
+    ) -> List[PIIFinding]:
+        """
+        Detect PII in text that arrives in chunks.
+        
+        Text is scanned in overlapping windows as it arrives, so only about
+        one window is held in memory regardless of the total size.
+        
+        Args:
+            chunks: Text chunks in document order
+            info_types: Specific PII types to detect (uses defaults if None)
+            min_likelihood: Minimum likelihood threshold
+            
+        Returns:
+            List of PII findings with offsets into the whole text
+        """
+        findings = []
+        seen = set()
+        buffer = ""
+        base_offset = 0
+        scanned_to = 0
+        
+        async def scan(window: str):
+            window_findings = await self.detect_pii(
+                content=window,
+                info_types=info_types,
+                min_likelihood=min_likelihood
+            )
+            for finding in window_findings:
+                finding.start_offset += base_offset
+                finding.end_offset += base_offset
+                key = (finding.info_type, finding.start_offset, finding.end_offset)
+                if key not in seen:
+                    seen.add(key)
+                    findings.append(finding)
+        
+        async for text in chunks:
+            buffer += text
+            while len(buffer) >= STREAM_WINDOW_CHARS:
+                await scan(buffer[:STREAM_WINDOW_CHARS])
+                scanned_to = base_offset + STREAM_WINDOW_CHARS
+                step = STREAM_WINDOW_CHARS - STREAM_WINDOW_OVERLAP
+                buffer = buffer[step:]
+                base_offset += step
+        
+        if base_offset + len(buffer) > scanned_to:
+            await scan(buffer)
+        
+        findings.sort(key=lambda f: f.start_offset)
+        return findings
+    
     async def mask_pii(
         self,
         content: str,
@@ -269,10 +396,11 @@ class PIIDetectionService:
         if masking_config:
             default_masking.update(masking_config)
         
-        # Sort findings by start offset (descending) to avoid offset issues
-        sorted_findings = sorted(findings, key=lambda f: f.start_offset, reverse=True)
+        # Walk findings left to right and join the pieces once at the end
+        sorted_findings = sorted(findings, key=lambda f: (f.start_offset, -f.end_offset))
         
-        masked_content = content
+        parts = []
+        cursor = 0
         updated_findings = []
         
         for finding in sorted_findings:
@@ -283,17 +411,21 @@ class PIIDetectionService:
             masked_text = self._apply_masking(finding.original_text, masking_type, finding.info_type)
             finding.masked_text = masked_text
             
-            # Replace in content
-            masked_content = (
-                masked_content[:finding.start_offset] +
-                masked_text +
-                masked_content[finding.end_offset:]
-            )
+            if finding.start_offset >= cursor:
+                parts.append(content[cursor:finding.start_offset])
+                parts.append(masked_text)
+                cursor = finding.end_offset
+            elif finding.end_offset > cursor:
+                # Overlaps the previous finding; mask only the uncovered tail
+                parts.append(self._apply_masking(
+                    content[cursor:finding.end_offset], masking_type, finding.info_type
+                ))
+                cursor = finding.end_offset
             
             updated_findings.append(finding)
         
-        # Reverse to maintain original order
-        updated_findings.reverse()
+        parts.append(content[cursor:])
+        masked_content = "".join(parts)
         
         logger.info(f"Applied masking to {len(updated_findings)} PII findings")
         return masked_content, updated_findings
@@ -351,9 +483,9 @@ class PIIDetectionService:
         info_types: Optional[List[str]] = None,
         masking_config: Optional[Dict[str, MaskingType]] = None,
         min_likelihood: str = "POSSIBLE"
-    ) -> Tuple[str, List[PIIFinding]]:
+    ) -> Tuple[str, List[PIIFinding], Dict[str, Any]]:
         """
-        Detect and mask PII in one operation.
+        Detect, mask and validate PII in one operation.
         
         Args:
             content: Text content to process
@@ -363,7 +495,7 @@ class PIIDetectionService:
             min_likelihood: Minimum likelihood threshold
             
         Returns:
-            Tuple of (masked_content, findings)
+            Tuple of (masked_content, findings, validation)
         """
         # Detect PII
         findings = await self.detect_pii(
@@ -380,7 +512,14 @@ class PIIDetectionService:
             masking_config=masking_config
         )
         
-        return masked_content, updated_findings
+        # Validate masking quality
+        validation = await self.validate_masking_quality(
+            original_content=content,
+            masked_content=masked_content,
+            findings=updated_findings
+        )
+        
+        return masked_content, updated_findings, validation
     
     async def create_redaction_preview(
         self,
@@ -456,16 +595,7 @@ class PIIDetectionService:
         Returns:
             Audit log ID
         """
-        audit_data = {
-            "user_id": user_id,
-            "document_id": document_id,
-            "action": action,
-            "timestamp": datetime.utcnow(),
-            "findings_count": len(findings),
-            "pii_types": list(set(f.info_type for f in findings)),
-            "high_confidence_count": len([f for f in findings if f.confidence > 0.7]),
-            "metadata": metadata or {}
-        }
+        audit_data = self._build_audit_entry(user_id, document_id, action, findings, metadata)
         
         # Store in Firestore
         audit_id = await self.firestore_service.create_document(
@@ -476,6 +606,125 @@ class PIIDetectionService:
         logger.info(f"Created PII audit log {audit_id} for user {user_id}")
         return audit_id
     
+    def enqueue_pii_audit(
+        self,
+        user_id: str,
+        document_id: str,
+        action: str,
+        findings: List[PIIFinding],
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Queue a PII audit entry for a batched background write.
+        
+        When the queue is full the oldest pending entry is dropped and
+        counted in dropped_audit_entries.
+        """
+        audit_data = self._build_audit_entry(user_id, document_id, action, findings, metadata)
+        
+        self.start_audit_logging()
+        if self._audit_queue.full():
+            self._audit_queue.get_nowait()
+            self.dropped_audit_entries += 1
+            logger.warning("PII audit queue full, dropped oldest pending entry")
+        self._audit_queue.put_nowait(audit_data)
+    
+    async def log_pii_audit_batch(self, entries: List[Dict[str, Any]]) -> List[str]:
+        """
+        Write several PII audit entries in one Firestore batch.
+        
+        Args:
+            entries: Audit entries built by _build_audit_entry
+            
+        Returns:
+            Audit log IDs
+        """
+        audit_ids = await self.firestore_service.create_pii_audit_logs(entries)
+        
+        logger.info(f"Created {len(audit_ids)} PII audit logs")
+        return audit_ids
+    
+    def start_audit_logging(self):
+        """Start the background task that writes queued audit entries."""
+        loop = asyncio.get_running_loop()
+        if (
+            self._audit_task is not None
+            and not self._audit_task.done()
+            and self._audit_task.get_loop() is loop
+        ):
+            return
+        
+        # A queue binds to the loop that first waits on it, so move any
+        # pending entries into a fresh queue for the current loop
+        pending = []
+        while self._audit_queue is not None and not self._audit_queue.empty():
+            pending.append(self._audit_queue.get_nowait())
+        self._audit_queue = asyncio.Queue(maxsize=MAX_QUEUED_AUDIT_ENTRIES)
+        for audit_data in pending:
+            self._audit_queue.put_nowait(audit_data)
+        
+        self._audit_task = loop.create_task(self._audit_writer())
+    
+    async def stop_audit_logging(self):
+        """Write pending audit entries and stop the background task."""
+        if self._audit_task is None:
+            return
+        
+        self._audit_task.cancel()
+        try:
+            await self._audit_task
+        except asyncio.CancelledError:
+            pass
+        self._audit_task = None
+        
+        batch = []
+        while not self._audit_queue.empty():
+            batch.append(self._audit_queue.get_nowait())
+        for start in range(0, len(batch), AUDIT_BATCH_SIZE):
+            await self.log_pii_audit_batch(batch[start:start + AUDIT_BATCH_SIZE])
+    
+    async def _audit_writer(self):
+        """Write queued audit entries in batches."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._audit_queue.get()]
+            
+            # Give the batch a short window to fill before writing it
+            deadline = loop.time() + AUDIT_FLUSH_INTERVAL
+            while len(batch) < AUDIT_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._audit_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                await self.log_pii_audit_batch(batch)
+            except Exception as e:
+                logger.error(f"Failed to write PII audit batch: {e}")
+    
+    def _build_audit_entry(
+        self,
+        user_id: str,
+        document_id: str,
+        action: str,
+        findings: List[PIIFinding],
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Build the audit log record for a PII processing action."""
+        return {
+            "user_id": user_id,
+            "document_id": document_id,
+            "action": action,
+            "timestamp": datetime.utcnow(),
+            "findings_count": len(findings),
+            "pii_types": list(set(f.info_type for f in findings)),
+            "high_confidence_count": len([f for f in findings if f.confidence > 0.7]),
+            "metadata": metadata or {}
+        }
+    
     async def get_compliance_report(
         self,
         user_id: Optional[str] = None,
@@ -576,10 +825,14 @@ class PIIDetectionService:
         }
         
         try:
-            # Check that all findings were masked
+            # Check that all findings were masked, scanning once per distinct text
+            leaked_texts = {
+                text for text in {finding.original_text for finding in findings}
+                if text in masked_content
+            }
             masked_count = 0
             for finding in findings:
-                if finding.original_text not in masked_content:
+                if finding.original_text not in leaked_texts:
                     masked_count += 1
                 else:
                     validation_result["issues"].append({
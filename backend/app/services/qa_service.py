@@ -10,10 +10,14 @@ This service handles:
 
 import asyncio
 import logging
+import time
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import json
 
+import numpy as np
+
 from google.cloud import aiplatform
 from vertexai.generative_models import GenerativeModel, Part
 from vertexai.language_models import TextEmbeddingModel
@@ -28,6 +32,20 @@ from ..services.firestore import FirestoreService
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Cosine similarity at which a cached answer is reused for a new question
+SEMANTIC_CACHE_THRESHOLD = 0.95
+# Cached answers expire after this many seconds
+SEMANTIC_CACHE_TTL = 3600
+# Answers below this confidence (including the fallback apology) are not cached
+SEMANTIC_CACHE_MIN_CONFIDENCE = 0.5
+# Maximum cached answers per document; the oldest is evicted first
+SEMANTIC_CACHE_MAX_ENTRIES = 256
+# Maximum number of documents with cached answers; the least recently used is evicted first
+SEMANTIC_CACHE_MAX_DOCUMENTS = 1024
+
+# Seconds a health check result is reused by later probes
+HEALTH_CHECK_TTL = 5.0
+
 
 class QAContext:
     """Represents the context for a Q&A session."""
@@ -47,10 +65,19 @@ class QAContext:
         self.document_content = document_content
         self.document_analysis = document_analysis or {}
         self.conversation_history = conversation_history or []
+        # (history index, unit question embedding) for interactions added in
+        # this process; kept in memory only and not saved with the context
+        self.question_vectors: List[Tuple[int, np.ndarray]] = []
         self.created_at = datetime.utcnow()
         self.updated_at = datetime.utcnow()
     
-    def add_interaction(self, question: str, answer: str, confidence: float = 1.0):
+    def add_interaction(
+        self,
+        question: str,
+        answer: str,
+        confidence: float = 1.0,
+        question_vector: Optional[np.ndarray] = None
+    ):
         """Add a Q&A interaction to the conversation history."""
         interaction = {
             "timestamp": datetime.utcnow().isoformat(),
@@ -59,8 +86,28 @@ class QAContext:
             "confidence": confidence,
         }
         self.conversation_history.append(interaction)
+        if question_vector is not None:
+            self.question_vectors.append((len(self.conversation_history) - 1, question_vector))
         self.updated_at = datetime.utcnow()
     
+    def search_interactions(self, query_vector: np.ndarray, limit: int) -> List[Dict[str, Any]]:
+        """Return the `limit` interactions whose questions are closest to the query, oldest first."""
+        matching = [
+            (index, vector) for index, vector in self.question_vectors
+            if vector.shape == query_vector.shape
+        ]
+        if not matching:
+            return []
+        indexes = [index for index, _ in matching]
+        vectors = np.vstack([vector for _, vector in matching])
+        
+        similarities = vectors @ query_vector
+        if len(indexes) > limit:
+            top = np.argpartition(similarities, -limit)[-limit:]
+        else:
+            top = range(len(indexes))
+        return [self.conversation_history[indexes[position]] for position in sorted(top)]
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
         return {
@@ -111,6 +158,14 @@ class QAResponse:
         }
 
 
+@dataclass(slots=True)
+class _DocumentAnswerCache:
+    """Cached answers for one document with their normalized question embeddings."""
+    vectors: np.ndarray
+    responses: List[QAResponse] = field(default_factory=list)
+    created_at: List[float] = field(default_factory=list)
+
+
 class QAService:
     """
     Service for handling voice-to-voice Q&A interactions with legal documents.
@@ -133,6 +188,12 @@ class QAService:
             # Active Q&A contexts
             self.active_contexts: Dict[str, QAContext] = {}
             
+            # Answers by document, least recently used document first
+            self.answer_cache: Dict[str, _DocumentAnswerCache] = {}
+            
+            # Last health check as (checked_at, result)
+            self._health_result: Optional[Tuple[float, Dict[str, Any]]] = None
+            
             logger.info("Q&A service initialized successfully")
             
         except Exception as e:
@@ -167,8 +228,6 @@ class QAService:
         try:
             # Step 1: Transcribe the voice question
             logger.info("Transcribing voice question...")
-            audio_file = await self._create_temp_audio_file(audio_data)
-            
             transcription = await speech_to_text_service.transcribe_audio_file(
                 audio_data=audio_data,
                 language_code=language_code,
@@ -237,11 +296,32 @@ class QAService:
         start_time = datetime.utcnow()
         
         try:
-            # Get or create Q&A context
-            context = await self._get_or_create_context(
-                document_id, user_id, session_id
+            # Load the context and embed the question concurrently
+            context, question_embedding = await asyncio.gather(
+                self._get_or_create_context(document_id, user_id, session_id),
+                self._generate_embedding(question)
             )
             
+            # Reuse the answer to a near-identical earlier question
+            question_vector = self._normalize_embedding(question_embedding)
+            cached = self._lookup_cached_answer(document_id, question_vector)
+            if cached is not None:
+                context.add_interaction(
+                    question, cached.answer, cached.confidence, question_vector
+                )
+                await self._save_context(context)
+                
+                processing_time = (datetime.utcnow() - start_time).total_seconds()
+                logger.info(f"Text Q&A served from cache in {processing_time:.2f}s")
+                return QAResponse(
+                    question=question,
+                    answer=cached.answer,
+                    confidence=cached.confidence,
+                    sources=cached.sources,
+                    processing_time=processing_time,
+                    context_used=cached.context_used
+                )
+            
             # Step 1: Understand the question and extract intent
             question_analysis = await self._analyze_question(question, context)
             
@@ -256,7 +336,7 @@ class QAService:
             )
             
             # Step 4: Update conversation history
-            context.add_interaction(question, response_text, confidence)
+            context.add_interaction(question, response_text, confidence, question_vector)
             await self._save_context(context)
             
             processing_time = (datetime.utcnow() - start_time).total_seconds()
@@ -270,6 +350,9 @@ class QAService:
                 context_used=relevant_context
             )
             
+            if confidence >= SEMANTIC_CACHE_MIN_CONFIDENCE:
+                self._cache_answer(document_id, question_vector, response)
+            
             logger.info(f"Text Q&A completed in {processing_time:.2f}s")
             return response
             
@@ -331,9 +414,6 @@ class QAService:
         try:
             # Use vector search to find relevant document sections
             if context.document_content:
-                # Generate embedding for the question
-                question_embedding = await self._generate_embedding(question)
-                
                 # Search for similar content in the document
                 # This is a simplified implementation - in practice, you'd use
                 # the vector search service with pre-indexed document chunks
@@ -510,6 +590,68 @@ class QAService:
             logger.warning(f"Embedding generation failed: {str(e)}")
             return []
     
+    def _normalize_embedding(self, embedding: List[float]) -> Optional[np.ndarray]:
+        """Convert an embedding to a unit vector, or None if it is unusable."""
+        if not embedding:
+            return None
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return None
+        return vector / norm
+    
+    def _lookup_cached_answer(
+        self,
+        document_id: str,
+        question_vector: Optional[np.ndarray]
+    ) -> Optional[QAResponse]:
+        """Return the cached answer most similar to the question, if close enough."""
+        cache = self.answer_cache.get(document_id)
+        if cache is None or question_vector is None:
+            return None
+        if cache.vectors.shape[1] != question_vector.shape[0]:
+            return None
+        
+        similarities = cache.vectors @ question_vector
+        best = int(np.argmax(similarities))
+        if similarities[best] < SEMANTIC_CACHE_THRESHOLD:
+            return None
+        if time.monotonic() - cache.created_at[best] >= SEMANTIC_CACHE_TTL:
+            return None
+        
+        # Re-insert so the document moves to the most recently used end
+        self.answer_cache[document_id] = self.answer_cache.pop(document_id)
+        return cache.responses[best]
+    
+    def _cache_answer(
+        self,
+        document_id: str,
+        question_vector: Optional[np.ndarray],
+        response: QAResponse
+    ):
+        """Cache an answer under its question embedding, dropping expired entries."""
+        if question_vector is None:
+            return
+        
+        now = time.monotonic()
+        cache = self.answer_cache.pop(document_id, None)
+        if cache is None or cache.vectors.shape[1] != question_vector.shape[0]:
+            cache = _DocumentAnswerCache(
+                vectors=np.empty((0, question_vector.shape[0]), dtype=np.float32)
+            )
+        
+        keep = [
+            index for index, created_at in enumerate(cache.created_at)
+            if now - created_at < SEMANTIC_CACHE_TTL
+        ][-(SEMANTIC_CACHE_MAX_ENTRIES - 1):]
+        cache.vectors = np.vstack([cache.vectors[keep], question_vector])
+        cache.responses = [cache.responses[index] for index in keep] + [response]
+        cache.created_at = [cache.created_at[index] for index in keep] + [now]
+        
+        self.answer_cache[document_id] = cache
+        while len(self.answer_cache) > SEMANTIC_CACHE_MAX_DOCUMENTS:
+            self.answer_cache.pop(next(iter(self.answer_cache)))
+    
     async def _get_or_create_context(
         self,
         document_id: str,
@@ -529,8 +671,8 @@ class QAService:
         
         # Try to load from Firestore
         try:
-            doc_ref = self.firestore_service.db.collection("qa_contexts").document(context_key)
-            doc = doc_ref.get()
+            doc_ref = self.firestore_service.client.collection("qa_contexts").document(context_key)
+            doc = await asyncio.to_thread(doc_ref.get)
             
             if doc.exists:
                 data = doc.to_dict()
@@ -564,30 +706,37 @@ class QAService:
         """Save Q&A context to Firestore."""
         try:
             context_key = f"{context.user_id}_{context.document_id}_{context.session_id}"
-            doc_ref = self.firestore_service.db.collection("qa_contexts").document(context_key)
-            doc_ref.set(context.to_dict())
+            doc_ref = self.firestore_service.client.collection("qa_contexts").document(context_key)
+            await asyncio.to_thread(doc_ref.set, context.to_dict())
         except Exception as e:
             logger.warning(f"Failed to save context to Firestore: {str(e)}")
     
-    async def _create_temp_audio_file(self, audio_data: bytes) -> str:
-        """Create a temporary audio file from audio data."""
-        import tempfile
-        import os
-        
-        with tempfile.NamedTemporaryFile(suffix='.webm', delete=False) as temp_file:
-            temp_file.write(audio_data)
-            return temp_file.name
-    
     async def get_session_history(
         self,
         document_id: str,
         user_id: str,
-        session_id: str
+        session_id: str,
+        limit: Optional[int] = None,
+        query: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """Get conversation history for a session."""
+        """
+        Get conversation history for a session.
+        
+        Without a query the latest `limit` items (or all items) are
+        returned. With a query, the `limit` interactions whose questions
+        are most similar to it are returned, oldest first; this searches
+        the question embeddings recorded when each answer was produced.
+        """
         try:
             context = await self._get_or_create_context(document_id, user_id, session_id)
-            return context.conversation_history
+            history = context.conversation_history
+            
+            if query and context.question_vectors:
+                query_vector = self._normalize_embedding(await self._generate_embedding(query))
+                if query_vector is not None:
+                    return context.search_interactions(query_vector, limit or len(history))
+            
+            return history[-limit:] if limit else history
         except Exception as e:
             logger.error(f"Failed to get session history: {str(e)}")
             return []
@@ -607,14 +756,23 @@ class QAService:
                 del self.active_contexts[context_key]
             
             # Remove from Firestore
-            doc_ref = self.firestore_service.db.collection("qa_contexts").document(context_key)
-            doc_ref.delete()
+            doc_ref = self.firestore_service.client.collection("qa_contexts").document(context_key)
+            await asyncio.to_thread(doc_ref.delete)
             
         except Exception as e:
             logger.error(f"Failed to clear session: {str(e)}")
     
     async def health_check(self) -> Dict[str, Any]:
-        """Perform a health check of the Q&A service."""
+        """
+        Perform a health check of the Q&A service.
+        
+        The check calls Gemini, so its result is reused for
+        HEALTH_CHECK_TTL seconds rather than repeated for every probe.
+        """
+        cached = self._health_result
+        if cached and time.monotonic() - cached[0] < HEALTH_CHECK_TTL:
+            return cached[1]
+        
         try:
             # Test basic functionality
             test_question = "What is this document about?"
@@ -623,7 +781,7 @@ class QAService:
             # Test question analysis
             analysis = await self._analyze_question(test_question, test_context)
             
-            return {
+            result = {
                 "status": "healthy",
                 "service": "qa_service",
                 "timestamp": datetime.utcnow().isoformat(),
@@ -632,12 +790,15 @@ class QAService:
             }
             
         except Exception as e:
-            return {
+            result = {
                 "status": "unhealthy",
                 "service": "qa_service",
                 "timestamp": datetime.utcnow().isoformat(),
                 "error": str(e),
             }
+        
+        self._health_result = (time.monotonic(), result)
+        return result
 
 
 # Global service instance
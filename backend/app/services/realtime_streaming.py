@@ -9,13 +9,15 @@ This service handles:
 """
 
 import asyncio
-import json
 import logging
-from typing import Dict, List, Optional, Set, Any, AsyncGenerator
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple, Any, AsyncGenerator
 from datetime import datetime
 import weakref
 from contextlib import asynccontextmanager
 
+import orjson
 from fastapi import Request
 from fastapi.responses import StreamingResponse
 from google.cloud import firestore
@@ -23,11 +25,85 @@ from google.api_core import exceptions as gcp_exceptions
 
 from ..core.config import get_settings
 from ..services.firestore import FirestoreService
-from ..core.exceptions import WorkflowError
+from ..core.exceptions import RateLimitError, WorkflowError
+from ..models.base import ProcessingStatus
+
+# Binary WebSocket frames for clients that negotiate the msgpack subprotocol
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Maximum concurrent SSE and WebSocket streams per user
+MAX_STREAMS_PER_USER = 5
+
+# Maximum concurrent SSE and WebSocket streams across the process
+MAX_TOTAL_STREAMS = 1000
+
+# Sustained WebSocket events per second per connection
+WEBSOCKET_EVENT_RATE = 50.0
+
+# Events a WebSocket connection may send in a burst above the sustained rate
+WEBSOCKET_EVENT_BURST = 200
+
+# Events buffered per SSE connection for a slow client
+SSE_QUEUE_SIZE = 128
+
+# Events dropped when a connection is over its rate or buffer
+_DROPPABLE_EVENTS = frozenset({"job_update", "ping"})
+
+# WebSocket subprotocol selecting msgpack binary frames over JSON text
+MSGPACK_SUBPROTOCOL = "msgpack"
+
+# Job statuses that end a job; updates carrying them are never dropped
+_TERMINAL_JOB_STATUSES = frozenset({
+    ProcessingStatus.COMPLETED.value,
+    ProcessingStatus.FAILED.value,
+    ProcessingStatus.CANCELLED.value,
+})
+
+
+def _is_droppable(event_type: str, data: Dict[str, Any]) -> bool:
+    """Whether an event is a progress delta that a later update supersedes."""
+    return event_type in _DROPPABLE_EVENTS and data.get("status") not in _TERMINAL_JOB_STATUSES
+
+
+def _msgpack_default(value: Any) -> Any:
+    """Encode values msgpack has no native type for, as orjson does."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+class TokenBucket:
+    """Token bucket limiting how fast a connection emits events."""
+    
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+    
+    def consume(self) -> bool:
+        """Take one token, returning False when the bucket is empty."""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+@dataclass(slots=True)
+class _SharedListener:
+    """A Firestore listener fanned out to every connection on the same stream."""
+    watch: Any
+    connection_ids: Set[str] = field(default_factory=set)
+
 
 class SSEConnection:
     """Represents a Server-Sent Events connection."""
@@ -41,7 +117,7 @@ class SSEConnection:
         self.is_active = True
         
         # Event queue for this connection
-        self.event_queue = asyncio.Queue(maxsize=100)
+        self.event_queue = asyncio.Queue(maxsize=SSE_QUEUE_SIZE)
         
         # Connection metadata
         self.metadata = {}
@@ -64,13 +140,38 @@ class SSEConnection:
                 self.event_queue.put_nowait(event)
                 return True
             except asyncio.QueueFull:
-                logger.warning(f"Event queue full for connection {self.connection_id}")
-                return False
+                return self._replace_oldest_droppable(event)
                 
         except Exception as e:
-            logger.error(f"Failed to send event to connection {self.connection_id}: {str(e)}")
+            logger.error("Failed to send event to connection %s: %s", self.connection_id, e)
             return False
     
+    def _replace_oldest_droppable(self, event: Dict[str, Any]) -> bool:
+        """
+        Make room in a full queue by dropping its oldest progress delta.
+        
+        Terminal updates and system messages are kept. If nothing in the
+        queue can be dropped, the new event is dropped instead unless it
+        must be delivered, in which case the oldest event goes.
+        """
+        pending = [self.event_queue.get_nowait() for _ in range(self.event_queue.qsize())]
+        drop = next(
+            (index for index, queued in enumerate(pending) if _is_droppable(queued["type"], queued["data"])),
+            None
+        )
+        
+        delivered = drop is not None or not _is_droppable(event["type"], event["data"])
+        if delivered:
+            del pending[0 if drop is None else drop]
+            pending.append(event)
+        
+        for queued in pending:
+            self.event_queue.put_nowait(queued)
+        
+        if not delivered:
+            logger.warning("Event queue full for connection %s", self.connection_id)
+        return delivered
+    
     async def get_events(self) -> AsyncGenerator[str, None]:
         """Get events from the queue as SSE formatted strings."""
         try:
@@ -81,7 +182,7 @@ class SSEConnection:
                     
                     # Format as SSE
                     sse_data = f"event: {event['type']}\n"
-                    sse_data += f"data: {json.dumps(event['data'])}\n"
+                    sse_data += f"data: {orjson.dumps(event['data']).decode()}\n"
                     sse_data += f"id: {event['timestamp']}\n\n"
                     
                     yield sse_data
@@ -92,11 +193,11 @@ class SSEConnection:
                     self.last_ping = datetime.utcnow()
                     
                 except Exception as e:
-                    logger.error(f"Error getting events for connection {self.connection_id}: {str(e)}")
+                    logger.error("Error getting events for connection %s: %s", self.connection_id, e)
                     break
                     
         except Exception as e:
-            logger.error(f"Event stream error for connection {self.connection_id}: {str(e)}")
+            logger.error("Event stream error for connection %s: %s", self.connection_id, e)
         finally:
             self.is_active = False
     
@@ -108,14 +209,23 @@ class SSEConnection:
 class WebSocketConnection:
     """Represents a WebSocket connection."""
     
-    def __init__(self, websocket, connection_id: str, user_id: str, job_id: Optional[str] = None):
+    def __init__(
+        self,
+        websocket,
+        connection_id: str,
+        user_id: str,
+        job_id: Optional[str] = None,
+        binary: bool = False
+    ):
         self.websocket = websocket
+        self.binary = binary
         self.connection_id = connection_id
         self.user_id = user_id
         self.job_id = job_id
         self.created_at = datetime.utcnow()
         self.last_ping = datetime.utcnow()
         self.is_active = True
+        self.rate_limit = TokenBucket(WEBSOCKET_EVENT_RATE, WEBSOCKET_EVENT_BURST)
     
     async def send_event(self, event_type: str, data: Dict[str, Any]):
         """Send an event via WebSocket."""
@@ -123,6 +233,11 @@ class WebSocketConnection:
             if not self.is_active:
                 return False
             
+            # Over the rate, progress deltas and pings are dropped; a later
+            # update supersedes them. Terminal updates always go out.
+            if not self.rate_limit.consume() and _is_droppable(event_type, data):
+                return False
+            
             message = {
                 "type": event_type,
                 "data": data,
@@ -130,21 +245,30 @@ class WebSocketConnection:
                 "connection_id": self.connection_id
             }
             
-            await self.websocket.send_text(json.dumps(message))
+            if self.binary:
+                await self.websocket.send_bytes(msgpack.packb(message, default=_msgpack_default))
+            else:
+                await self.websocket.send_text(orjson.dumps(message).decode())
             return True
             
         except Exception as e:
-            logger.error(f"Failed to send WebSocket event: {str(e)}")
+            logger.error("Failed to send WebSocket event: %s", e)
             self.is_active = False
             return False
     
+    async def receive_message(self) -> Dict[str, Any]:
+        """Receive and decode a client message in the negotiated format."""
+        if self.binary:
+            return msgpack.unpackb(await self.websocket.receive_bytes())
+        return orjson.loads(await self.websocket.receive_text())
+    
     async def close(self):
         """Close the WebSocket connection."""
         try:
             if self.is_active:
                 await self.websocket.close()
         except Exception as e:
-            logger.warning(f"Error closing WebSocket: {str(e)}")
+            logger.warning("Error closing WebSocket: %s", e)
         finally:
             self.is_active = False
 
@@ -165,8 +289,10 @@ class RealtimeStreamingService:
         self.sse_connections: Dict[str, SSEConnection] = {}
         self.websocket_connections: Dict[str, WebSocketConnection] = {}
         
-        # Firestore listeners
-        self.firestore_listeners: Dict[str, Any] = {}
+        # Firestore listeners shared per (user_id, job_id), and the key each
+        # connection is subscribed under
+        self.firestore_listeners: Dict[Tuple[str, Optional[str]], _SharedListener] = {}
+        self._connection_listeners: Dict[str, Tuple[str, Optional[str]]] = {}
         
         # User subscriptions (user_id -> set of connection_ids)
         self.user_subscriptions: Dict[str, Set[str]] = {}
@@ -174,6 +300,12 @@ class RealtimeStreamingService:
         # Job subscriptions (job_id -> set of connection_ids)
         self.job_subscriptions: Dict[str, Set[str]] = {}
         
+        # Stream admission: global slots, open streams per user, and the
+        # user each admitted connection is counted against
+        self._stream_slots = asyncio.Semaphore(MAX_TOTAL_STREAMS)
+        self._user_stream_counts: Dict[str, int] = {}
+        self._admitted_connections: Dict[str, str] = {}
+        
         # Background tasks
         self._cleanup_task = None
         self._listener_task = None
@@ -200,6 +332,41 @@ class RealtimeStreamingService:
         if not self._tasks_started:
             self._start_background_tasks()
     
+    async def _admit_stream(self, connection_id: str, user_id: str):
+        """
+        Reserve a stream slot for a new connection.
+        
+        Raises:
+            RateLimitError: If the user or the process is at its stream limit
+        """
+        if self._user_stream_counts.get(user_id, 0) >= MAX_STREAMS_PER_USER:
+            raise RateLimitError(f"Too many open streams for user {user_id}")
+        if self._stream_slots.locked():
+            raise RateLimitError("Too many open streams")
+        
+        await self._stream_slots.acquire()
+        self._user_stream_counts[user_id] = self._user_stream_counts.get(user_id, 0) + 1
+        self._admitted_connections[connection_id] = user_id
+    
+    def _release_stream(self, connection_id: str):
+        """Return the stream slot held by a connection, if any."""
+        user_id = self._admitted_connections.pop(connection_id, None)
+        if user_id is None:
+            return
+        
+        self._stream_slots.release()
+        remaining = self._user_stream_counts.pop(user_id) - 1
+        if remaining:
+            self._user_stream_counts[user_id] = remaining
+    
+    async def _sse_events(self, connection: SSEConnection) -> AsyncGenerator[str, None]:
+        """Stream a connection's events, cleaning it up once the client goes away."""
+        try:
+            async for event in connection.get_events():
+                yield event
+        finally:
+            await self._cleanup_connection(connection.connection_id)
+    
     async def create_sse_stream(
         self,
         user_id: str,
@@ -216,14 +383,19 @@ class RealtimeStreamingService:
             
         Returns:
             StreamingResponse for SSE
+            
+        Raises:
+            RateLimitError: If the user or the process is at its stream limit
         """
         await self._ensure_tasks_started()
         
+        # Generate connection ID if not provided
+        if not connection_id:
+            connection_id = f"sse_{user_id}_{datetime.utcnow().timestamp()}"
+        
+        await self._admit_stream(connection_id, user_id)
+        
         try:
-            # Generate connection ID if not provided
-            if not connection_id:
-                connection_id = f"sse_{user_id}_{datetime.utcnow().timestamp()}"
-            
             # Create SSE connection
             connection = SSEConnection(connection_id, user_id, job_id)
             self.sse_connections[connection_id] = connection
@@ -234,11 +406,11 @@ class RealtimeStreamingService:
             # Set up Firestore listener for this connection
             await self._setup_firestore_listener(connection_id, user_id, job_id)
             
-            logger.info(f"Created SSE stream for user {user_id}, job {job_id}")
+            logger.info("Created SSE stream for user %s, job %s", user_id, job_id)
             
             # Return streaming response
             return StreamingResponse(
-                connection.get_events(),
+                self._sse_events(connection),
                 media_type="text/event-stream",
                 headers={
                     "Cache-Control": "no-cache",
@@ -249,7 +421,8 @@ class RealtimeStreamingService:
             )
             
         except Exception as e:
-            logger.error(f"Failed to create SSE stream: {str(e)}")
+            logger.error("Failed to create SSE stream: %s", e)
+            await self._cleanup_connection(connection_id)
             raise WorkflowError(f"Failed to create SSE stream: {str(e)}") from e
     
     async def handle_websocket_connection(
@@ -268,16 +441,25 @@ class RealtimeStreamingService:
             job_id: Optional specific job ID to monitor
             connection_id: Optional custom connection ID
         """
+        # Generate connection ID if not provided
+        if not connection_id:
+            connection_id = f"ws_{user_id}_{datetime.utcnow().timestamp()}"
+        
         try:
-            # Generate connection ID if not provided
-            if not connection_id:
-                connection_id = f"ws_{user_id}_{datetime.utcnow().timestamp()}"
-            
-            # Accept WebSocket connection
-            await websocket.accept()
+            await self._admit_stream(connection_id, user_id)
+        except RateLimitError as e:
+            logger.warning("Rejected WebSocket connection: %s", e)
+            await websocket.close(code=1013)  # Try again later
+            return
+        
+        try:
+            # Accept WebSocket connection, switching to msgpack frames when
+            # the client offers that subprotocol
+            binary = msgpack is not None and MSGPACK_SUBPROTOCOL in websocket.scope.get("subprotocols", [])
+            await websocket.accept(subprotocol=MSGPACK_SUBPROTOCOL if binary else None)
             
             # Create WebSocket connection
-            connection = WebSocketConnection(websocket, connection_id, user_id, job_id)
+            connection = WebSocketConnection(websocket, connection_id, user_id, job_id, binary=binary)
             self.websocket_connections[connection_id] = connection
             
             # Add to subscriptions
@@ -286,7 +468,7 @@ class RealtimeStreamingService:
             # Set up Firestore listener
             await self._setup_firestore_listener(connection_id, user_id, job_id)
             
-            logger.info(f"Accepted WebSocket connection for user {user_id}, job {job_id}")
+            logger.info("Accepted WebSocket connection for user %s, job %s", user_id, job_id)
             
             # Send initial connection confirmation
             await connection.send_event("connected", {
@@ -300,10 +482,9 @@ class RealtimeStreamingService:
                 while connection.is_active:
                     try:
                         # Wait for messages (mainly for ping/pong)
-                        message = await asyncio.wait_for(websocket.receive_text(), timeout=30.0)
+                        data = await asyncio.wait_for(connection.receive_message(), timeout=30.0)
                         
                         # Handle ping messages
-                        data = json.loads(message)
                         if data.get("type") == "ping":
                             await connection.send_event("pong", {"timestamp": datetime.utcnow().isoformat()})
                             connection.last_ping = datetime.utcnow()
@@ -314,14 +495,13 @@ class RealtimeStreamingService:
                         connection.last_ping = datetime.utcnow()
                         
             except Exception as e:
-                logger.warning(f"WebSocket connection error: {str(e)}")
+                logger.warning("WebSocket connection error: %s", e)
             finally:
                 await self._cleanup_connection(connection_id)
                 
         except Exception as e:
-            logger.error(f"WebSocket connection handling failed: {str(e)}")
-            if connection_id in self.websocket_connections:
-                await self._cleanup_connection(connection_id)
+            logger.error("WebSocket connection handling failed: %s", e)
+            await self._cleanup_connection(connection_id)
     
     def _add_to_subscriptions(self, connection_id: str, user_id: str, job_id: Optional[str]):
         """Add connection to subscription lists."""
@@ -342,44 +522,80 @@ class RealtimeStreamingService:
         user_id: str,
         job_id: Optional[str]
     ):
-        """Set up Firestore real-time listener for a connection."""
+        """
+        Subscribe a connection to the Firestore listener for its stream.
+        
+        Connections watching the same (user_id, job_id) share one listener,
+        created for the first connection and removed with the last.
+        """
+        key = (user_id, job_id)
         try:
-            if job_id:
-                # Listen to specific job
-                doc_ref = self.firestore_service.db.collection("jobs").document(job_id)
-                
-                def on_snapshot(doc_snapshot, changes, read_time):
-                    asyncio.create_task(self._handle_job_update(connection_id, doc_snapshot))
-                
-                listener = doc_ref.on_snapshot(on_snapshot)
-                self.firestore_listeners[f"{connection_id}_job"] = listener
-            else:
-                # Listen to all user jobs
-                query = self.firestore_service.db.collection("jobs").where("user_id", "==", user_id)
+            shared = self.firestore_listeners.get(key)
+            if shared is None:
+                loop = asyncio.get_running_loop()
+                jobs = self.firestore_service.client.collection("jobs")
                 
-                def on_snapshot(query_snapshot, changes, read_time):
-                    for change in changes:
-                        asyncio.create_task(self._handle_job_update(connection_id, change.document))
+                # Snapshots arrive on a Firestore thread; hand them to the loop
+                if job_id:
+                    # Listen to specific job
+                    def on_snapshot(doc_snapshots, changes, read_time):
+                        asyncio.run_coroutine_threadsafe(
+                            self._handle_job_updates(key, doc_snapshots), loop
+                        )
+                    
+                    watch = jobs.document(job_id).on_snapshot(on_snapshot)
+                else:
+                    # Listen to all user jobs
+                    def on_snapshot(query_snapshot, changes, read_time):
+                        asyncio.run_coroutine_threadsafe(
+                            self._handle_job_updates(key, [change.document for change in changes]), loop
+                        )
+                    
+                    watch = jobs.where("user_id", "==", user_id).on_snapshot(on_snapshot)
                 
-                listener = query.on_snapshot(on_snapshot)
-                self.firestore_listeners[f"{connection_id}_user"] = listener
+                shared = self.firestore_listeners[key] = _SharedListener(watch)
+            
+            shared.connection_ids.add(connection_id)
+            self._connection_listeners[connection_id] = key
                 
         except Exception as e:
-            logger.error(f"Failed to setup Firestore listener: {str(e)}")
+            logger.error("Failed to setup Firestore listener: %s", e)
     
-    async def _handle_job_update(self, connection_id: str, doc_snapshot):
-        """Handle job update from Firestore listener."""
+    def _remove_firestore_listener(self, connection_id: str):
+        """Unsubscribe a connection, closing its listener once nobody shares it."""
+        key = self._connection_listeners.pop(connection_id, None)
+        if key is None:
+            return
+        
+        shared = self.firestore_listeners[key]
+        shared.connection_ids.discard(connection_id)
+        if shared.connection_ids:
+            return
+        
+        del self.firestore_listeners[key]
         try:
-            if not doc_snapshot.exists:
+            shared.watch.unsubscribe()
+        except Exception as e:
+            logger.warning("Error removing Firestore listener %s: %s", key, e)
+    
+    async def _handle_job_updates(self, key: Tuple[str, Optional[str]], doc_snapshots: List[Any]):
+        """Fan job updates from a shared Firestore listener out to its connections."""
+        try:
+            shared = self.firestore_listeners.get(key)
+            if shared is None:
                 return
             
-            job_data = doc_snapshot.to_dict()
-            
-            # Send update to specific connection
-            await self._send_to_connection(connection_id, "job_update", job_data)
+            for doc_snapshot in doc_snapshots:
+                if not doc_snapshot.exists:
+                    continue
+                
+                # Decode once for every subscribed connection
+                job_data = doc_snapshot.to_dict()
+                for connection_id in list(shared.connection_ids):
+                    await self._send_to_connection(connection_id, "job_update", job_data)
             
         except Exception as e:
-            logger.error(f"Failed to handle job update: {str(e)}")
+            logger.error("Failed to handle job update: %s", e)
     
     async def broadcast_job_update(self, job_id: str, job_data: Dict[str, Any]):
         """
@@ -404,7 +620,7 @@ class RealtimeStreamingService:
                 await self._send_to_connection(connection_id, "job_update", job_data)
                 
         except Exception as e:
-            logger.error(f"Failed to broadcast job update: {str(e)}")
+            logger.error("Failed to broadcast job update: %s", e)
     
     async def broadcast_system_message(self, message: str, message_type: str = "info"):
         """
@@ -430,7 +646,7 @@ class RealtimeStreamingService:
                 await connection.send_event("system_message", message_data)
                 
         except Exception as e:
-            logger.error(f"Failed to broadcast system message: {str(e)}")
+            logger.error("Failed to broadcast system message: %s", e)
     
     async def _send_to_connection(self, connection_id: str, event_type: str, data: Dict[str, Any]):
         """Send event to a specific connection."""
@@ -448,10 +664,12 @@ class RealtimeStreamingService:
                 return
                 
         except Exception as e:
-            logger.error(f"Failed to send to connection {connection_id}: {str(e)}")
+            logger.error("Failed to send to connection %s: %s", connection_id, e)
     
     async def _cleanup_connection(self, connection_id: str):
         """Clean up a specific connection."""
+        self._release_stream(connection_id)
+        
         try:
             # Remove from connections
             if connection_id in self.sse_connections:
@@ -471,20 +689,13 @@ class RealtimeStreamingService:
             for job_connections in self.job_subscriptions.values():
                 job_connections.discard(connection_id)
             
-            # Remove Firestore listeners
-            listener_keys = [key for key in self.firestore_listeners.keys() if key.startswith(connection_id)]
-            for key in listener_keys:
-                try:
-                    listener = self.firestore_listeners[key]
-                    listener.unsubscribe()
-                    del self.firestore_listeners[key]
-                except Exception as e:
-                    logger.warning(f"Error removing Firestore listener {key}: {str(e)}")
+            # Remove Firestore listener subscription
+            self._remove_firestore_listener(connection_id)
             
-            logger.info(f"Cleaned up connection {connection_id}")
+            logger.info("Cleaned up connection %s", connection_id)
             
         except Exception as e:
-            logger.error(f"Error cleaning up connection {connection_id}: {str(e)}")
+            logger.error("Error cleaning up connection %s: %s", connection_id, e)
     
     async def _cleanup_connections(self):
         """Background task to clean up stale connections."""
@@ -515,7 +726,7 @@ class RealtimeStreamingService:
                 await asyncio.sleep(60)  # Check every minute
                 
             except Exception as e:
-                logger.error(f"Error in connection cleanup task: {str(e)}")
+                logger.error("Error in connection cleanup task: %s", e)
                 await asyncio.sleep(60)
     
     async def _manage_firestore_listeners(self):
@@ -527,7 +738,7 @@ class RealtimeStreamingService:
                 await asyncio.sleep(300)  # Check every 5 minutes
                 
             except Exception as e:
-                logger.error(f"Error in Firestore listener management: {str(e)}")
+                logger.error("Error in Firestore listener management: %s", e)
                 await asyncio.sleep(300)
     
     async def get_connection_stats(self) -> Dict[str, Any]:
@@ -544,7 +755,7 @@ class RealtimeStreamingService:
                 "active_websocket_connections": len([c for c in self.websocket_connections.values() if c.is_active])
             }
         except Exception as e:
-            logger.error(f"Error getting connection stats: {str(e)}")
+            logger.error("Error getting connection stats: %s", e)
             return {}
     
     async def disconnect_user(self, user_id: str):
@@ -555,10 +766,10 @@ class RealtimeStreamingService:
             for connection_id in user_connections:
                 await self._cleanup_connection(connection_id)
             
-            logger.info(f"Disconnected all connections for user {user_id}")
+            logger.info("Disconnected all connections for user %s", user_id)
             
         except Exception as e:
-            logger.error(f"Error disconnecting user {user_id}: {str(e)}")
+            logger.error("Error disconnecting user %s: %s", user_id, e)
     
     async def shutdown(self):
         """Shutdown the streaming service and clean up resources."""
@@ -580,16 +791,16 @@ class RealtimeStreamingService:
                 await self._cleanup_connection(connection_id)
             
             # Clean up Firestore listeners
-            for listener in self.firestore_listeners.values():
+            for shared in self.firestore_listeners.values():
                 try:
-                    listener.unsubscribe()
+                    shared.watch.unsubscribe()
                 except Exception as e:
-                    logger.warning(f"Error unsubscribing Firestore listener: {str(e)}")
+                    logger.warning("Error unsubscribing Firestore listener: %s", e)
             
             logger.info("Realtime streaming service shutdown complete")
             
         except Exception as e:
-            logger.error(f"Error during streaming service shutdown: {str(e)}")
+            logger.error("Error during streaming service shutdown: %s", e)
 
 
 # Global streaming service instance
@@ -15,6 +15,7 @@ import tempfile
 import os
 from typing import Dict, List, Optional, Any, AsyncGenerator, Union
 from datetime import datetime
+from enum import Enum
 import io
 
 from google.cloud import speech
@@ -30,6 +31,60 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+def _read_head(path: str, size: int) -> bytes:
+    """Read up to `size` bytes from the start of a file."""
+    with open(path, 'rb') as f:
+        return f.read(size)
+
+
+class AudioFormat(str, Enum):
+    """Audio container formats recognized from their leading bytes."""
+    
+    WAV = "wav"
+    MP3 = "mp3"
+    OGG = "ogg"
+    FLAC = "flac"
+    WEBM = "webm"
+    MP4 = "mp4"
+
+
+# Candidate languages scored per detection: one primary plus the three
+# alternative language codes the recognizer accepts
+MAX_CANDIDATE_LANGUAGES = 4
+
+# Leading bytes needed to recognize every AudioFormat
+AUDIO_MAGIC_SIZE = 12
+
+# Formats identified by their first four bytes alone
+_AUDIO_MAGIC_PREFIXES = {
+    b"OggS": AudioFormat.OGG,
+    b"fLaC": AudioFormat.FLAC,
+    b"\x1a\x45\xdf\xa3": AudioFormat.WEBM,  # EBML header
+}
+
+
+def detect_audio_format(head: bytes) -> Optional[AudioFormat]:
+    """
+    Identify an audio container from its first AUDIO_MAGIC_SIZE bytes.
+    
+    Returns None when the bytes match no known signature.
+    """
+    audio_format = _AUDIO_MAGIC_PREFIXES.get(head[:4])
+    if audio_format is not None:
+        return audio_format
+    if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+        return AudioFormat.WAV
+    if head[4:8] == b"ftyp":
+        return AudioFormat.MP4
+    # ID3 tag, or a bare MPEG frame sync with a non-zero layer (layer zero
+    # is ADTS AAC)
+    if head[:3] == b"ID3" or (
+        len(head) >= 2 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0 and head[1] & 0x06
+    ):
+        return AudioFormat.MP3
+    return None
+
+
 class TranscriptionResult:
     """Represents a transcription result."""
     
@@ -89,7 +144,7 @@ class SpeechToTextService:
     
     async def transcribe_audio_file(
         self,
-        audio_data: bytes,
+        audio_data: Union[bytes, str],
         language_code: str = "en-US",
         sample_rate: Optional[int] = None,
         audio_format: str = "webm",
@@ -105,7 +160,7 @@ class SpeechToTextService:
         Transcribe an audio file to text.
         
         Args:
-            audio_data: Raw audio data bytes
+            audio_data: Raw audio data bytes, or the path of a file holding them
             language_code: Language code (e.g., 'en-US', 'es-ES')
             sample_rate: Audio sample rate (auto-detected if None)
             audio_format: Audio format (webm, wav, mp3, etc.)
@@ -167,7 +222,7 @@ class SpeechToTextService:
     
     async def transcribe_with_language_detection(
         self,
-        audio_data: bytes,
+        audio_data: Union[bytes, str],
         candidate_languages: List[str] = None,
         **kwargs
     ) -> TranscriptionResult:
@@ -175,15 +230,16 @@ class SpeechToTextService:
         Transcribe audio with automatic language detection.
         
         Args:
-            audio_data: Raw audio data bytes
-            candidate_languages: List of candidate language codes
+            audio_data: Raw audio data bytes, or the path of a file holding them
+            candidate_languages: List of candidate language codes; only the
+                first MAX_CANDIDATE_LANGUAGES are scored
             **kwargs: Additional transcription parameters
             
         Returns:
             TranscriptionResult with detected language
         """
         if not candidate_languages:
-            candidate_languages = ["en-US", "es-ES", "fr-FR", "de-DE", "it-IT", "pt-BR"]
+            candidate_languages = ["en-US", "es-ES", "fr-FR", "de-DE"]
         
         try:
             # First, try language detection with a short sample
@@ -267,7 +323,7 @@ class SpeechToTextService:
     
     async def _preprocess_audio(
         self,
-        audio_data: bytes,
+        audio_data: Union[bytes, str],
         audio_format: str,
         target_sample_rate: Optional[int] = None
     ) -> tuple[bytes, int, float]:
@@ -275,7 +331,7 @@ class SpeechToTextService:
         Preprocess audio data for optimal recognition.
         
         Args:
-            audio_data: Raw audio data
+            audio_data: Raw audio data, or the path of a file holding it
             audio_format: Original audio format
             target_sample_rate: Target sample rate (16kHz if None)
             
@@ -283,14 +339,19 @@ class SpeechToTextService:
             Tuple of (processed_audio_bytes, sample_rate, duration)
         """
         try:
-            # Create temporary file for audio processing
-            with tempfile.NamedTemporaryFile(suffix=f'.{audio_format}', delete=False) as temp_file:
-                temp_file.write(audio_data)
-                temp_path = temp_file.name
+            if isinstance(audio_data, str):
+                # Already on disk; load it in place
+                temp_path = None
+                audio_path = audio_data
+            else:
+                # Create temporary file for audio processing
+                with tempfile.NamedTemporaryFile(suffix=f'.{audio_format}', delete=False) as temp_file:
+                    temp_file.write(audio_data)
+                    temp_path = audio_path = temp_file.name
             
             try:
                 # Load audio with librosa
-                audio, original_sr = librosa.load(temp_path, sr=None, mono=True)
+                audio, original_sr = librosa.load(audio_path, sr=None, mono=True)
                 duration = len(audio) / original_sr
                 
                 # Resample if needed
@@ -316,7 +377,8 @@ class SpeechToTextService:
                 
             finally:
                 # Clean up temporary file
-                os.unlink(temp_path)
+                if temp_path is not None:
+                    os.unlink(temp_path)
                 
         except Exception as e:
             logger.error(f"Audio preprocessing error: {str(e)}")
@@ -449,13 +511,16 @@ class SpeechToTextService:
     
     async def _detect_language(
         self,
-        audio_data: bytes,
+        audio_data: Union[bytes, str],
         candidate_languages: List[str]
     ) -> str:
         """Detect the language of the audio."""
         try:
             # Use a shorter sample for language detection
-            sample_audio = audio_data[:min(len(audio_data), 1024 * 1024)]  # Max 1MB sample
+            if isinstance(audio_data, str):
+                sample_audio = await asyncio.to_thread(_read_head, audio_data, 1024 * 1024)
+            else:
+                sample_audio = audio_data[:min(len(audio_data), 1024 * 1024)]  # Max 1MB sample
             
             # Process audio
             processed_audio, sample_rate, _ = await self._preprocess_audio(
@@ -467,7 +532,7 @@ class SpeechToTextService:
                 encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
                 sample_rate_hertz=sample_rate,
                 language_code=candidate_languages[0],  # Primary language
-                alternative_language_codes=candidate_languages[1:5],  # Up to 4 alternatives
+                alternative_language_codes=candidate_languages[1:MAX_CANDIDATE_LANGUAGES],
                 max_alternatives=1,
             )
             
@@ -15,8 +15,8 @@ import tempfile
 import os
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
+from enum import Enum
 import io
-import base64
 
 from google.cloud import texttospeech
 from google.api_core import exceptions as gcp_exceptions
@@ -24,10 +24,31 @@ from google.api_core import exceptions as gcp_exceptions
 from ..core.config import get_settings
 from ..core.exceptions import WorkflowError
 
+# SIMD-accelerated base64 encoder when installed; output matches the stdlib
+try:
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
+
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+class SynthesisFormat(str, Enum):
+    """Output audio formats produced by synthesis."""
+    
+    MP3 = "MP3"
+    WAV = "WAV"
+    OGG = "OGG"
+    
+    @classmethod
+    def _missing_(cls, value: Any) -> Optional["SynthesisFormat"]:
+        # Accept any casing, e.g. "mp3"
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
+
+
 class SynthesisResult:
     """Represents a text-to-speech synthesis result."""
     
@@ -57,7 +78,7 @@ class SynthesisResult:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
         return {
-            "audio_content_base64": base64.b64encode(self.audio_content).decode('utf-8'),
+            "audio_content_base64": b64encode(self.audio_content).decode('ascii'),
             "text": self.text,
             "voice_name": self.voice_name,
             "language_code": self.language_code,
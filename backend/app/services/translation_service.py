@@ -10,6 +10,7 @@ This service handles:
 """
 
 import asyncio
+import copy
 import logging
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
@@ -119,6 +120,10 @@ class TranslationService:
             self.cache_max_size = 10000
             self.cache_ttl = timedelta(hours=24)
             
+            # Cached translations currently running, keyed by
+            # (text, target_language, source_language)
+            self._inflight_translations: Dict[Tuple[str, str, Optional[str]], asyncio.Future] = {}
+            
             logger.info("Translation service initialized successfully")
             
         except Exception as e:
@@ -146,6 +151,43 @@ class TranslationService:
         Returns:
             TranslationResult with translation and metadata
         """
+        # Nothing to translate; skip language detection and the API call
+        if not text.strip():
+            return TranslationResult(
+                original_text=text,
+                translated_text=text,
+                source_language=source_language or "und",
+                target_language=target_language
+            )
+        
+        if not use_cache:
+            return await self._translate_text(
+                text, target_language, source_language, use_cache, quality_threshold
+            )
+        
+        # Concurrent identical cached requests share one translation call
+        key = (text, target_language, source_language)
+        task = self._inflight_translations.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._translate_text(
+                text, target_language, source_language, use_cache, quality_threshold
+            ))
+            self._inflight_translations[key] = task
+            task.add_done_callback(lambda _: self._inflight_translations.pop(key, None))
+        
+        # Shield the shared task so one caller being cancelled does not cancel
+        # it for everyone else
+        return await asyncio.shield(task)
+    
+    async def _translate_text(
+        self,
+        text: str,
+        target_language: str,
+        source_language: Optional[str],
+        use_cache: bool,
+        quality_threshold: float
+    ) -> TranslationResult:
+        """Translate text, checking and filling the cache when use_cache is set."""
         start_time = datetime.utcnow()
         
         try:
@@ -264,18 +306,28 @@ class TranslationService:
                         logger.error(f"Failed to translate text: {str(e)}")
                         return None
             
-            # Execute translations concurrently
-            tasks = [translate_single(text) for text in texts]
+            # Translate each distinct text once, concurrently
+            unique_texts = list(dict.fromkeys(texts))
+            tasks = [translate_single(text) for text in unique_texts]
             results = await asyncio.gather(*tasks, return_exceptions=True)
+            translated = dict(zip(unique_texts, results))
             
-            # Process results
+            # Process results in the original order
             translations = []
             success_count = 0
             failure_count = 0
             cache_hit_count = 0
+            seen_texts = set()
             
-            for result in results:
+            for text in texts:
+                result = translated[text]
                 if isinstance(result, TranslationResult):
+                    # Repeats of a text are served from its first result
+                    if text in seen_texts:
+                        result = copy.copy(result)
+                        result.cached = True
+                    seen_texts.add(text)
+                    
                     translations.append(result)
                     success_count += 1
                     if result.cached:
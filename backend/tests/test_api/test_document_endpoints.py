@@ -576,4 +576,51 @@ class TestDocumentEndpoints:
             # Missing file
         )
         
-        assert response.status_code == 422  # Validation error
\ No newline at end of file
+        assert response.status_code == 422  # Validation error
+
+class TestSimpleDocumentAndHealthEndpoints:
+    """Test cases for the simplified documents router and health router."""
+    
+    @pytest.fixture
+    def client(self):
+        """Test client serving only the routers under test."""
+        from fastapi import FastAPI
+        from app.api.v1.endpoints import documents_simple, health
+        from app.core.security import require_auth
+        
+        test_app = FastAPI()
+        test_app.include_router(health.router, prefix="/v1")
+        test_app.include_router(documents_simple.router, prefix="/v1")
+        test_app.dependency_overrides[require_auth] = lambda: {"uid": "test-user-123"}
+        return TestClient(test_app)
+    
+    def test_health_returns_cached_json_body(self, client):
+        """Test /health serves the same encoded body as JSON within a second."""
+        from app.api.v1.endpoints import health
+        
+        response = client.get("/v1/health")
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()["status"] == "healthy"
+        assert response.content == health._health_payload()
+    
+    def test_upload_unsupported_content_type_returns_400(self, client):
+        """Test unsupported content types surface as 400, not 500."""
+        response = client.post(
+            "/v1/documents/upload",
+            params={"filename": "notes.txt", "content_type": "text/plain"}
+        )
+        
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Unsupported file type: text/plain"
+    
+    def test_list_documents_page_past_end_is_empty(self, client):
+        """Test a page beyond the last document returns an empty list."""
+        response = client.get("/v1/documents", params={"page": 50, "per_page": 10})
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["data"] == []
+        assert data["message"] == "Retrieved 0 documents"
@@ -0,0 +1,162 @@
+"""
+Integration tests for Monitoring API endpoints.
+
+Tests dashboard aggregation and related monitoring endpoints.
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import Mock, AsyncMock, patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1.endpoints import monitoring
+
+
+@pytest.fixture
+def client():
+    """Test client serving only the monitoring router."""
+    test_app = FastAPI()
+    test_app.include_router(monitoring.router, prefix="/v1/monitoring")
+    return TestClient(test_app)
+
+
+@pytest.fixture
+def mock_health_checker():
+    """Mock health checker with a healthy overall status."""
+    return Mock(
+        get_overall_health=AsyncMock(return_value=("healthy", {
+            "overall_status": "healthy",
+            "health_score": 100.0,
+            "last_check": "2024-01-15T10:30:00",
+            "components": {},
+            "summary": {"healthy": 1}
+        }))
+    )
+
+
+@pytest.fixture
+def mock_performance_monitor():
+    """Mock performance monitor."""
+    return Mock(
+        get_performance_summary=AsyncMock(return_value={
+            "period_hours": 24,
+            "total_requests": 10,
+            "error_rate": 0.0,
+            "avg_response_time": 0.2,
+            "avg_cpu_usage": 10.0,
+            "avg_memory_usage": 20.0,
+            "system_health": "good",
+            "top_endpoints": [],
+            "slowest_endpoints": []
+        }),
+        get_system_metrics=AsyncMock(return_value=Mock(
+            timestamp=datetime(2024, 1, 15, 10, 30),
+            cpu_usage=10.0,
+            memory_usage=20.0,
+            disk_usage=30.0,
+            network_io={},
+            active_connections=4,
+            response_times=[]
+        ))
+    )
+
+
+@pytest.fixture
+def mock_error_reporter():
+    """Mock error reporter."""
+    return Mock(
+        enqueue=Mock(),
+        get_error_summary=AsyncMock(return_value={
+            "period_hours": 24,
+            "total_errors": 0,
+            "category_breakdown": {},
+            "severity_breakdown": {},
+            "top_errors": [],
+            "critical_errors": 0
+        })
+    )
+
+
+@pytest.fixture
+def monitoring_backends(mock_health_checker, mock_performance_monitor, mock_error_reporter):
+    """Patch the monitoring backends used by the endpoints."""
+    monitoring._dashboard_cache.clear()
+    monitoring._probe_results.clear()
+    with patch.object(monitoring, "health_checker", mock_health_checker), \
+         patch.object(monitoring, "performance_monitor", mock_performance_monitor), \
+         patch.object(monitoring, "error_reporter", mock_error_reporter):
+        yield mock_health_checker, mock_performance_monitor, mock_error_reporter
+
+
+class TestDashboardEndpoint:
+    """Test cases for the monitoring dashboard."""
+
+    def test_dashboard_success(self, client, monitoring_backends):
+        """Test dashboard aggregates every monitoring source."""
+        response = client.get("/v1/monitoring/dashboard")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["health"]["overall_status"] == "healthy"
+        assert data["performance"]["total_requests"] == 10
+        assert data["errors"]["total_errors"] == 0
+        assert data["system"]["active_connections"] == 4
+
+    def test_dashboard_degrades_failed_section(self, client, monitoring_backends):
+        """Test a failing source blanks only its own section."""
+        health_checker, _, error_reporter = monitoring_backends
+        health_checker.get_overall_health.side_effect = RuntimeError("probe failed")
+
+        response = client.get("/v1/monitoring/dashboard")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["health"] is None
+        assert data["performance"]["total_requests"] == 10
+        error_reporter.enqueue.assert_called_once()
+
+    def test_dashboard_not_modified(self, client, monitoring_backends):
+        """Test a matching If-None-Match returns 304 from the cached snapshot."""
+        health_checker, _, _ = monitoring_backends
+
+        first = client.get("/v1/monitoring/dashboard")
+        etag = first.headers["etag"]
+        second = client.get("/v1/monitoring/dashboard", headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.headers["etag"] == etag
+        health_checker.get_overall_health.assert_awaited_once()
+
+
+class TestPerformanceEndpoint:
+    """Test cases for the performance summary endpoint."""
+
+    def test_performance_summary(self, client, monitoring_backends):
+        """Test performance summary returns the upstream summary fields."""
+        _, performance_monitor, _ = monitoring_backends
+
+        response = client.get("/v1/monitoring/performance?hours=12")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        data = response.json()
+        assert data["total_requests"] == 10
+        assert data["system_health"] == "good"
+        performance_monitor.get_performance_summary.assert_awaited_once_with(hours=12)
+
+
+class TestSystemMetricsEndpoint:
+    """Test cases for the system metrics endpoint."""
+
+    def test_system_metrics_reuses_recent_probe(self, client, monitoring_backends):
+        """Test back-to-back requests share one system metrics probe."""
+        _, performance_monitor, _ = monitoring_backends
+
+        first = client.get("/v1/monitoring/metrics/system")
+        second = client.get("/v1/monitoring/metrics/system")
+
+        assert first.status_code == 200
+        assert second.json() == first.json()
+        performance_monitor.get_system_metrics.assert_awaited_once()
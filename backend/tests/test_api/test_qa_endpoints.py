@@ -0,0 +1,358 @@
+"""
+Integration tests for Q&A API endpoints.
+
+Tests question answering and session history storage.
+"""
+
+import json
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+from fastapi import FastAPI, WebSocketDisconnect
+from fastapi.testclient import TestClient
+
+from app.api.v1.endpoints import qa
+
+
+@pytest.fixture
+def client():
+    """Test client serving only the Q&A router."""
+    test_app = FastAPI()
+    test_app.include_router(qa.router, prefix="/v1")
+    return TestClient(test_app)
+
+
+@pytest.fixture(autouse=True)
+def clear_history():
+    """Start every test with empty history and answer stores."""
+    qa.qa_history.clear()
+    qa._answer_cache.clear()
+    yield
+    qa.qa_history.clear()
+    qa._answer_cache.clear()
+
+
+class TestQAHistory:
+    """Test cases for Q&A session history."""
+
+    def test_new_session_returns_demo_history(self, client):
+        """Test a session without questions gets the demo history without storing it."""
+        response = client.get("/v1/qa/sessions/doc_1/history")
+
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["history"]] == ["qa_1", "qa_2"]
+        assert qa.qa_history == {}
+
+    def test_ask_records_history(self, client):
+        """Test an asked question is returned by the session history."""
+        client.post("/v1/qa/ask", json={"question": "Any liability clauses?", "document_id": "doc_1"})
+
+        response = client.get("/v1/qa/sessions/doc_1/history")
+
+        history = response.json()["history"]
+        assert len(history) == 1
+        assert history[0]["question"] == "Any liability clauses?"
+        assert datetime.strptime(history[0]["timestamp"], "%Y-%m-%dT%H:%M:%SZ")
+
+    def test_clear_history(self, client):
+        """Test clearing a session removes its stored history."""
+        client.post("/v1/qa/ask", json={"question": "What are the fees?", "document_id": "doc_1"})
+
+        response = client.delete("/v1/qa/sessions/doc_1/history")
+
+        assert response.status_code == 200
+        assert qa.qa_history == {}
+
+    def test_session_history_keeps_latest_items(self, client):
+        """Test a session keeps only its most recent items once the cap is reached."""
+        with patch.object(qa, "MAX_QA_HISTORY_ITEMS", 2):
+            for question in ("Rights?", "Fees?", "Breach?"):
+                client.post("/v1/qa/ask", json={"question": question, "document_id": "doc_1"})
+
+        response = client.get("/v1/qa/sessions/doc_1/history")
+
+        assert [item["question"] for item in response.json()["history"]] == ["Fees?", "Breach?"]
+
+    def test_oldest_session_evicted_at_capacity(self, client):
+        """Test the least recently written session is evicted once the store is full."""
+        with patch.object(qa, "MAX_QA_SESSIONS", 2):
+            for document_id in ("doc_1", "doc_2", "doc_3"):
+                client.post("/v1/qa/ask", json={"question": "Termination?", "document_id": document_id})
+
+        assert list(qa.qa_history) == ["doc_2_default", "doc_3_default"]
+
+    def test_idle_session_expires(self, client):
+        """Test a session idle for longer than the TTL is dropped."""
+        client.post("/v1/qa/ask", json={"question": "Breach?", "document_id": "doc_1"})
+
+        with patch.object(qa, "QA_HISTORY_TTL", 0):
+            response = client.get("/v1/qa/sessions/doc_1/history")
+
+        assert [item["id"] for item in response.json()["history"]] == ["qa_1", "qa_2"]
+        assert qa.qa_history == {}
+
+    def test_history_pages_back_with_cursor(self, client):
+        """Test history returns the latest page and pages back with the before cursor."""
+        for question in ("Rights?", "Fees?", "Breach?"):
+            client.post("/v1/qa/ask", json={"question": question, "document_id": "doc_1"})
+
+        latest = client.get("/v1/qa/sessions/doc_1/history?limit=2").json()
+        oldest_id = latest["history"][0]["id"]
+        older = client.get(f"/v1/qa/sessions/doc_1/history?limit=2&before={oldest_id}").json()
+
+        assert [item["question"] for item in latest["history"]] == ["Fees?", "Breach?"]
+        assert latest["has_more"] is True
+        assert [item["question"] for item in older["history"]] == ["Rights?"]
+        assert older["has_more"] is False
+
+    def test_history_not_modified(self, client):
+        """Test a matching If-None-Match returns 304 until a new item is added."""
+        client.post("/v1/qa/ask", json={"question": "Rights?", "document_id": "doc_1"})
+
+        first = client.get("/v1/qa/sessions/doc_1/history")
+        etag = first.headers["etag"]
+        unchanged = client.get("/v1/qa/sessions/doc_1/history", headers={"If-None-Match": etag})
+        client.post("/v1/qa/ask", json={"question": "Fees?", "document_id": "doc_1"})
+        changed = client.get("/v1/qa/sessions/doc_1/history", headers={"If-None-Match": etag})
+
+        assert unchanged.status_code == 304
+        assert changed.status_code == 200
+        assert len(changed.json()["history"]) == 2
+
+    def test_ask_failure_returns_500(self, client):
+        """Test an unexpected error while answering is reported as a 500."""
+        with patch.object(qa, "generate_answer", side_effect=RuntimeError("model down")):
+            response = client.post("/v1/qa/ask", json={"question": "Fees?", "document_id": "doc_1"})
+
+        assert response.status_code == 500
+        assert response.json()["detail"] == "Failed to process question: model down"
+
+    def test_ask_rejects_unknown_fields(self, client):
+        """Test question requests with unknown fields are rejected."""
+        response = client.post(
+            "/v1/qa/ask",
+            json={"question": "Fees?", "document_id": "doc_1", "language": "en"}
+        )
+
+        assert response.status_code == 422
+        assert qa.qa_history == {}
+
+    def test_ask_stream_sends_answer_first(self, client):
+        """Test the streamed answer arrives as NDJSON with the answer line first."""
+        response = client.post(
+            "/v1/qa/ask-stream",
+            json={"question": "What are the key terms?", "document_id": "doc_1"}
+        )
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert [line["type"] for line in lines] == ["answer", "source", "source", "source", "done"]
+        assert lines[0]["answer"] == qa._KEY_TERMS_ANSWER["text"]
+        assert len(qa.qa_history["doc_1_default"]["items"]) == 1
+
+
+class TestAppQAHistory:
+    """Test cases for the app-level Q&A history route served by the full app."""
+
+    @pytest.fixture
+    def app_client(self, tmp_path, monkeypatch):
+        """Test client for the full app, storing Q&A files under a temporary directory."""
+        from app.main import app
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "uploads").mkdir()
+        return TestClient(app)
+
+    def test_history_pages_back_with_cursor(self, app_client):
+        """Test the live history route returns the latest page and pages back with the before cursor."""
+        for question in ("Rights?", "Fees?", "Breach?"):
+            app_client.post("/v1/qa/ask", json={"question": question, "document_id": "doc_1"})
+
+        latest = app_client.get("/v1/qa/sessions/doc_1/history?limit=2").json()
+        oldest_id = latest["history"][0]["id"]
+        older = app_client.get(f"/v1/qa/sessions/doc_1/history?limit=2&before={oldest_id}").json()
+
+        assert [item["question"] for item in latest["history"]] == ["Fees?", "Breach?"]
+        assert latest["has_more"] is True
+        assert [item["question"] for item in older["history"]] == ["Rights?"]
+        assert older["has_more"] is False
+
+    def test_history_not_modified(self, app_client):
+        """Test the live history route returns 304 for a matching If-None-Match until a new item is added."""
+        app_client.post("/v1/qa/ask", json={"question": "Rights?", "document_id": "doc_1"})
+
+        first = app_client.get("/v1/qa/sessions/doc_1/history")
+        etag = first.headers["etag"]
+        unchanged = app_client.get("/v1/qa/sessions/doc_1/history", headers={"If-None-Match": etag})
+        app_client.post("/v1/qa/ask", json={"question": "Fees?", "document_id": "doc_1"})
+        changed = app_client.get("/v1/qa/sessions/doc_1/history", headers={"If-None-Match": etag})
+
+        assert unchanged.status_code == 304
+        assert changed.status_code == 200
+        assert len(changed.json()["history"]) == 2
+
+
+class TestAppVoiceQuestion:
+    """Test cases for the app-level voice question route served by the full app."""
+
+    @pytest.fixture
+    def app_client(self, tmp_path, monkeypatch):
+        """Test client for the full app, storing Q&A files under a temporary directory."""
+        from app.main import app
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "uploads").mkdir()
+        return TestClient(app)
+
+    def test_ask_voice_question(self, app_client):
+        """Test an accepted voice question is answered."""
+        response = app_client.post(
+            "/v1/qa/ask-voice",
+            data={"document_id": "doc_1"},
+            files={"audio_file": ("question.webm", b"\x00" * 1024, "audio/webm;codecs=opus")}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["success"] is True
+
+    def test_oversized_audio_rejected(self, app_client):
+        """Test uploads over the audio size limit are rejected with 413 before parsing."""
+        from app.core.config import settings
+
+        with patch.object(settings, "MAX_AUDIO_BYTES", 16), \
+             patch("app.core.security.UPLOAD_OVERHEAD_BYTES", 0):
+            response = app_client.post(
+                "/v1/qa/ask-voice",
+                files={"audio_file": ("question.wav", b"\x00" * 1024, "audio/wav")}
+            )
+
+        assert response.status_code == 413
+
+    def test_unsupported_audio_type_rejected(self, app_client):
+        """Test uploads outside the audio type allowlist are rejected with 415."""
+        response = app_client.post(
+            "/v1/qa/ask-voice",
+            files={"audio_file": ("question.bin", b"\x00" * 1024, "audio/x-anything")}
+        )
+
+        assert response.status_code == 415
+
+    def test_missing_content_length_rejected(self, app_client):
+        """Test chunked uploads without a Content-Length are rejected before parsing."""
+        response = app_client.post(
+            "/v1/qa/ask-voice",
+            content=iter([b"--x\r\n"]),
+            headers={"content-type": "multipart/form-data; boundary=x"}
+        )
+
+        assert response.status_code == 411
+
+
+class TestAnswerCache:
+    """Test cases for cached answers."""
+
+    @pytest.mark.asyncio
+    async def test_confident_answer_cached_by_normalized_question(self):
+        """Test a confident answer is reused for the same normalized question."""
+        first = await qa.generate_answer("What are the KEY terms?", "doc_1")
+
+        with patch.object(qa, "_answer_from_keywords") as answer_from_keywords:
+            second = await qa.generate_answer("  what are the key   terms? ", "doc_1")
+
+        assert second is first
+        answer_from_keywords.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_low_confidence_answer_not_cached(self):
+        """Test answers below the confidence threshold are not cached."""
+        answer = await qa.generate_answer("Who signed this?", "doc_1")
+
+        assert answer["confidence"] < qa.ANSWER_CACHE_MIN_CONFIDENCE
+        assert qa._answer_cache == {}
+
+
+class TestVoiceQuestion:
+    """Test cases for voice questions."""
+
+    def test_ask_voice_question(self, client):
+        """Test a voice question is answered and recorded."""
+        response = client.post(
+            "/v1/qa/ask-voice?document_id=doc_1",
+            files={"audio_file": ("question.wav", b"\x00" * 1024, "audio/wav")}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["success"] is True
+        assert len(qa.qa_history["doc_1_default"]["items"]) == 1
+
+    def test_oversized_audio_rejected(self, client):
+        """Test uploads over the audio size limit are rejected with 413."""
+        with patch.object(qa, "MAX_AUDIO_BYTES", 16):
+            response = client.post(
+                "/v1/qa/ask-voice?document_id=doc_1",
+                files={"audio_file": ("question.wav", b"\x00" * 1024, "audio/wav")}
+            )
+
+        assert response.status_code == 413
+        assert qa.qa_history == {}
+
+    def test_unsupported_audio_type_rejected(self, client):
+        """Test uploads outside the audio type allowlist are rejected with 415."""
+        response = client.post(
+            "/v1/qa/ask-voice?document_id=doc_1",
+            files={"audio_file": ("question.bin", b"\x00" * 1024, "audio/x-anything")}
+        )
+
+        assert response.status_code == 415
+
+    def test_codec_parameter_accepted(self, client):
+        """Test MIME parameters such as the codec do not affect the allowlist check."""
+        response = client.post(
+            "/v1/qa/ask-voice?document_id=doc_1",
+            files={"audio_file": ("question.webm", b"\x00" * 1024, "audio/webm;codecs=opus")}
+        )
+
+        assert response.status_code == 200
+
+    def test_missing_content_length_rejected(self, client):
+        """Test chunked uploads without a Content-Length are rejected before parsing."""
+        response = client.post(
+            "/v1/qa/ask-voice?document_id=doc_1",
+            content=iter([b"--x\r\n"]),
+            headers={"content-type": "multipart/form-data; boundary=x"}
+        )
+
+        assert response.status_code == 411
+
+
+class TestVoiceQuestionStream:
+    """Test cases for streamed voice questions."""
+
+    def test_stream_answers_each_question(self, client):
+        """Test each question's frames produce a transcript and an answer."""
+        with client.websocket_connect("/v1/qa/ask-voice-stream/ws?document_id=doc_1") as websocket:
+            for _ in range(2):
+                websocket.send_bytes(b"\x00" * 512)
+                websocket.send_bytes(b"\x00" * 512)
+                websocket.send_text("end")
+
+                transcript = websocket.receive_json()
+                answer = websocket.receive_json()
+
+                assert transcript["type"] == "transcript"
+                assert answer["type"] == "answer"
+                assert answer["session_id"] == "default"
+
+        assert len(qa.qa_history["doc_1_default"]["items"]) == 2
+
+    def test_stream_closes_on_oversized_question(self, client):
+        """Test a question over the audio size limit closes the connection."""
+        with patch.object(qa, "MAX_AUDIO_BYTES", 16):
+            with client.websocket_connect("/v1/qa/ask-voice-stream/ws?document_id=doc_1") as websocket:
+                websocket.send_bytes(b"\x00" * 1024)
+
+                with pytest.raises(WebSocketDisconnect) as exc_info:
+                    websocket.receive_json()
+
+        assert exc_info.value.code == 1009
+        assert qa.qa_history == {}
@@ -590,5 +590,63 @@ class TestMonitoringLoop:
         monitoring_service.report_error.assert_called()
 
 
+
+class TestErrorReporterQueue:
+    """Test queued error reporting in the monitoring error reporter."""
+
+    @pytest.fixture
+    def error_reporter(self):
+        """Create ErrorReporter with mocked Cloud clients."""
+        from app.monitoring import error_reporting
+
+        with patch.object(error_reporting, "error_reporting"), \
+             patch.object(error_reporting, "logging"):
+            reporter = error_reporting.ErrorReporter()
+        reporter._record_error_metrics = AsyncMock()
+        return reporter
+
+    @pytest.mark.asyncio
+    async def test_enqueue_publishes_in_background(self, error_reporter, sample_error):
+        """Test enqueue records immediately and publishes on the drain task."""
+        error_id = error_reporter.enqueue(error=sample_error, context={"endpoint": "/test"})
+
+        assert error_id.startswith("error_")
+        assert len(error_reporter._error_history) == 1
+        error_reporter.error_client.report_exception.assert_not_called()
+
+        await error_reporter.stop_reporting()
+
+        error_reporter.error_client.report_exception.assert_called_once()
+        error_reporter.logger.batch.assert_called_once()
+        error_reporter._record_error_metrics.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_enqueue_drops_oldest_when_full(self, error_reporter, sample_error):
+        """Test a full queue drops the oldest pending report."""
+        from app.monitoring import error_reporting
+
+        with patch.object(error_reporting, "MAX_QUEUED_ERRORS", 2):
+            for attempt in range(3):
+                error_reporter.enqueue(error=sample_error, context={"attempt": attempt})
+
+        pending = [error_reporter._queue.get_nowait() for _ in range(error_reporter._queue.qsize())]
+        assert [report.context["attempt"] for report in pending] == [1, 2]
+
+        await error_reporter.stop_reporting()
+
+    @pytest.mark.asyncio
+    async def test_lifespan_starts_and_flushes_reporter(self, error_reporter, sample_error):
+        """Test the app lifespan starts the drain task and publishes pending reports on exit."""
+        from fastapi import FastAPI
+        from app.monitoring import error_reporting
+
+        with patch.object(error_reporting, "error_reporter", error_reporter):
+            async with error_reporting.error_report_publishing(FastAPI()):
+                assert not error_reporter._drain_task.done()
+                error_reporter.enqueue(error=sample_error)
+
+        assert error_reporter._drain_task is None
+        error_reporter.error_client.report_exception.assert_called_once()
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -109,6 +109,61 @@ class TestPIIDetectionService:
             
             assert len(findings) == 1
 
+    @pytest.mark.asyncio
+    async def test_detect_pii_reuses_inspect_config(self, service, sample_content, mock_dlp_response):
+        """Test repeated detections share one prebuilt inspect config."""
+        with patch.object(service.dlp_client, 'inspect_content', return_value=mock_dlp_response) as mock_inspect:
+            await service.detect_pii(sample_content, info_types=["EMAIL_ADDRESS"])
+            await service.detect_pii(sample_content, info_types=["EMAIL_ADDRESS"])
+            
+            first_config = mock_inspect.call_args_list[0].kwargs["request"]["inspect_config"]
+            second_config = mock_inspect.call_args_list[1].kwargs["request"]["inspect_config"]
+            assert first_config is second_config
+            assert first_config["info_types"] == [{"name": "EMAIL_ADDRESS"}]
+
+    @pytest.mark.asyncio
+    async def test_detect_pii_prefilters_info_types(self, service, mock_dlp_response):
+        """Test info types without their trigger characters are not sent to DLP."""
+        with patch.object(service.dlp_client, 'inspect_content', return_value=mock_dlp_response) as mock_inspect:
+            await service.detect_pii(
+                "Contact Jane Smith at the main office",
+                info_types=[PIIType.PERSON_NAME, PIIType.EMAIL_ADDRESS, PIIType.SSN]
+            )
+            
+            inspect_config = mock_inspect.call_args.kwargs["request"]["inspect_config"]
+            assert inspect_config["info_types"] == [{"name": PIIType.PERSON_NAME}]
+
+    @pytest.mark.asyncio
+    async def test_detect_pii_skips_dlp_without_candidates(self, service):
+        """Test DLP is not called when no requested info type can match."""
+        with patch.object(service.dlp_client, 'inspect_content') as mock_inspect:
+            findings = await service.detect_pii("No numbers here", info_types=["US_SOCIAL_SECURITY_NUMBER"])
+            
+            assert findings == []
+            mock_inspect.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_detect_pii_stream_offsets_across_windows(self, service):
+        """Test streamed detection reports whole-text offsets once per finding."""
+        from app.services import pii_detection
+        
+        async def fake_detect(content, info_types=None, min_likelihood="POSSIBLE", **kwargs):
+            return [
+                PIIFinding("US_SOCIAL_SECURITY_NUMBER", "LIKELY", index, index + 11, content[index:index + 11])
+                for index in range(len(content)) if content.startswith("123-45-6789", index)
+            ]
+        
+        async def chunks():
+            for text in ("aaaaaaaaaaaaaaaaa123-", "45-6789bbbbbbbbbbbbbb", "bb123-45-6789"):
+                yield text
+        
+        with patch.object(pii_detection, "STREAM_WINDOW_CHARS", 24), \
+             patch.object(pii_detection, "STREAM_WINDOW_OVERLAP", 12), \
+             patch.object(service, "detect_pii", side_effect=fake_detect):
+            findings = await service.detect_pii_stream(chunks())
+        
+        assert [(f.start_offset, f.end_offset) for f in findings] == [(17, 28), (44, 55)]
+
     @pytest.mark.asyncio
     async def test_detect_pii_api_error(self, service, sample_content):
         """Test PII detection with API error."""
@@ -201,17 +256,54 @@ class TestPIIDetectionService:
         assert "[PHONE]" in masked_content
         assert "john.doe@example.com" not in masked_content
 
+    @pytest.mark.asyncio
+    async def test_mask_pii_overlapping_findings(self, service):
+        """Test overlapping findings are masked once without leaking either span."""
+        content = "Card 4532123456789012 and ID ABC123"
+        findings = [
+            PIIFinding(
+                info_type=PIIType.BANK_ACCOUNT,
+                likelihood="POSSIBLE",
+                start_offset=9,
+                end_offset=21,
+                original_text="123456789012",
+                confidence=0.5
+            ),
+            PIIFinding(
+                info_type=PIIType.CREDIT_CARD,
+                likelihood="VERY_LIKELY",
+                start_offset=5,
+                end_offset=21,
+                original_text="4532123456789012",
+                confidence=0.9
+            ),
+            PIIFinding(
+                info_type=PIIType.PASSPORT,
+                likelihood="LIKELY",
+                start_offset=29,
+                end_offset=35,
+                original_text="ABC123",
+                confidence=0.8
+            )
+        ]
+
+        masked_content, updated_findings = await service.mask_pii(content, findings)
+
+        assert masked_content == "Card " + "*" * 16 + " and ID ******"
+        assert [f.start_offset for f in updated_findings] == [5, 9, 29]
+
     @pytest.mark.asyncio
     async def test_detect_and_mask_pii(self, service, sample_content, mock_dlp_response):
         """Test combined detect and mask operation."""
         with patch.object(service.dlp_client, 'inspect_content', return_value=mock_dlp_response):
-            masked_content, findings = await service.detect_and_mask_pii(
+            masked_content, findings, validation = await service.detect_and_mask_pii(
                 content=sample_content,
                 masking_config={PIIType.EMAIL_ADDRESS: MaskingType.MASK}
             )
             
             assert len(findings) == 1
             assert "john.doe@example.com" not in masked_content
+            assert validation["coverage"] == 1.0
             assert "*" in masked_content
 
     @pytest.mark.asyncio
@@ -365,6 +457,65 @@ class TestPIIDetectionService:
         assert result["confidence"] == 0.9
         assert result["masking_type"] == MaskingType.REPLACE
 
+    def test_pii_finding_json_matches_to_dict(self):
+        """Test findings serialize directly to the same JSON object as to_dict."""
+        import orjson
+        
+        finding = PIIFinding(
+            info_type=PIIType.SSN,
+            likelihood="LIKELY",
+            start_offset=4,
+            end_offset=15,
+            original_text="123-45-6789",
+            confidence=0.7
+        )
+        finding.masking_type = MaskingType.PARTIAL
+        
+        assert orjson.loads(orjson.dumps(finding)) == orjson.loads(orjson.dumps(finding.to_dict()))
+
+
+class TestPIIAuditQueue:
+    """Test batched PII audit logging."""
+    
+    @pytest.fixture
+    def service(self):
+        """Create PII detection service with a mocked audit writer."""
+        service = PIIDetectionService()
+        service.firestore_service = Mock(
+            create_pii_audit_logs=AsyncMock(side_effect=lambda entries: [f"audit_{i}" for i in range(len(entries))])
+        )
+        return service
+
+    @pytest.mark.asyncio
+    async def test_enqueued_entries_written_in_one_batch(self, service):
+        """Test queued audit entries are written together in the background."""
+        service.enqueue_pii_audit(user_id="user_1", document_id="doc_1", action="detect", findings=[])
+        service.enqueue_pii_audit(user_id="user_1", document_id="doc_2", action="mask", findings=[])
+        
+        service.firestore_service.create_pii_audit_logs.assert_not_called()
+        
+        await service.stop_audit_logging()
+        
+        service.firestore_service.create_pii_audit_logs.assert_awaited_once()
+        entries = service.firestore_service.create_pii_audit_logs.call_args.args[0]
+        assert [entry["document_id"] for entry in entries] == ["doc_1", "doc_2"]
+        assert entries[1]["action"] == "mask"
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest_entry(self, service):
+        """Test a full audit queue drops and counts the oldest pending entry."""
+        from app.services import pii_detection
+        
+        with patch.object(pii_detection, "MAX_QUEUED_AUDIT_ENTRIES", 2):
+            for document_id in ("doc_1", "doc_2", "doc_3"):
+                service.enqueue_pii_audit(user_id="user_1", document_id=document_id, action="detect", findings=[])
+        
+        await service.stop_audit_logging()
+        
+        assert service.dropped_audit_entries == 1
+        entries = service.firestore_service.create_pii_audit_logs.call_args.args[0]
+        assert [entry["document_id"] for entry in entries] == ["doc_2", "doc_3"]
+
 
 class TestPIIDetectionIntegration:
     """Integration tests for PII detection service."""
@@ -0,0 +1,211 @@
+"""
+Unit tests for the Q&A Service.
+
+Tests the semantic answer cache and history search by question similarity.
+The Vertex AI and speech client libraries are stubbed, so no Google Cloud
+access is needed.
+"""
+
+import sys
+import pytest
+import numpy as np
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+_STUBBED_MODULES = [
+    "google.cloud.aiplatform",
+    "google.cloud.speech",
+    "google.cloud.texttospeech",
+    "vertexai",
+    "vertexai.generative_models",
+    "vertexai.language_models",
+    "librosa",
+    "soundfile",
+]
+
+with patch.dict(sys.modules, {name: MagicMock() for name in _STUBBED_MODULES}):
+    from app.services import qa_service as qa_module
+
+
+def unit(*values):
+    """Return the normalized float32 vector for the given components."""
+    vector = np.asarray(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def make_response(answer="The term is 12 months."):
+    """Build a cacheable Q&A response."""
+    return qa_module.QAResponse(
+        question="How long is the term?",
+        answer=answer,
+        confidence=0.9,
+        sources=[],
+        processing_time=0.1,
+    )
+
+
+@pytest.fixture
+def service():
+    """Q&A service with an empty answer cache and no Vertex clients."""
+    service = qa_module.QAService.__new__(qa_module.QAService)
+    service.active_contexts = {}
+    service.answer_cache = {}
+    return service
+
+
+class TestSemanticAnswerCache:
+    """Test cases for the per-document semantic answer cache."""
+
+    def test_similar_question_hits_cache(self, service):
+        """Test that a near-identical question reuses the cached answer."""
+        response = make_response()
+        service._cache_answer("doc-1", unit(1, 0, 0), response)
+
+        assert service._lookup_cached_answer("doc-1", unit(1, 0.01, 0)) is response
+
+    def test_dissimilar_question_misses_cache(self, service):
+        """Test that a question below the similarity threshold is not answered from cache."""
+        service._cache_answer("doc-1", unit(1, 0, 0), make_response())
+
+        assert service._lookup_cached_answer("doc-1", unit(0, 1, 0)) is None
+        assert service._lookup_cached_answer("doc-2", unit(1, 0, 0)) is None
+
+    def test_expired_answer_is_not_returned(self, service):
+        """Test that answers older than the TTL are ignored."""
+        with patch.object(qa_module.time, "monotonic", return_value=1000.0):
+            service._cache_answer("doc-1", unit(1, 0, 0), make_response())
+
+        expired = 1000.0 + qa_module.SEMANTIC_CACHE_TTL
+        with patch.object(qa_module.time, "monotonic", return_value=expired - 1):
+            assert service._lookup_cached_answer("doc-1", unit(1, 0, 0)) is not None
+        with patch.object(qa_module.time, "monotonic", return_value=expired):
+            assert service._lookup_cached_answer("doc-1", unit(1, 0, 0)) is None
+
+    def test_expired_answers_are_dropped_on_insert(self, service):
+        """Test that caching a new answer discards expired entries."""
+        with patch.object(qa_module.time, "monotonic", return_value=1000.0):
+            service._cache_answer("doc-1", unit(1, 0, 0), make_response("old"))
+
+        later = 1000.0 + qa_module.SEMANTIC_CACHE_TTL
+        with patch.object(qa_module.time, "monotonic", return_value=later):
+            service._cache_answer("doc-1", unit(0, 1, 0), make_response("new"))
+
+        cache = service.answer_cache["doc-1"]
+        assert [response.answer for response in cache.responses] == ["new"]
+        assert cache.vectors.shape == (1, 3)
+
+    def test_entries_per_document_are_capped(self, service):
+        """Test that a document keeps at most the newest SEMANTIC_CACHE_MAX_ENTRIES answers."""
+        limit = qa_module.SEMANTIC_CACHE_MAX_ENTRIES
+        for index in range(limit + 2):
+            service._cache_answer("doc-1", unit(index + 1, 1), make_response(str(index)))
+
+        cache = service.answer_cache["doc-1"]
+        assert len(cache.responses) == limit
+        assert len(cache.created_at) == limit
+        assert cache.vectors.shape == (limit, 2)
+        assert cache.responses[0].answer == "2"
+        assert cache.responses[-1].answer == str(limit + 1)
+
+    def test_least_recently_used_document_is_evicted(self, service):
+        """Test that the least recently used document is evicted past the document limit."""
+        with patch.object(qa_module, "SEMANTIC_CACHE_MAX_DOCUMENTS", 2):
+            service._cache_answer("doc-1", unit(1, 0), make_response())
+            service._cache_answer("doc-2", unit(1, 0), make_response())
+
+            # A cache hit marks doc-1 as recently used, so doc-2 is evicted next
+            assert service._lookup_cached_answer("doc-1", unit(1, 0)) is not None
+            service._cache_answer("doc-3", unit(1, 0), make_response())
+
+        assert list(service.answer_cache) == ["doc-1", "doc-3"]
+
+    def test_dimension_mismatch_is_a_miss(self, service):
+        """Test that a question embedding of another dimension does not match."""
+        service._cache_answer("doc-1", unit(1, 0, 0), make_response())
+
+        assert service._lookup_cached_answer("doc-1", unit(1, 0)) is None
+
+    def test_dimension_change_replaces_document_cache(self, service):
+        """Test that caching an answer of a new dimension starts a fresh cache."""
+        service._cache_answer("doc-1", unit(1, 0, 0), make_response("old"))
+        service._cache_answer("doc-1", unit(1, 0), make_response("new"))
+
+        cache = service.answer_cache["doc-1"]
+        assert cache.vectors.shape == (1, 2)
+        assert [response.answer for response in cache.responses] == ["new"]
+
+    def test_unusable_embedding_is_not_cached(self, service):
+        """Test that empty and zero embeddings are neither cached nor looked up."""
+        assert service._normalize_embedding([]) is None
+        assert service._normalize_embedding([0.0, 0.0]) is None
+
+        service._cache_answer("doc-1", None, make_response())
+
+        assert service.answer_cache == {}
+        assert service._lookup_cached_answer("doc-1", None) is None
+
+
+class TestHistorySearch:
+    """Test cases for searching session history by question similarity."""
+
+    @pytest.fixture
+    def context(self):
+        """Q&A context with three embedded interactions and one without an embedding."""
+        context = qa_module.QAContext("doc-1", "user-1", "session-1")
+        context.add_interaction("What is the rent?", "$1,000", question_vector=unit(1, 0, 0))
+        context.add_interaction("When can I terminate?", "With 30 days notice", question_vector=unit(0, 1, 0))
+        context.add_interaction("Who pays repairs?", "The landlord")
+        context.add_interaction("Is the rent due monthly?", "Yes", question_vector=unit(1, 0.2, 0))
+        return context
+
+    def test_search_returns_closest_interactions_oldest_first(self, context):
+        """Test that the closest questions are returned in conversation order."""
+        results = context.search_interactions(unit(1, 0, 0), limit=2)
+
+        assert [item["question"] for item in results] == [
+            "What is the rent?",
+            "Is the rent due monthly?",
+        ]
+
+    def test_search_skips_vectors_of_other_dimensions(self, context):
+        """Test that embeddings of a different dimension are ignored."""
+        assert context.search_interactions(unit(1, 0), limit=2) == []
+
+    @pytest.mark.asyncio
+    async def test_session_history_with_query(self, service, context):
+        """Test that a query returns the most similar interactions."""
+        service.active_contexts["user-1_doc-1_session-1"] = context
+        service._generate_embedding = AsyncMock(return_value=[0.0, 2.0, 0.0])
+
+        results = await service.get_session_history(
+            "doc-1", "user-1", "session-1", limit=1, query="termination notice"
+        )
+
+        assert [item["question"] for item in results] == ["When can I terminate?"]
+        service._generate_embedding.assert_awaited_once_with("termination notice")
+
+    @pytest.mark.asyncio
+    async def test_session_history_falls_back_without_embedding(self, service, context):
+        """Test that the latest items are returned when the query cannot be embedded."""
+        service.active_contexts["user-1_doc-1_session-1"] = context
+        service._generate_embedding = AsyncMock(return_value=[])
+
+        results = await service.get_session_history(
+            "doc-1", "user-1", "session-1", limit=2, query="termination notice"
+        )
+
+        assert [item["question"] for item in results] == [
+            "Who pays repairs?",
+            "Is the rent due monthly?",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_session_history_without_query(self, service, context):
+        """Test that history without a query is not embedded."""
+        service.active_contexts["user-1_doc-1_session-1"] = context
+        service._generate_embedding = AsyncMock()
+
+        results = await service.get_session_history("doc-1", "user-1", "session-1", limit=1)
+
+        assert [item["question"] for item in results] == ["Is the rent due monthly?"]
+        service._generate_embedding.assert_not_called()